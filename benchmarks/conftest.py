@@ -0,0 +1,81 @@
+"""Fixtures for the benchmark suite."""
+
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def job_posting_text():
+    """A typical pasted job posting."""
+    return (FIXTURES_DIR / "job_posting.txt").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def large_job_posting_text(job_posting_text):
+    """A ~200KB posting, as pasted from a page with its surrounding chrome."""
+    return job_posting_text * (200_000 // len(job_posting_text))
+
+
+@pytest.fixture(scope="session")
+def cv_text():
+    """A typical one-page CV."""
+    return (FIXTURES_DIR / "cv.txt").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def linkedin_html():
+    """A saved LinkedIn job page."""
+    return (FIXTURES_DIR / "linkedin_job.html").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def generic_html():
+    """A saved careers-site job page."""
+    return (FIXTURES_DIR / "generic_job.html").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def indeed_html():
+    """A saved Indeed job page."""
+    return (FIXTURES_DIR / "indeed_job.html").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def jsonld_html():
+    """The careers-site job page with a schema.org JobPosting in JSON-LD."""
+    return (FIXTURES_DIR / "jsonld_job.html").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def pdf_cv(tmp_path_factory, cv_text, write_pdf):
+    """A two-page PDF CV."""
+    lines = [line.replace("(", "").replace(")", "") for line in cv_text.splitlines() if line]
+    half = len(lines) // 2
+    return write_pdf(
+        tmp_path_factory.mktemp("pdf") / "cv.pdf",
+        [" ".join(lines[:half]), " ".join(lines[half:])],
+    )
+
+
+@pytest.fixture(scope="session")
+def long_pdf(tmp_path_factory, write_pdf):
+    """A 60-page PDF, long enough for page-parallel extraction."""
+    return write_pdf(
+        tmp_path_factory.mktemp("pdf") / "long.pdf",
+        [f"Page {i} Python Kubernetes PostgreSQL experience" for i in range(60)],
+    )
+
+
+@pytest.fixture(scope="session")
+def docx_cv(tmp_path_factory, cv_text):
+    """A DOCX CV with one paragraph per line."""
+    docx = pytest.importorskip("docx")
+    document = docx.Document()
+    for line in cv_text.splitlines():
+        document.add_paragraph(line)
+    path = tmp_path_factory.mktemp("docx") / "cv.docx"
+    document.save(str(path))
+    return path
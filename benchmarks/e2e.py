@@ -0,0 +1,260 @@
+"""End-to-end latency benchmark of the agent pipelines against a fake Ollama.
+
+Drives ``JobApplicationAgent.process_application`` and
+``InterviewPreparationAgent.prepare_for_interview`` through the real
+LangChain/Ollama client stack, talking to ``fake_ollama.FakeOllamaServer``
+over HTTP, at each requested concurrency level. For each level it reports
+p50/p95 latency, throughput and the framework overhead: latency beyond
+the model time on the workflow's critical path, which is measured once
+per workflow from an isolated run.
+
+    python benchmarks/e2e.py --concurrency 1,4,16 --runs 32 --ttft 0.2 --token-latency 0.02
+
+With ``--nodes`` several fake servers are started and the assistant
+balances requests across them; combine with ``--num-parallel`` to see
+throughput scale with the number of nodes.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_ollama import FakeOllamaConfig, FakeOllamaServer, model_busy_seconds  # noqa: E402
+
+WORKFLOWS = ("application", "application+analysis", "interview")
+
+
+@dataclass
+class LevelResult:
+    """Measurements for one workflow at one concurrency level."""
+
+    workflow: str
+    concurrency: int
+    runs: int
+    failures: int
+    p50: float
+    p95: float
+    throughput: float  # successful runs per second
+    model_seconds: float  # model time on the critical path of one run
+    overhead_p50: float
+    overhead_p95: float
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def build_workflows() -> Dict[str, Callable[[], Awaitable[Dict[str, Any]]]]:
+    """Create the agents and sample inputs once; return one coroutine factory per workflow."""
+    from job_application_assistant.agents.interview_prep_agent import InterviewPreparationAgent
+    from job_application_assistant.agents.job_application_agent import JobApplicationAgent
+    from job_application_assistant.models.data_models import (
+        JobDescription,
+        UserPreferences,
+        UserProfile,
+    )
+
+    job = JobDescription(
+        title="Senior Python Developer",
+        company="Tech Innovations Inc.",
+        requirements=["5+ years Python experience", "Experience with FastAPI or Django"],
+        description="We are looking for a senior Python developer to join our team.",
+        location="Remote",
+    )
+    profile = UserProfile(
+        name="Jane Doe",
+        email="jane.doe@example.com",
+        skills=["Python", "Django", "PostgreSQL", "AWS", "Docker"],
+        cv_text="Experienced Python developer with 6+ years of experience.",
+        experience=[],
+    )
+    preferences = UserPreferences(
+        job_interest_level=9,
+        motivation="I enjoy building reliable backend systems.",
+        relevant_experience="Six years of Python on AWS.",
+        career_goals="Grow into a staff engineer.",
+        company_knowledge="Admire the team's open source work.",
+    )
+
+    application_agent = JobApplicationAgent(use_cache=False)
+    interview_agent = InterviewPreparationAgent(use_cache=False)
+    return {
+        "application": lambda: application_agent.process_application(job, profile, preferences),
+        "application+analysis": lambda: application_agent.process_application(
+            job, profile, preferences, use_analysis=True
+        ),
+        "interview": lambda: interview_agent.prepare_for_interview(job, profile),
+    }
+
+
+class MultiServerRecords:
+    """Request records of several fake servers, viewed as one."""
+
+    def __init__(self, servers: List[FakeOllamaServer]):
+        self.servers = servers
+
+    def records_between(self, start: float, end: float) -> list:
+        return [r for s in self.servers for r in s.records_between(start, end)]
+
+
+async def timed_run(run: Callable[[], Awaitable[Dict[str, Any]]]) -> tuple:
+    started = time.perf_counter()
+    try:
+        result = await run()
+        ok = not result.get("error")
+    except Exception:
+        ok = False
+    return ok, started, time.perf_counter() - started
+
+
+async def benchmark_workflow(
+    server: "FakeOllamaServer | MultiServerRecords",
+    name: str,
+    run: Callable[[], Awaitable[Dict[str, Any]]],
+    levels: List[int],
+    runs: int,
+) -> List[LevelResult]:
+    # Warm up connections, then measure the model critical path in isolation
+    await timed_run(run)
+    ok, started, latency = await timed_run(run)
+    model_seconds = model_busy_seconds(server.records_between(started, started + latency))
+
+    results = []
+    for concurrency in levels:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded() -> tuple:
+            async with semaphore:
+                return await timed_run(run)
+
+        wall_started = time.perf_counter()
+        outcomes = await asyncio.gather(*(bounded() for _ in range(runs)))
+        wall = time.perf_counter() - wall_started
+
+        latencies = [latency for ok, _, latency in outcomes if ok]
+        overheads = [latency - model_seconds for latency in latencies]
+        results.append(LevelResult(
+            workflow=name,
+            concurrency=concurrency,
+            runs=runs,
+            failures=runs - len(latencies),
+            p50=percentile(latencies, 0.5),
+            p95=percentile(latencies, 0.95),
+            throughput=len(latencies) / wall,
+            model_seconds=model_seconds,
+            overhead_p50=percentile(overheads, 0.5),
+            overhead_p95=percentile(overheads, 0.95),
+        ))
+    return results
+
+
+def print_report(results: List[LevelResult], config: FakeOllamaConfig, nodes: int = 1) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(
+        title=(
+            f"Pipeline latency ({nodes} node{'s' if nodes > 1 else ''}, "
+            f"ttft {config.ttft * 1000:.0f}ms, "
+            f"{config.token_latency * 1000:.1f}ms/token, {config.response_tokens} tokens, "
+            f"{config.failure_rate:.0%} failures)"
+        )
+    )
+    for column in ("Workflow", "Concurrency", "OK", "p50 (s)", "p95 (s)",
+                   "Runs/s", "Model (s)", "Overhead p50 (ms)", "Overhead p95 (ms)"):
+        table.add_column(column, justify="left" if column == "Workflow" else "right")
+    for r in results:
+        table.add_row(
+            r.workflow, str(r.concurrency), f"{r.runs - r.failures}/{r.runs}",
+            f"{r.p50:.3f}", f"{r.p95:.3f}", f"{r.throughput:.2f}", f"{r.model_seconds:.3f}",
+            f"{r.overhead_p50 * 1000:.1f}", f"{r.overhead_p95 * 1000:.1f}",
+        )
+    Console().print(table)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--concurrency", default="1,4,16", help="Comma-separated concurrency levels")
+    parser.add_argument("--runs", type=int, default=16, help="Workflow runs per level")
+    parser.add_argument("--workflows", default=",".join(WORKFLOWS), help="Comma-separated subset of " + ", ".join(WORKFLOWS))
+    parser.add_argument("--ttft", type=float, default=0.1, help="Seconds before the first token")
+    parser.add_argument("--token-latency", type=float, default=0.01, help="Seconds per token")
+    parser.add_argument("--tokens", type=int, default=100, help="Tokens per response")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of failed model requests")
+    parser.add_argument("--nodes", type=int, default=1, help="Fake Ollama servers to balance across")
+    parser.add_argument("--num-parallel", type=int, help="Concurrent generations per server")
+    parser.add_argument("--load-seconds", type=float, default=0.0, help="Seconds to load a model on first use")
+    parser.add_argument("--requests-per-minute", type=int, default=100000, help="Override Settings.max_requests_per_minute")
+    parser.add_argument("--llm-max-concurrency", type=int, help="Override Settings.llm_max_concurrency")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(",")]
+    workflows = [name.strip() for name in args.workflows.split(",")]
+    unknown = set(workflows) - set(WORKFLOWS)
+    if unknown:
+        parser.error(f"unknown workflows: {', '.join(sorted(unknown))}")
+
+    config = FakeOllamaConfig(
+        ttft=args.ttft,
+        token_latency=args.token_latency,
+        response_tokens=args.tokens,
+        failure_rate=args.failure_rate,
+        load_seconds=args.load_seconds,
+        num_parallel=args.num_parallel,
+        seed=args.seed,
+    )
+
+    servers = [FakeOllamaServer(config).start() for _ in range(args.nodes)]
+    server = MultiServerRecords(servers)
+    with tempfile.TemporaryDirectory() as data_dir:
+        # Settings are read from the environment when the package first loads them
+        os.environ.update({
+            "JOB_ASSISTANT_OLLAMA_BASE_URL": servers[0].url,
+            "JOB_ASSISTANT_OLLAMA_ENDPOINTS": json.dumps([s.url for s in servers[1:]]),
+            "JOB_ASSISTANT_DATA_DIR": data_dir,
+            "JOB_ASSISTANT_LOGS_DIR": str(Path(data_dir) / "logs"),
+            "JOB_ASSISTANT_CACHE_DIR": str(Path(data_dir) / "cache"),
+            "JOB_ASSISTANT_LOG_LEVEL": "WARNING",
+            "JOB_ASSISTANT_MAX_REQUESTS_PER_MINUTE": str(args.requests_per_minute),
+        })
+        if args.llm_max_concurrency:
+            os.environ["JOB_ASSISTANT_LLM_MAX_CONCURRENCY"] = str(args.llm_max_concurrency)
+
+        async def run_all() -> List[LevelResult]:
+            factories = build_workflows()
+            results = []
+            for name in workflows:
+                results.extend(
+                    await benchmark_workflow(server, name, factories[name], levels, args.runs)
+                )
+            return results
+
+        try:
+            results = asyncio.run(run_all())
+        finally:
+            for s in servers:
+                s.stop()
+
+    print_report(results, config, nodes=args.nodes)
+    if args.json:
+        args.json.write_text(json.dumps([asdict(r) for r in results], indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,448 @@
+"""A stand-in Ollama server for benchmarking without a GPU.
+
+Serves the endpoints the assistant uses (``/api/tags``, ``/api/show``,
+``/api/chat`` and ``/api/generate``) with simulated generation timing:
+a time to first token, then a fixed delay per streamed token. Like a
+real node, it can load a model on first use, unload it after its
+``keep_alive``, cap parallel generations, and charge prompt prefill per
+token except for a prefix already in one of the model's KV cache slots.
+Requests can be failed at random, and prompts can be mapped to canned
+responses.
+Every generation request is recorded with its server-side timing, so
+callers can separate model time from their own overhead.
+
+Run standalone to point the CLI or web app at it::
+
+    python benchmarks/fake_ollama.py --port 11435 --ttft 0.3 --token-latency 0.03
+    JOB_ASSISTANT_OLLAMA_BASE_URL=http://127.0.0.1:11435 job-assistant apply
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_MODELS = ["llama3.1:8b", "gemma2:9b", "qwen2.5:7b"]
+
+# Filler vocabulary for generated responses
+_WORDS = (
+    "experience team build systems python design impact deliver product "
+    "engineering scale customers reliable data platform growth lead"
+).split()
+
+
+@dataclass
+class FakeOllamaConfig:
+    """Timing and behaviour of the fake server."""
+
+    models: List[str] = field(default_factory=lambda: list(DEFAULT_MODELS))
+    ttft: float = 0.05  # seconds before the first token
+    token_latency: float = 0.005  # seconds between tokens
+    response_tokens: int = 200  # length of generated filler responses
+    failure_rate: float = 0.0  # fraction of generation requests answered with 500
+    load_seconds: float = 0.0  # delay the first request to each model pays
+    num_parallel: Optional[int] = None  # concurrent generations, like OLLAMA_NUM_PARALLEL
+    prefill_per_token: float = 0.0  # seconds per prompt token not in the KV cache
+    cache_slots: int = 4  # cached prompts kept per loaded model
+    keep_alive: float = 300.0  # seconds a model stays loaded unless the request says otherwise
+    responses: Dict[str, str] = field(default_factory=dict)  # prompt substring -> response
+    seed: Optional[int] = None
+
+
+@dataclass
+class RequestRecord:
+    """Server-side timing of one generation request."""
+
+    path: str
+    model: str
+    started: float  # time.perf_counter() values
+    finished: float
+    tokens: int
+    failed: bool = False
+    prompt_tokens: int = 0
+    cached_tokens: int = 0  # prompt tokens served from the KV cache
+    prefill_seconds: float = 0.0
+
+    @property
+    def seconds(self) -> float:
+        return self.finished - self.started
+
+
+class FakeOllamaServer:
+    """Threaded fake Ollama server, usable as a context manager."""
+
+    def __init__(
+        self,
+        config: Optional[FakeOllamaConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.config = config or FakeOllamaConfig()
+        self.records: List[RequestRecord] = []
+        self.loaded: List[str] = []
+        self._expires: Dict[str, float] = {}  # model -> time.monotonic() it unloads
+        self._prompt_cache: Dict[str, List[List[str]]] = {}  # model -> cached prompts, newest first
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._slots = (
+            threading.Semaphore(self.config.num_parallel) if self.config.num_parallel else None
+        )
+        self._random = random.Random(self.config.seed)
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeOllamaServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeOllamaServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.config.failure_rate
+
+    def record(self, record: RequestRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def records_between(self, start: float, end: float) -> List[RequestRecord]:
+        """Generation requests that started within a time window."""
+        with self._lock:
+            return [r for r in self.records if start <= r.started <= end]
+
+    def _unload_expired(self) -> None:
+        now = time.monotonic()
+        for model in [m for m in self.loaded if self._expires.get(m, float("inf")) <= now]:
+            self.loaded.remove(model)
+            self._prompt_cache.pop(model, None)
+
+    def loaded_models(self) -> List[str]:
+        """Models currently in memory."""
+        with self._load_lock:
+            self._unload_expired()
+            return list(self.loaded)
+
+    def load(self, model: str) -> None:
+        """Simulate loading a model into memory, unless it still is."""
+        with self._load_lock:
+            self._unload_expired()
+            if model not in self.loaded:
+                time.sleep(self.config.load_seconds)
+                self.loaded.append(model)
+            self._expires.pop(model, None)  # no unloading while serving
+
+    def unload_all(self) -> None:
+        """Drop every loaded model and its KV cache, like a restart."""
+        with self._load_lock:
+            self.loaded.clear()
+            self._expires.clear()
+            self._prompt_cache.clear()
+
+    def keep_loaded(self, model: str, keep_alive: Any) -> None:
+        """Start a model's unload timer after a request finishes."""
+        seconds = parse_keep_alive(keep_alive, self.config.keep_alive)
+        with self._load_lock:
+            self._expires[model] = (
+                float("inf") if seconds < 0 else time.monotonic() + seconds
+            )
+            self._unload_expired()
+
+    def prefill(self, model: str, prompt: List[str]) -> int:
+        """Cache a prompt and return how many of its tokens were cached already."""
+        with self._load_lock:
+            slots = self._prompt_cache.setdefault(model, [])
+            best, best_index = 0, None
+            for index, cached in enumerate(slots):
+                common = 0
+                for a, b in zip(cached, prompt):
+                    if a != b:
+                        break
+                    common += 1
+                if common > best:
+                    best, best_index = common, index
+            if best_index is not None:
+                slots.pop(best_index)  # the slot is reused for this prompt
+            slots.insert(0, prompt)
+            del slots[self.config.cache_slots:]
+            return best
+
+    def response_for(self, prompt: str, format: Any = None) -> List[str]:
+        """The tokens to stream for a prompt.
+
+        With a JSON schema as ``format``, the response is a document
+        following it, like Ollama's structured outputs.
+        """
+        for key, response in self.config.responses.items():
+            if key in prompt:
+                return [f"{word} " for word in response.split()]
+        if isinstance(format, dict):
+            text = json.dumps(_fill_schema(format, self.config.response_tokens))
+            return re.findall(r"\S+\s*", text)
+        return [
+            f"{_WORDS[i % len(_WORDS)]} " for i in range(self.config.response_tokens)
+        ]
+
+
+def _make_handler(server: FakeOllamaServer) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass  # keep benchmark output clean
+
+        def _read_json(self) -> Dict[str, Any]:
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length) or b"{}")
+
+        def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _write_chunk(self, payload: Dict[str, Any]) -> None:
+            data = json.dumps(payload).encode("utf-8") + b"\n"
+            self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+            self.wfile.flush()
+
+        def do_GET(self) -> None:
+            if self.path == "/api/tags":
+                self._send_json(200, {
+                    "models": [
+                        {"name": name, "model": name, "size": 0, "digest": name}
+                        for name in server.config.models
+                    ]
+                })
+            elif self.path == "/api/ps":
+                self._send_json(200, {
+                    "models": [{"name": name, "model": name} for name in server.loaded_models()]
+                })
+            elif self.path in ("/", "/api/version"):
+                self._send_json(200, {"version": "0.0.0-fake"})
+            else:
+                self._send_json(404, {"error": "not found"})
+
+        def do_POST(self) -> None:
+            request = self._read_json()
+            model = request.get("model") or request.get("name") or ""
+
+            if self.path == "/api/show":
+                if model in server.config.models:
+                    self._send_json(200, {
+                        "modelfile": f"FROM {model}",
+                        "details": {"family": model.split(":")[0], "format": "gguf"},
+                        "capabilities": ["completion"],
+                    })
+                else:
+                    self._send_json(404, {"error": f"model '{model}' not found"})
+            elif self.path in ("/api/chat", "/api/generate"):
+                if server._slots is None:
+                    self._generate(request, model)
+                else:
+                    with server._slots:
+                        self._generate(request, model)
+            else:
+                self._send_json(404, {"error": "not found"})
+
+        def _generate(self, request: Dict[str, Any], model: str) -> None:
+            started = time.perf_counter()
+            config = server.config
+
+            if model not in config.models:
+                self._send_json(404, {"error": f"model '{model}' not found"})
+                return
+            if server.should_fail():
+                server.record(RequestRecord(self.path, model, started, time.perf_counter(), 0, True))
+                self._send_json(500, {"error": "injected failure"})
+                return
+
+            server.load(model)
+            chat = self.path == "/api/chat"
+            if chat:
+                prompt = "\n".join(m.get("content", "") for m in request.get("messages", []))
+                prompt_tokens = [
+                    token
+                    for m in request.get("messages", [])
+                    for token in [f"<{m.get('role', 'user')}>", *m.get("content", "").split()]
+                ]
+            else:
+                prompt = request.get("prompt", "")
+                prompt_tokens = prompt.split()
+            tokens = server.response_for(prompt, request.get("format"))
+            cached_tokens = server.prefill(model, prompt_tokens)
+            prefill_seconds = (len(prompt_tokens) - cached_tokens) * config.prefill_per_token
+            first_token_delay = config.ttft + prefill_seconds
+
+            def message(content: str, done: bool) -> Dict[str, Any]:
+                payload: Dict[str, Any] = {
+                    "model": model,
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "done": done,
+                }
+                if chat:
+                    payload["message"] = {"role": "assistant", "content": content}
+                else:
+                    payload["response"] = content
+                return payload
+
+            def final() -> Dict[str, Any]:
+                elapsed_ns = int((time.perf_counter() - started) * 1e9)
+                payload = message("", True)
+                payload.update({
+                    "done_reason": "stop",
+                    "total_duration": elapsed_ns,
+                    "load_duration": 0,
+                    "prompt_eval_count": len(prompt_tokens) - cached_tokens,
+                    "prompt_eval_duration": int(first_token_delay * 1e9),
+                    "eval_count": len(tokens),
+                    "eval_duration": max(elapsed_ns - int(first_token_delay * 1e9), 0),
+                })
+                return payload
+
+            if request.get("stream", True):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                time.sleep(first_token_delay)
+                for i, token in enumerate(tokens):
+                    if i:
+                        time.sleep(config.token_latency)
+                    self._write_chunk(message(token, False))
+                self._write_chunk(final())
+                self.wfile.write(b"0\r\n\r\n")
+                self.wfile.flush()
+            else:
+                time.sleep(first_token_delay + config.token_latency * max(len(tokens) - 1, 0))
+                payload = final()
+                if chat:
+                    payload["message"]["content"] = "".join(tokens)
+                else:
+                    payload["response"] = "".join(tokens)
+                self._send_json(200, payload)
+
+            server.keep_loaded(model, request.get("keep_alive"))
+            server.record(RequestRecord(
+                self.path, model, started, time.perf_counter(), len(tokens),
+                prompt_tokens=len(prompt_tokens),
+                cached_tokens=cached_tokens,
+                prefill_seconds=prefill_seconds,
+            ))
+
+    return Handler
+
+
+def _fill_schema(schema: Dict[str, Any], words: int) -> Any:
+    """A value following a (simple) JSON schema, strings ending in ``?``."""
+    kind = schema.get("type")
+    if kind == "object":
+        properties = schema.get("properties", {})
+        share = max(words // max(len(properties), 1), 1)
+        return {name: _fill_schema(sub, share) for name, sub in properties.items()}
+    if kind == "array":
+        count = max(schema.get("minItems", 0), 3)
+        return [_fill_schema(schema.get("items", {}), max(words // count, 1)) for _ in range(count)]
+    if kind in ("integer", "number"):
+        return 1
+    if kind == "boolean":
+        return True
+    return " ".join(_WORDS[i % len(_WORDS)] for i in range(words)) + "?"
+
+
+def parse_keep_alive(value: Any, default: float) -> float:
+    """Seconds from an Ollama ``keep_alive`` value such as ``300``, ``"30m"`` or ``-1``."""
+    if value is None or value == "":
+        return default
+    if isinstance(value, (int, float)):
+        return float(value)
+    units = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    text = str(value).strip()
+    for unit in ("ms", "s", "m", "h"):
+        if text.endswith(unit):
+            return float(text[: -len(unit)]) * units[unit]
+    return float(text)
+
+
+def model_busy_seconds(records: List[RequestRecord]) -> float:
+    """Wall time during which at least one generation request was running."""
+    intervals: List[Tuple[float, float]] = sorted((r.started, r.finished) for r in records)
+    busy = 0.0
+    current_start, current_end = None, None
+    for start, end in intervals:
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                busy += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        busy += current_end - current_start
+    return busy
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--ttft", type=float, default=0.05, help="Seconds before the first token")
+    parser.add_argument("--token-latency", type=float, default=0.005, help="Seconds per token")
+    parser.add_argument("--tokens", type=int, default=200, help="Tokens per generated response")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of failed requests")
+    parser.add_argument("--load-seconds", type=float, default=0.0, help="Seconds to load a model on first use")
+    parser.add_argument("--num-parallel", type=int, help="Concurrent generations per server")
+    parser.add_argument("--prefill-per-token", type=float, default=0.0, help="Seconds per uncached prompt token")
+    parser.add_argument("--models", default=",".join(DEFAULT_MODELS), help="Comma-separated model names")
+    parser.add_argument("--responses", type=Path, help="JSON file mapping prompt substrings to responses")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    config = FakeOllamaConfig(
+        models=[name.strip() for name in args.models.split(",") if name.strip()],
+        ttft=args.ttft,
+        token_latency=args.token_latency,
+        response_tokens=args.tokens,
+        failure_rate=args.failure_rate,
+        load_seconds=args.load_seconds,
+        num_parallel=args.num_parallel,
+        prefill_per_token=args.prefill_per_token,
+        responses=json.loads(args.responses.read_text(encoding="utf-8")) if args.responses else {},
+        seed=args.seed,
+    )
+    server = FakeOllamaServer(config, host=args.host, port=args.port)
+    print(f"Fake Ollama listening on {server.url} serving {', '.join(config.models)}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Parse time and peak memory of job page parsing per HTML parser backend.
+
+Parses the saved LinkedIn, Indeed and careers-site pages in
+``benchmarks/fixtures/`` with every installed BeautifulSoup parser, both
+building the whole page (as the extractor used to) and building only the
+regions the platform parser reads (``JobDescriptionExtractor.parse_html``).
+Memory is the peak Python heap during one parse, measured with
+``tracemalloc``.
+
+    python benchmarks/html_parsers.py --repeat 20
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+PAGES = [
+    ("LinkedIn", "linkedin_job.html", "https://www.linkedin.com/jobs/view/1"),
+    ("Indeed", "indeed_job.html", "https://uk.indeed.com/viewjob?jk=1"),
+    ("Generic", "generic_job.html", "https://careers.example.com/jobs/1"),
+]
+
+
+def whole_page_parser(parser: str) -> Callable[[bytes, str], Dict[str, Any]]:
+    """Parse the whole page into a tree, then run the platform parser on it."""
+    from bs4 import BeautifulSoup
+
+    from job_application_assistant.tools.document_processor import JobDescriptionExtractor
+
+    extractor = JobDescriptionExtractor(parser)
+
+    def parse(content: bytes, url: str) -> Dict[str, Any]:
+        soup = BeautifulSoup(content, parser)
+        if "linkedin.com" in url:
+            return extractor._parse_linkedin_job(soup, url)
+        return extractor._parse_generic_job(soup, url)
+
+    return parse
+
+
+def measure(parse: Callable[[bytes, str], Dict[str, Any]], content: bytes, url: str, repeat: int) -> Dict[str, Any]:
+    parse(content, url)  # warm up compiled selectors and regions
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parse(content, url)
+        times.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    result = parse(content, url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "median_ms": statistics.median(times) * 1000,
+        "peak_kb": peak / 1024,
+        "title": result["title"],
+    }
+
+
+def run(repeat: int) -> List[Dict[str, Any]]:
+    from job_application_assistant.tools.document_processor import JobDescriptionExtractor
+    from job_application_assistant.tools.html_parsing import available_parsers
+
+    rows = []
+    for page, filename, url in PAGES:
+        content = (FIXTURES_DIR / filename).read_bytes()
+        for parser in available_parsers():
+            modes = [
+                ("whole page", whole_page_parser(parser)),
+                ("regions", JobDescriptionExtractor(parser).parse_html),
+            ]
+            for mode, parse in modes:
+                rows.append({"page": page, "parser": parser, "mode": mode, **measure(parse, content, url, repeat)})
+    return rows
+
+
+def print_report(rows: List[Dict[str, Any]]) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title="Job page parsing per HTML parser")
+    for column in ("Page", "Parser", "Tree", "Median (ms)", "Peak memory (KB)"):
+        table.add_column(column, justify="right" if "(" in column else "left")
+    # Relative to the previous behaviour: the whole page with html.parser
+    baselines = {row["page"]: row for row in rows if row["parser"] == "html.parser" and row["mode"] == "whole page"}
+    for row in rows:
+        baseline = baselines[row["page"]]
+        table.add_row(
+            row["page"], row["parser"], row["mode"],
+            f"{row['median_ms']:.1f} ({row['median_ms'] / baseline['median_ms']:.2f}x)",
+            f"{row['peak_kb']:.0f} ({row['peak_kb'] / baseline['peak_kb']:.2f}x)",
+        )
+    Console().print(table)
+
+
+def main() -> None:
+    import logging
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=20, help="Timed parses per page, parser and tree")
+    parser.add_argument("--json", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rows = run(args.repeat)
+    print_report(rows)
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
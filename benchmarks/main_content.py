@@ -0,0 +1,83 @@
+"""Prompt tokens saved per job page by main-content extraction.
+
+For each saved page, compares the estimated tokens of the whole page text
+(what careers-site and Indeed pages used to store as the description)
+with the description ``JobDescriptionExtractor.parse_html`` stores now.
+The description is re-sent in every agent prompt, so the saving applies
+to each LLM call made for the job.
+
+    python benchmarks/main_content.py                 # saved fixture pages
+    python benchmarks/main_content.py page.html ...   # your own saved pages
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+PAGES = [
+    (FIXTURES_DIR / "generic_job.html", "https://careers.example.com/jobs/1"),
+    (FIXTURES_DIR / "indeed_job.html", "https://uk.indeed.com/viewjob?jk=1"),
+    (FIXTURES_DIR / "linkedin_job.html", "https://www.linkedin.com/jobs/view/1"),
+]
+
+
+def measure(pages: List[Tuple[Path, str]]) -> List[Dict[str, Any]]:
+    from bs4 import BeautifulSoup
+
+    from job_application_assistant.tools.document_processor import JobDescriptionExtractor
+    from job_application_assistant.tools.main_content import estimate_tokens
+
+    extractor = JobDescriptionExtractor()
+    rows = []
+    for path, url in pages:
+        content = path.read_bytes()
+        page_text = BeautifulSoup(content, extractor.html_parser).get_text(separator=" ", strip=True)
+        description = extractor.parse_html(content, url)["description"]
+        page_tokens, description_tokens = estimate_tokens(page_text), estimate_tokens(description)
+        rows.append({
+            "page": path.name,
+            "page_tokens": page_tokens,
+            "description_tokens": description_tokens,
+            "saved_ratio": 1 - description_tokens / page_tokens if page_tokens else 0.0,
+        })
+    return rows
+
+
+def print_report(rows: List[Dict[str, Any]]) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title="Description tokens per job page (estimated)")
+    for column in ("Page", "Page text", "Description", "Saved"):
+        table.add_column(column, justify="left" if column == "Page" else "right")
+    for row in rows:
+        table.add_row(
+            row["page"], str(row["page_tokens"]), str(row["description_tokens"]), f"{row['saved_ratio']:.0%}"
+        )
+    Console().print(table)
+
+
+def main() -> None:
+    import logging
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("pages", nargs="*", type=Path, help="Saved job pages (default: the fixtures)")
+    parser.add_argument("--json", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    pages = [(path, "https://careers.example.com/") for path in args.pages] or PAGES
+    rows = measure(pages)
+    print_report(rows)
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
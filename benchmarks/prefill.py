@@ -0,0 +1,149 @@
+"""Prompt prefill cost of a full application and interview preparation run.
+
+Runs ``JobApplicationAgent.process_application`` (with the job analysis)
+followed by ``InterviewPreparationAgent.prepare_for_interview`` for one
+job against ``fake_ollama.FakeOllamaServer``, which charges prefill time
+per prompt token except for a prefix already in one of the model's KV
+cache slots. Reports how much of the prompts was served from the cache
+and the prefill time saved, per workflow. Interview preparation also runs
+in structured mode (one JSON generation), after unloading the model, for
+comparison.
+
+    python benchmarks/prefill.py --prefill-per-token 0.002
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_ollama import FakeOllamaConfig, FakeOllamaServer, RequestRecord  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def summarize(workflow: str, records: List[RequestRecord], prefill_per_token: float) -> Dict[str, Any]:
+    prompt_tokens = sum(r.prompt_tokens for r in records)
+    cached_tokens = sum(r.cached_tokens for r in records)
+    return {
+        "workflow": workflow,
+        "requests": len(records),
+        "prompt_tokens": prompt_tokens,
+        "cached_tokens": cached_tokens,
+        "cache_ratio": cached_tokens / prompt_tokens if prompt_tokens else 0.0,
+        "prefill_seconds": sum(r.prefill_seconds for r in records),
+        "uncached_prefill_seconds": prompt_tokens * prefill_per_token,
+    }
+
+
+async def run(
+    server: FakeOllamaServer, job_file: Path, cv_file: Path, structured: bool = False
+) -> List[Dict[str, Any]]:
+    from job_application_assistant.agents.interview_prep_agent import InterviewPreparationAgent
+    from job_application_assistant.agents.job_application_agent import JobApplicationAgent
+    from job_application_assistant.models.data_models import UserPreferences
+    from job_application_assistant.tools.document_processor import (
+        extract_job_description,
+        process_cv_file,
+    )
+
+    job = extract_job_description(job_file.read_text(encoding="utf-8"))
+    profile = process_cv_file(str(cv_file))
+    preferences = UserPreferences(
+        job_interest_level=9,
+        motivation="I enjoy building reliable backend systems.",
+        relevant_experience="Six years of Python services on AWS.",
+        career_goals="Grow into a staff engineer.",
+        company_knowledge="Admire the platform team's open source work.",
+    )
+
+    summaries = []
+    workflows = [
+        ("process_application", lambda: JobApplicationAgent(use_cache=False).process_application(
+            job, profile, preferences, use_analysis=True
+        )),
+        ("prepare_for_interview", lambda: InterviewPreparationAgent(use_cache=False).prepare_for_interview(
+            job, profile, structured=structured
+        )),
+    ]
+    start = len(server.records)
+    for name, workflow in workflows:
+        before = len(server.records)
+        result = await workflow()
+        if result.get("error"):
+            raise RuntimeError(result["error"])
+        if result.get("errors"):
+            raise RuntimeError(f"{name}: {result['errors']}")
+        summaries.append(summarize(name, server.records[before:], server.config.prefill_per_token))
+    summaries.append(summarize("total", server.records[start:], server.config.prefill_per_token))
+    if structured:
+        for summary in summaries:
+            summary["workflow"] += " (structured)"
+    return summaries
+
+
+async def run_modes(server: FakeOllamaServer, job_file: Path, cv_file: Path) -> List[Dict[str, Any]]:
+    """Run both interview preparation modes, each starting with the model unloaded."""
+    summaries = []
+    for structured in (False, True):
+        server.unload_all()
+        summaries += await run(server, job_file, cv_file, structured)
+    return summaries
+
+
+def print_report(summaries: List[Dict[str, Any]], prefill_per_token: float) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title=f"Prompt prefill ({prefill_per_token * 1000:.1f}ms per uncached token)")
+    for column in ("Workflow", "Requests", "Prompt tokens", "Cached", "Prefill (s)", "Without reuse (s)"):
+        table.add_column(column, justify="left" if column == "Workflow" else "right")
+    for s in summaries:
+        table.add_row(
+            s["workflow"], str(s["requests"]), str(s["prompt_tokens"]),
+            f"{s['cached_tokens']} ({s['cache_ratio']:.0%})",
+            f"{s['prefill_seconds']:.2f}", f"{s['uncached_prefill_seconds']:.2f}",
+        )
+    Console().print(table)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--prefill-per-token", type=float, default=0.001, help="Seconds per uncached prompt token")
+    parser.add_argument("--cache-slots", type=int, default=4, help="Cached prompts per model")
+    parser.add_argument("--job-file", type=Path, default=FIXTURES_DIR / "job_posting.txt")
+    parser.add_argument("--cv-file", type=Path, default=FIXTURES_DIR / "cv.txt")
+    parser.add_argument("--json", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    config = FakeOllamaConfig(
+        ttft=0.0,
+        token_latency=0.0,
+        response_tokens=50,
+        prefill_per_token=args.prefill_per_token,
+        cache_slots=args.cache_slots,
+    )
+    with FakeOllamaServer(config) as server, tempfile.TemporaryDirectory() as data_dir:
+        os.environ.update({
+            "JOB_ASSISTANT_OLLAMA_BASE_URL": server.url,
+            "JOB_ASSISTANT_DATA_DIR": data_dir,
+            "JOB_ASSISTANT_LOGS_DIR": str(Path(data_dir) / "logs"),
+            "JOB_ASSISTANT_CACHE_DIR": str(Path(data_dir) / "cache"),
+            "JOB_ASSISTANT_LOG_LEVEL": "WARNING",
+            "JOB_ASSISTANT_MAX_REQUESTS_PER_MINUTE": "100000",
+        })
+        summaries = asyncio.run(run_modes(server, args.job_file, args.cv_file))
+
+    print_report(summaries, args.prefill_per_token)
+    if args.json:
+        args.json.write_text(json.dumps(summaries, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmarks for CV file text extraction."""
+
+import shutil
+
+import pytest
+
+from job_application_assistant.tools.document_processor import DocumentProcessor
+
+
+@pytest.fixture(autouse=True)
+def _require_document_libraries():
+    pytest.importorskip("pdfplumber")
+    pytest.importorskip("docx2txt")
+
+
+@pytest.mark.benchmark(group="documents")
+class TestDocumentExtraction:
+    """Benchmark PDF and DOCX extraction on synthetic files."""
+    
+    def test_pdf_uncached(self, benchmark, tmp_path, pdf_cv):
+        """Short PDF, extracted from scratch every round."""
+        cache_dir = tmp_path / "cache"
+        processor = DocumentProcessor(cache_dir=cache_dir)
+        
+        text = benchmark.pedantic(
+            processor.extract_text_from_pdf,
+            args=(str(pdf_cv),),
+            setup=lambda: shutil.rmtree(cache_dir, ignore_errors=True),
+            rounds=20,
+        )
+        assert "Jane Doe" in text
+    
+    def test_pdf_cached(self, benchmark, tmp_path, pdf_cv):
+        """Short PDF served from the content-hash cache."""
+        processor = DocumentProcessor(cache_dir=tmp_path / "cache")
+        processor.extract_text_from_pdf(str(pdf_cv))
+        
+        text = benchmark(processor.extract_text_from_pdf, str(pdf_cv))
+        assert "Jane Doe" in text
+    
+    def test_long_pdf_parallel(self, benchmark, tmp_path, long_pdf):
+        """60-page PDF extracted across a process pool."""
+        cache_dir = tmp_path / "cache"
+        processor = DocumentProcessor(cache_dir=cache_dir, parallel_page_threshold=20)
+        
+        text = benchmark.pedantic(
+            processor.extract_text_from_pdf,
+            args=(str(long_pdf),),
+            setup=lambda: shutil.rmtree(cache_dir, ignore_errors=True),
+            rounds=5,
+        )
+        assert len(text.splitlines()) == 60
+    
+    def test_docx(self, benchmark, docx_cv):
+        """DOCX CV extraction."""
+        text = benchmark(DocumentProcessor().extract_text_from_docx, str(docx_cv))
+        assert "Jane Doe" in text
@@ -0,0 +1,99 @@
+"""Benchmarks for text and HTML job extraction."""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from job_application_assistant.tools.document_processor import (
+    DocumentProcessor,
+    JobDescriptionExtractor,
+)
+from job_application_assistant.tools.html_parsing import available_parsers
+
+PAGES = {
+    "linkedin": ("linkedin_html", "https://www.linkedin.com/jobs/view/1"),
+    "indeed": ("indeed_html", "https://uk.indeed.com/viewjob?jk=1"),
+    "generic": ("generic_html", "https://careers.example.com/jobs/1"),
+}
+
+
+@pytest.fixture
+def extractor():
+    """A job description extractor."""
+    return JobDescriptionExtractor()
+
+
+@pytest.mark.benchmark(group="text")
+class TestTextExtraction:
+    """Benchmark plain-text extraction."""
+    
+    def test_extract_from_text(self, benchmark, extractor, job_posting_text):
+        """Full extraction of a typical pasted posting."""
+        result = benchmark(extractor.extract_from_text, job_posting_text)
+        assert result["title"] == "Senior Backend Engineer"
+    
+    def test_extract_from_text_large(self, benchmark, extractor, large_job_posting_text):
+        """Full extraction of a ~200KB pasted posting."""
+        result = benchmark(extractor.extract_from_text, large_job_posting_text)
+        assert "error" not in result
+    
+    def test_extract_requirements(self, benchmark, extractor, job_posting_text):
+        """Requirement phrase extraction."""
+        requirements = benchmark(extractor._extract_requirements_from_text, job_posting_text)
+        assert requirements
+    
+    def test_extract_skills(self, benchmark, extractor, job_posting_text):
+        """Skill matching against the taxonomy."""
+        skills = benchmark(extractor._extract_skills_from_text, job_posting_text)
+        assert "Python" in skills
+    
+    def test_parse_cv_content(self, benchmark, cv_text):
+        """CV contact and skill parsing."""
+        parsed = benchmark(DocumentProcessor().parse_cv_content, cv_text)
+        assert parsed["contact_info"]["email"] == "jane.doe@example.com"
+
+
+@pytest.mark.benchmark(group="html")
+class TestHTMLParsing:
+    """Benchmark job page parsing, from raw bytes to job data."""
+    
+    def test_parse_linkedin_job(self, benchmark, extractor, linkedin_html):
+        """LinkedIn page parsing."""
+        def parse():
+            soup = BeautifulSoup(linkedin_html, "html.parser")
+            return extractor._parse_linkedin_job(soup, "https://www.linkedin.com/jobs/view/1")
+        
+        result = benchmark(parse)
+        assert result["title"] == "Senior Backend Engineer"
+    
+    def test_parse_generic_job(self, benchmark, extractor, generic_html):
+        """Generic careers page parsing."""
+        def parse():
+            soup = BeautifulSoup(generic_html, "html.parser")
+            return extractor._parse_generic_job(soup, "https://careers.example.com/jobs/1")
+        
+        result = benchmark(parse)
+        assert result["company"] == "Acme Analytics"
+    
+    def test_parse_jsonld_job(self, benchmark, extractor, jsonld_html):
+        """Careers page with JSON-LD, read without building a DOM."""
+        result = benchmark(extractor.parse_html, jsonld_html, "https://careers.example.com/jobs/1")
+        assert result["company"] == "Acme Analytics"
+        assert "Nav item" not in result["description"]
+    
+    def test_parse_jsonld_job_dom(self, benchmark, extractor, jsonld_html):
+        """The same page parsed from the DOM, for comparison."""
+        def parse():
+            soup = BeautifulSoup(jsonld_html, "html.parser")
+            return extractor._parse_generic_job(soup, "https://careers.example.com/jobs/1")
+        
+        result = benchmark(parse)
+        assert result["company"] == "Acme Analytics"
+    
+    @pytest.mark.parametrize("parser", available_parsers())
+    @pytest.mark.parametrize("page", PAGES)
+    def test_parse_html(self, benchmark, request, page, parser):
+        """Page parsing through the extractor, building only the regions read."""
+        fixture, url = PAGES[page]
+        content = request.getfixturevalue(fixture)
+        result = benchmark(JobDescriptionExtractor(parser).parse_html, content, url)
+        assert result["title"] == "Senior Backend Engineer"
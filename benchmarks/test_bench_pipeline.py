@@ -0,0 +1,59 @@
+"""Benchmarks for agent pipeline overhead against a zero-latency fake Ollama."""
+
+import asyncio
+
+import pytest
+
+from fake_ollama import FakeOllamaConfig, FakeOllamaServer
+from job_application_assistant.agents.interview_prep_agent import InterviewPreparationAgent
+from job_application_assistant.agents.job_application_agent import JobApplicationAgent
+
+
+@pytest.fixture(scope="module")
+def fake_ollama():
+    """A fake Ollama that answers instantly with short responses."""
+    with FakeOllamaServer(FakeOllamaConfig(ttft=0, token_latency=0, response_tokens=50)) as server:
+        yield server
+
+
+@pytest.fixture
+def llm_manager(make_llm_manager, fake_ollama):
+    """LLM manager talking to the fake server over HTTP."""
+    return make_llm_manager(ollama_base_url=fake_ollama.url, max_requests_per_minute=60000)
+
+
+@pytest.fixture
+def event_loop_runner():
+    """Run coroutines on one loop, so pooled connections are reused across rounds."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.mark.benchmark(group="pipeline")
+class TestPipelineOverhead:
+    """Benchmark end-to-end agent calls where model time is ~zero."""
+    
+    def test_process_application(
+        self, benchmark, llm_manager, event_loop_runner,
+        sample_job_description, sample_user_profile, sample_user_preferences
+    ):
+        """Analysis and both letters."""
+        agent = JobApplicationAgent(use_cache=False)
+        
+        result = benchmark(lambda: event_loop_runner(agent.process_application(
+            sample_job_description, sample_user_profile, sample_user_preferences
+        )))
+        assert not result.get("error")
+    
+    def test_prepare_for_interview(
+        self, benchmark, llm_manager, event_loop_runner,
+        sample_job_description, sample_user_profile
+    ):
+        """All four interview preparation sections."""
+        agent = InterviewPreparationAgent(use_cache=False)
+        
+        result = benchmark(lambda: event_loop_runner(agent.prepare_for_interview(
+            sample_job_description, sample_user_profile
+        )))
+        assert not result.get("error")
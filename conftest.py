@@ -8,6 +8,81 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+def _write_pdf(path, pages):
+    """Write a minimal PDF with one line of text per page."""
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in below
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+    
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode("latin-1")
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    path.write_bytes(bytes(out))
+    return path
+
+@pytest.fixture(scope="session")
+def write_pdf():
+    """Function writing a minimal PDF: ``write_pdf(path, pages)``."""
+    return _write_pdf
+
+@pytest.fixture
+def make_llm_manager(monkeypatch, tmp_path):
+    """Function building the LLM manager agents get: ``make_llm_manager(primary, fallbacks, **settings)``.
+    
+    It caches and traces under tmp_path and is rate limited loosely enough not to slow
+    tests. With a ``primary`` chat model it starts initialized, every model healthy;
+    without one it connects to ``ollama_base_url`` as usual.
+    """
+    from job_application_assistant.agents import base
+    from job_application_assistant.core.config import Settings
+    from job_application_assistant.core.llm import LLMManager
+    
+    def make(primary=None, fallbacks=(), **overrides):
+        settings = Settings(**{
+            "cache_dir": tmp_path / "cache",
+            "trace_file": tmp_path / "traces.jsonl",
+            "max_requests_per_minute": 6000,
+            **overrides,
+        })
+        manager = LLMManager(settings)
+        if primary is not None:
+            manager._primary_llm = primary
+            manager._fallback_llms = list(fallbacks)
+            manager._model_health[settings.primary_model_name] = True
+            for llm in fallbacks:
+                manager._model_health[getattr(llm, "model", "unknown")] = True
+            manager._initialized = True
+        monkeypatch.setattr(base, "get_llm_manager", lambda: manager)
+        return manager
+    
+    return make
+
+@pytest.fixture
+def llm_manager(make_llm_manager):
+    """Initialized LLM manager answering "OK" from a fake chat model."""
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    
+    return make_llm_manager(FakeListChatModel(responses=["OK"]))
+
 @pytest.fixture
 def sample_job_description():
     """Sample job description for testing."""
@@ -1,9 +1,15 @@
 """Agents package for job application assistant."""
 
+from .base import BaseAgent
 from .job_application_agent import JobApplicationAgent
 from .interview_prep_agent import InterviewPreparationAgent
+from .pipeline import PipelineResult, Step, run_steps
 
 __all__ = [
+    "BaseAgent",
     "JobApplicationAgent",
     "InterviewPreparationAgent",
+    "PipelineResult",
+    "Step",
+    "run_steps",
 ]
@@ -0,0 +1,151 @@
+"""Shared plumbing for the LangChain-based agents."""
+
+import asyncio
+import hashlib
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Union
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.output_parsers import StrOutputParser
+
+from job_application_assistant.core.cache import ResponseCache, get_response_cache
+from job_application_assistant.core.llm import get_llm_manager
+from job_application_assistant.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class BaseAgent:
+    """Base class giving agents an LLM and a cached way to run prompts."""
+
+    # Bump when prompts or output handling change in a way that should
+    # invalidate previously cached responses
+    prompt_version = "2"
+
+    def __init__(self, use_cache: bool = True):
+        """Initialize the agent.
+
+        Args:
+            use_cache: Whether to serve and store responses in the response
+                cache. Disabled regardless when ``Settings.llm_cache_enabled``
+                is off.
+        """
+        self.llm_manager = get_llm_manager()
+        self.llm = self.llm_manager.get_llm()
+
+        settings = self.llm_manager.settings
+        self.cache: Optional[ResponseCache] = (
+            get_response_cache(settings)
+            if use_cache and settings.llm_cache_enabled else None
+        )
+
+    def _cache_key(
+        self, prompt: ChatPromptTemplate, inputs: Dict[str, Any],
+        llm: Optional[BaseLanguageModel] = None,
+        output_format: Optional[Union[str, Dict[str, Any]]] = None
+    ) -> str:
+        """Build the response cache key for a rendered prompt on a model."""
+        llm = llm or self.llm
+        return ResponseCache.make_key(
+            model=str(getattr(llm, "model", type(llm).__name__)),
+            temperature=getattr(llm, "temperature", None),
+            prompt=prompt.format(**inputs),
+            template_version=f"{type(self).__name__}:{self.prompt_version}",
+            output_format=output_format,
+        )
+
+    def _fingerprint(self, prompt: ChatPromptTemplate, inputs: Dict[str, Any]) -> str:
+        """Fingerprint what a generation reads: the prompt version and rendered prompt.
+
+        Unlike the cache key it leaves out the model, so a response does not
+        go stale because another model served it.
+        """
+        rendered = prompt.format(**inputs)
+        payload = f"{type(self).__name__}:{self.prompt_version}\n{rendered}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _generate(
+        self, prompt: ChatPromptTemplate, inputs: Dict[str, Any], step: str = "generate",
+        output_format: Optional[Union[str, Dict[str, Any]]] = None,
+        validate: Optional[Callable[[str], bool]] = None
+    ) -> str:
+        """Run a prompt through the LLM, consulting the response cache first.
+
+        The call fails over to the next available model when the preferred
+        one errors. ``step`` names the call in traces. ``output_format`` is
+        passed to Ollama as ``format``: ``"json"`` or a JSON schema the
+        response must follow. With ``validate``, only responses it accepts
+        are stored in or served from the cache, so a malformed reply is not
+        replayed on every rerun.
+        """
+        agent = type(self).__name__
+        cache_hit = None
+
+        if self.cache is not None:
+            started = time.perf_counter()
+            llm = await self.llm_manager.get_llm_async()
+            cached = await asyncio.to_thread(
+                self.cache.get, self._cache_key(prompt, inputs, llm, output_format)
+            )
+            if cached is not None and (validate is None or validate(cached)):
+                logger.debug(f"Response cache hit for {agent}")
+                self.llm_manager.trace_cache_hit(
+                    llm, agent, step, time.perf_counter() - started
+                )
+                return cached
+            cache_hit = False
+
+        async def call(llm: BaseLanguageModel) -> str:
+            model = llm if output_format is None else llm.bind(format=output_format)
+            chain = prompt | model | StrOutputParser()
+            return await chain.ainvoke(
+                inputs, config=self.llm_manager.run_config(llm, agent, step, cache_hit)
+            )
+
+        text, llm = await self.llm_manager.run_with_failover(call)
+        if self.cache is not None and (validate is None or validate(text)):
+            await asyncio.to_thread(
+                self.cache.set, self._cache_key(prompt, inputs, llm, output_format), text
+            )
+        return text
+
+    async def _stream(
+        self, prompt: ChatPromptTemplate, inputs: Dict[str, Any], step: str = "generate"
+    ) -> AsyncIterator[str]:
+        """Stream a prompt's response in chunks as the LLM produces them.
+
+        A cached response is yielded as a single chunk. A fully streamed
+        response is stored in the cache once it completes. The stream fails
+        over to the next model only if no chunk was produced yet.
+        """
+        agent = type(self).__name__
+        cache_hit = None
+
+        if self.cache is not None:
+            started = time.perf_counter()
+            llm = await self.llm_manager.get_llm_async()
+            cached = await asyncio.to_thread(self.cache.get, self._cache_key(prompt, inputs, llm))
+            if cached is not None:
+                self.llm_manager.trace_cache_hit(
+                    llm, agent, step, time.perf_counter() - started
+                )
+                yield cached
+                return
+            cache_hit = False
+
+        def stream(llm: BaseLanguageModel) -> AsyncIterator[str]:
+            chain = prompt | llm | StrOutputParser()
+            return chain.astream(
+                inputs, config=self.llm_manager.run_config(llm, agent, step, cache_hit)
+            )
+
+        chunks = []
+        served_by = None
+        async for served_by, chunk in self.llm_manager.stream_with_failover(stream):
+            chunks.append(chunk)
+            yield chunk
+
+        if self.cache is not None and served_by is not None:
+            await asyncio.to_thread(
+                self.cache.set, self._cache_key(prompt, inputs, served_by), "".join(chunks)
+            )
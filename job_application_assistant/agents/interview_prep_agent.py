@@ -1,20 +1,130 @@
 """Interview Preparation Agent using simplified LangChain chains."""
 
-from typing import Dict, Any, Optional, List
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
-from job_application_assistant.core.llm import get_llm_manager
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, ValidationInfo, field_validator
+
+from job_application_assistant.agents.base import BaseAgent
+from job_application_assistant.agents.pipeline import Step, run_steps
+from job_application_assistant.agents.prompts import context_inputs, task_prompt
+from job_application_assistant.core.logging import get_logger
 from job_application_assistant.models.data_models import JobDescription, UserProfile, InterviewPreparation
 
+logger = get_logger(__name__)
+
+# Entries kept when repairing a section, for sections that only hold questions
+_SECTION_FILTERS: Dict[str, Callable[[str], bool]] = {
+    "technical_questions": lambda item: "?" in item,
+    "behavioral_questions": lambda item: "Tell me" in item or "Describe" in item or "?" in item,
+    "questions_to_ask": lambda item: "?" in item,
+}
+MAX_QUESTIONS_TO_ASK = 8
+
+
+class InterviewSections(BaseModel):
+    """The generated sections of ``InterviewPreparation``, as one JSON document.
+    
+    Validation repairs what it can: a newline-separated string becomes a
+    list, bullets are stripped, and entries that are not questions are
+    dropped from the question sections before the size checks.
+    """
+    
+    model_config = ConfigDict(validate_assignment=True)
+    
+    confidence_checklist: List[str] = Field(
+        ..., min_length=3,
+        description="Concrete topics the candidate should be very confident discussing: "
+                    "technical concepts, relevant projects, industry, company and role competencies"
+    )
+    technical_questions: List[str] = Field(
+        ..., min_length=5,
+        description="10-15 technical interview questions mixing conceptual, practical, "
+                    "scenario-based and system design questions"
+    )
+    behavioral_questions: List[str] = Field(
+        ..., min_length=3,
+        description="8-12 behavioral questions for the STAR method, phrased as "
+                    "'Tell me about a time when...' or 'Describe a situation where...'"
+    )
+    questions_to_ask: List[str] = Field(
+        ..., min_length=3,
+        description="5-8 thoughtful questions for the candidate to ask the interviewer, "
+                    "not about salary, benefits or easily found company facts"
+    )
+    
+    @field_validator("*", mode="before")
+    @classmethod
+    def _repair(cls, value: Any, info: ValidationInfo) -> Any:
+        if isinstance(value, str):
+            value = value.split("\n")
+        if not isinstance(value, list):
+            return value
+        items = [item.strip("- •").strip() for item in value if isinstance(item, str)]
+        keep = _SECTION_FILTERS.get(info.field_name, bool)
+        items = [item for item in items if item and keep(item)]
+        if info.field_name == "questions_to_ask":
+            items = items[:MAX_QUESTIONS_TO_ASK]
+        return items
+
+
+STRUCTURED_TASK = """Prepare the candidate for an interview for this role.
+
+Respond with a JSON object with these fields, each a list of strings:
+{sections}
+
+Return only the JSON object."""
+
+
+def _sections_schema(names: Sequence[str]) -> Dict[str, Any]:
+    """JSON schema of ``InterviewSections`` restricted to some sections."""
+    schema = InterviewSections.model_json_schema()
+    schema["properties"] = {name: schema["properties"][name] for name in names}
+    schema["required"] = list(names)
+    return schema
+
+
+def _describe_sections(names: Sequence[str]) -> str:
+    fields = InterviewSections.model_fields
+    return "\n".join(f"- {name}: {fields[name].description}" for name in names)
+
 
-class InterviewPreparationAgent:
+def validate_sections(
+    text: str, names: Sequence[str]
+) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
+    """Validate each named section of a JSON response on its own.
+    
+    Returns the valid sections and, for the invalid ones, the reason. Text
+    around the outermost JSON object (such as a code fence) is ignored.
+    """
+    start, end = text.find("{"), text.rfind("}")
+    try:
+        data = json.loads(text[start:end + 1] if 0 <= start < end else text)
+    except json.JSONDecodeError as e:
+        return {}, {name: f"Invalid JSON: {e}" for name in names}
+    if not isinstance(data, dict):
+        return {}, {name: "Response is not a JSON object" for name in names}
+    
+    draft = InterviewSections.model_construct()
+    valid: Dict[str, List[str]] = {}
+    invalid: Dict[str, str] = {}
+    for name in names:
+        try:
+            setattr(draft, name, data.get(name))
+        except ValidationError as e:
+            invalid[name] = e.errors()[0]["msg"]
+        else:
+            valid[name] = getattr(draft, name)
+    return valid, invalid
+
+
+class InterviewPreparationAgent(BaseAgent):
     """Simplified interview preparation agent using LangChain chains."""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         """Initialize the interview preparation agent."""
-        llm_manager = get_llm_manager()
-        self.llm = llm_manager.get_llm()
+        super().__init__(use_cache=use_cache)
     
     async def create_confidence_checklist(
         self, 
@@ -22,33 +132,24 @@ class InterviewPreparationAgent:
         user_profile: UserProfile
     ) -> List[str]:
         """Create a checklist of topics to be confident about."""
-        checklist_prompt = ChatPromptTemplate.from_template("""
-        Create a comprehensive confidence checklist for this interview:
-        
-        Job: {job_title} at {company}
-        Key Requirements: {requirements}
-        User Skills: {user_skills}
-        
-        Create a checklist of topics the candidate should be very confident discussing:
-        1. Technical concepts and skills
-        2. Relevant project experiences
-        3. Industry knowledge
-        4. Company knowledge
-        5. Role-specific competencies
-        
-        Format as a bulleted list with clear, actionable items.
-        Each item should be something concrete they can prepare for.
-        Return only the list items, one per line, without bullet points.
-        """)
-        
-        chain = checklist_prompt | self.llm | StrOutputParser()
-        
-        checklist_text = await chain.ainvoke({
-            "job_title": job_description.title,
-            "company": job_description.company,
-            "requirements": ", ".join(job_description.requirements),
-            "user_skills": ", ".join(user_profile.skills)
-        })
+        checklist_prompt = task_prompt("""Create a comprehensive confidence checklist for this interview.
+
+Create a checklist of topics the candidate should be very confident discussing:
+1. Technical concepts and skills
+2. Relevant project experiences
+3. Industry knowledge
+4. Company knowledge
+5. Role-specific competencies
+
+Format as a bulleted list with clear, actionable items.
+Each item should be something concrete they can prepare for.
+Return only the list items, one per line, without bullet points.""")
+        
+        checklist_text = await self._generate(
+            checklist_prompt,
+            context_inputs(job_description, user_profile),
+            step="confidence_checklist"
+        )
         
         # Parse into list
         return [
@@ -59,40 +160,36 @@ class InterviewPreparationAgent:
     
     async def generate_technical_questions(
         self, 
-        job_description: JobDescription
+        job_description: JobDescription,
+        user_profile: Optional[UserProfile] = None
     ) -> List[str]:
-        """Generate technical interview questions."""
-        technical_prompt = ChatPromptTemplate.from_template("""
-        Generate technical interview questions for this role:
-        
-        Job: {job_title} at {company}
-        Technical Requirements: {requirements}
-        Required Skills: {skills}
-        
-        Create 10-15 technical questions covering:
-        1. Core technical skills
-        2. Problem-solving scenarios
-        3. System design (if applicable)
-        4. Best practices and methodologies
-        5. Real-world application scenarios
-        
-        Mix different question types:
-        - Conceptual questions
-        - Practical coding/implementation questions
-        - Scenario-based questions
-        - Architecture/design questions
-        
-        Return only the questions, one per line.
-        """)
-        
-        chain = technical_prompt | self.llm | StrOutputParser()
-        
-        questions_text = await chain.ainvoke({
-            "job_title": job_description.title,
-            "company": job_description.company,
-            "requirements": ", ".join(job_description.requirements),
-            "skills": ", ".join(job_description.skills)
-        })
+        """Generate technical interview questions.
+        
+        The profile only completes the shared context prefix; pass it when
+        the other sections for the job use it.
+        """
+        technical_prompt = task_prompt("""Generate technical interview questions for this role.
+
+Create 10-15 technical questions covering:
+1. Core technical skills
+2. Problem-solving scenarios
+3. System design (if applicable)
+4. Best practices and methodologies
+5. Real-world application scenarios
+
+Mix different question types:
+- Conceptual questions
+- Practical coding/implementation questions
+- Scenario-based questions
+- Architecture/design questions
+
+Return only the questions, one per line.""")
+        
+        questions_text = await self._generate(
+            technical_prompt,
+            context_inputs(job_description, user_profile),
+            step="technical_questions"
+        )
         
         # Parse into list
         return [
@@ -103,37 +200,31 @@ class InterviewPreparationAgent:
     
     async def generate_behavioral_questions(
         self, 
-        job_description: JobDescription
+        job_description: JobDescription,
+        user_profile: Optional[UserProfile] = None
     ) -> List[str]:
         """Generate behavioral interview questions."""
-        behavioral_prompt = ChatPromptTemplate.from_template("""
-        Generate behavioral interview questions for this role:
-        
-        Job: {job_title} at {company}
-        Job Description: {description}
-        
-        Create 8-12 behavioral questions using the STAR method format:
-        1. Leadership and teamwork
-        2. Problem-solving and conflict resolution
-        3. Communication and collaboration
-        4. Adaptability and learning
-        5. Initiative and innovation
-        6. Time management and prioritization
-        
-        Focus on competencies most relevant to this specific role.
-        Include both standard questions and role-specific scenarios.
-        
-        Format: "Tell me about a time when..." or "Describe a situation where..."
-        Return only the questions, one per line.
-        """)
-        
-        chain = behavioral_prompt | self.llm | StrOutputParser()
+        behavioral_prompt = task_prompt("""Generate behavioral interview questions for this role.
+
+Create 8-12 behavioral questions using the STAR method format:
+1. Leadership and teamwork
+2. Problem-solving and conflict resolution
+3. Communication and collaboration
+4. Adaptability and learning
+5. Initiative and innovation
+6. Time management and prioritization
+
+Focus on competencies most relevant to this specific role.
+Include both standard questions and role-specific scenarios.
+
+Format: "Tell me about a time when..." or "Describe a situation where..."
+Return only the questions, one per line.""")
         
-        questions_text = await chain.ainvoke({
-            "job_title": job_description.title,
-            "company": job_description.company,
-            "description": job_description.description
-        })
+        questions_text = await self._generate(
+            behavioral_prompt,
+            context_inputs(job_description, user_profile),
+            step="behavioral_questions"
+        )
         
         # Parse into list
         return [
@@ -144,31 +235,27 @@ class InterviewPreparationAgent:
     
     async def generate_questions_to_ask(
         self, 
-        job_description: JobDescription
+        job_description: JobDescription,
+        user_profile: Optional[UserProfile] = None
     ) -> List[str]:
         """Generate thoughtful questions to ask the interviewer."""
-        questions_prompt = ChatPromptTemplate.from_template("""
-        Generate thoughtful questions to ask the interviewer for this role:
-        
-        Job: {job_title} at {company}
-        
-        Create 5-8 questions that show:
-        1. Genuine interest in the role and company
-        2. Understanding of the business
-        3. Desire to contribute and grow
-        4. Professional curiosity
-        
-        Avoid questions about salary, benefits, or basic company information easily found online.
-        
-        Return only the questions, one per line.
-        """)
-        
-        chain = questions_prompt | self.llm | StrOutputParser()
+        questions_prompt = task_prompt("""Generate thoughtful questions the candidate can ask the interviewer for this role.
+
+Create 5-8 questions that show:
+1. Genuine interest in the role and company
+2. Understanding of the business
+3. Desire to contribute and grow
+4. Professional curiosity
+
+Avoid questions about salary, benefits, or basic company information easily found online.
+
+Return only the questions, one per line.""")
         
-        questions_text = await chain.ainvoke({
-            "job_title": job_description.title,
-            "company": job_description.company
-        })
+        questions_text = await self._generate(
+            questions_prompt,
+            context_inputs(job_description, user_profile),
+            step="questions_to_ask"
+        )
         
         # Parse into list and filter
         questions = [
@@ -189,36 +276,120 @@ class InterviewPreparationAgent:
         
         return questions[:8]  # Limit to 8 questions
     
+    async def generate_structured_sections(
+        self,
+        job_description: JobDescription,
+        user_profile: Optional[UserProfile] = None
+    ) -> Dict[str, List[str]]:
+        """Generate every interview section in a single JSON response.
+        
+        Ollama constrains the response to the ``InterviewSections`` schema.
+        Each section is validated on its own; valid ones are kept and the
+        model is asked again for the invalid ones only, up to
+        ``Settings.interview_prep_structured_retries`` times. Sections that
+        are still invalid are left out of the result. Only replies with
+        every requested section valid are cached, so a retry after a bad
+        reply gets a fresh answer.
+        """
+        inputs = context_inputs(job_description, user_profile)
+        prompt = task_prompt(STRUCTURED_TASK)
+        retries = self.llm_manager.settings.interview_prep_structured_retries
+        
+        sections: Dict[str, List[str]] = {}
+        missing = list(InterviewSections.model_fields)
+        for attempt in range(retries + 1):
+            requested = missing
+            text = await self._generate(
+                prompt,
+                {**inputs, "sections": _describe_sections(requested)},
+                step="structured_sections" if attempt == 0 else "structured_retry",
+                output_format=_sections_schema(requested),
+                validate=lambda text: not validate_sections(text, requested)[1]
+            )
+            valid, invalid = validate_sections(text, missing)
+            sections.update(valid)
+            if not invalid:
+                break
+            logger.info(f"Invalid interview sections: {invalid}")
+            missing = list(invalid)
+        
+        return sections
+    
     async def prepare_for_interview(
         self,
         job_description: JobDescription,
-        user_profile: UserProfile
+        user_profile: UserProfile,
+        concurrent: bool = True,
+        structured: Optional[bool] = None
     ) -> Dict[str, Any]:
-        """Prepare comprehensive interview materials."""
+        """Prepare comprehensive interview materials.
+        
+        The four section generators are independent, so by default they run
+        concurrently, bounded by ``Settings.llm_max_concurrency``. With
+        ``structured`` (default ``Settings.interview_prep_structured``) the
+        sections come from a single JSON generation instead, and only the
+        sections it could not produce fall back to their own generator. A
+        failing section is left empty and reported under ``errors``; the
+        call only fails as a whole when every section fails.
+        """
+        if structured is None:
+            structured = self.llm_manager.settings.interview_prep_structured
+        
         try:
-            # Generate all preparation materials
-            confidence_checklist = await self.create_confidence_checklist(
-                job_description, user_profile
-            )
+            generators = {
+                "confidence_checklist": lambda: self.create_confidence_checklist(
+                    job_description, user_profile
+                ),
+                "technical_questions": lambda: self.generate_technical_questions(
+                    job_description, user_profile
+                ),
+                "behavioral_questions": lambda: self.generate_behavioral_questions(
+                    job_description, user_profile
+                ),
+                "questions_to_ask": lambda: self.generate_questions_to_ask(
+                    job_description, user_profile
+                ),
+            }
             
-            technical_questions = await self.generate_technical_questions(
-                job_description
-            )
+            if structured:
+                async def structured_sections() -> Dict[str, List[str]]:
+                    # A failed structured call leaves every section to its own generator
+                    try:
+                        return await self.generate_structured_sections(job_description, user_profile)
+                    except Exception as e:
+                        logger.warning(f"Structured interview sections failed, generating each alone: {e}")
+                        return {}
+                
+                steps = [Step("structured_sections", structured_sections)]
+                steps += [
+                    Step(name, _structured_or(name, generate), inputs=("structured_sections",))
+                    for name, generate in generators.items()
+                ]
+            else:
+                steps = [Step(name, generate) for name, generate in generators.items()]
             
-            behavioral_questions = await self.generate_behavioral_questions(
-                job_description
+            limiter = (
+                self.llm_manager.get_concurrency_limiter()
+                if concurrent else asyncio.Semaphore(1)
             )
+            outcome = await run_steps(steps, limiter=limiter)
             
-            questions_to_ask = await self.generate_questions_to_ask(
-                job_description
-            )
+            errors = {
+                name: str(error) for name, error in outcome.errors.items() if name in generators
+            }
+            if all(name in errors for name in generators):
+                return {
+                    "error": f"Error preparing for interview: {next(iter(errors.values()))}",
+                    "errors": errors,
+                    "interview_prep": None,
+                    "timings": outcome.timings
+                }
+            
+            materials = {name: outcome.results.get(name, []) for name in generators}
             
             # Create interview preparation object
             interview_prep = InterviewPreparation(
-                confidence_checklist=confidence_checklist,
-                technical_questions=technical_questions,
-                behavioral_questions=behavioral_questions,
-                questions_to_ask=questions_to_ask,
+                **materials,
                 preparation_timeline={
                     "Week 1": ["Foundation study", "Core concepts review"],
                     "Week 2": ["Technical practice", "Mock coding sessions"],
@@ -229,6 +400,8 @@ class InterviewPreparationAgent:
             
             return {
                 "interview_prep": interview_prep,
+                "errors": errors,
+                "timings": outcome.timings,
                 "error": None
             }
             
@@ -237,3 +410,14 @@ class InterviewPreparationAgent:
                 "error": f"Error preparing for interview: {str(e)}",
                 "interview_prep": None
             }
+
+
+def _structured_or(
+    name: str, generate: Callable[[], Awaitable[List[str]]]
+) -> Callable[..., Awaitable[List[str]]]:
+    """Step taking a section from the structured response, else generating it alone."""
+    async def run(structured_sections: Dict[str, List[str]]) -> List[str]:
+        if name in structured_sections:
+            return structured_sections[name]
+        return await generate()
+    return run
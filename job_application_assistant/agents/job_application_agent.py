@@ -1,171 +1,437 @@
 """Job Application Agent using simplified LangChain chains."""
 
-from typing import Dict, Any, Optional, List
+import asyncio
+import time
+from typing import Dict, Any, Optional, List, AsyncIterator, Awaitable, Callable, Tuple
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
 
-from job_application_assistant.core.llm import get_llm_manager
+from job_application_assistant.agents.base import BaseAgent
+from job_application_assistant.agents.pipeline import Step, StepSkipped, run_steps
+from job_application_assistant.agents.prompts import context_inputs, task_prompt
+from job_application_assistant.core.logging import get_logger
 from job_application_assistant.models.data_models import JobDescription, UserProfile, UserPreferences, ApplicationDocument
 
+logger = get_logger(__name__)
 
-class JobApplicationAgent:
+# Marks the end of a letter's buffered chunks in ``stream_application``
+_END_OF_STREAM = object()
+
+# Appended to letter prompts when the job analysis is fed into them
+ANALYSIS_SECTION = """
+Use this analysis of the job to tailor the letter:
+{analysis}
+"""
+
+
+class JobApplicationAgent(BaseAgent):
     """Simplified job application agent using LangChain chains."""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         """Initialize the job application agent."""
-        llm_manager = get_llm_manager()
-        self.llm = llm_manager.get_llm()
+        super().__init__(use_cache=use_cache)
     
-    async def analyze_job(self, job_description: JobDescription) -> str:
-        """Analyze the job description."""
-        analysis_prompt = ChatPromptTemplate.from_template("""
-        Analyze this job description and extract key information:
-        
-        Job Title: {title}
-        Company: {company}
-        Description: {description}
-        
-        Please extract:
-        1. Key requirements and qualifications
-        2. Technical skills needed
-        3. Soft skills emphasized
-        4. Company culture indicators
-        5. Growth opportunities mentioned
-        
-        Format your response as a structured analysis.
-        """)
-        
-        chain = analysis_prompt | self.llm | StrOutputParser()
-        
-        return await chain.ainvoke({
-            "title": job_description.title,
-            "company": job_description.company,
-            "description": job_description.description
-        })
+    def _analysis_prompt(
+        self,
+        job_description: JobDescription,
+        user_profile: Optional[UserProfile] = None
+    ) -> Tuple[ChatPromptTemplate, Dict[str, Any]]:
+        """Build the job analysis prompt and its inputs."""
+        analysis_prompt = task_prompt("""Analyze the job description above and extract key information:
+
+1. Key requirements and qualifications
+2. Technical skills needed
+3. Soft skills emphasized
+4. Company culture indicators
+5. Growth opportunities mentioned
+
+Format your response as a structured analysis.""")
+        
+        return analysis_prompt, context_inputs(job_description, user_profile)
     
-    async def generate_cover_letter(
+    async def analyze_job(
+        self,
+        job_description: JobDescription,
+        user_profile: Optional[UserProfile] = None
+    ) -> str:
+        """Analyze the job description.
+        
+        Pass the candidate's profile when other steps for the same job use
+        it, so this prompt shares their context prefix.
+        """
+        prompt, inputs = self._analysis_prompt(job_description, user_profile)
+        return await self._generate(prompt, inputs, step="analysis")
+    
+    def _cover_letter_prompt(
         self,
         job_description: JobDescription,
         user_profile: UserProfile,
-        user_preferences: UserPreferences
-    ) -> ApplicationDocument:
-        """Generate a personalized cover letter."""
-        cover_letter_prompt = ChatPromptTemplate.from_template("""
-        Write a compelling cover letter for this job application:
-        
-        Job: {job_title} at {company}
-        Job Description: {job_description}
-        
-        Applicant Profile:
-        Name: {name}
-        Skills: {skills}
-        Experience: {experience}
-        
-        User Preferences:
-        Motivation: {motivation}
-        Relevant Experience: {relevant_experience}
-        Career Goals: {career_goals}
-        Company Knowledge: {company_knowledge}
-        
-        Write a professional, personalized cover letter that:
-        1. Shows genuine interest and understanding of the role
-        2. Highlights relevant experience and skills
-        3. Demonstrates knowledge of the company
-        4. Connects the user's goals with the opportunity
-        5. Is engaging and memorable
-        
-        Keep it to 3-4 paragraphs and maintain a professional tone.
-        """)
-        
-        chain = cover_letter_prompt | self.llm | StrOutputParser()
-        
-        content = await chain.ainvoke({
-            "job_title": job_description.title,
-            "company": job_description.company,
-            "job_description": job_description.description,
-            "name": user_profile.name,
-            "skills": ", ".join(user_profile.skills),
-            "experience": str(user_profile.experience),
+        user_preferences: UserPreferences,
+        analysis: Optional[str] = None
+    ) -> Tuple[ChatPromptTemplate, Dict[str, Any]]:
+        """Build the cover letter prompt and its inputs."""
+        cover_letter_prompt = task_prompt("""Write a compelling cover letter for this job application.
+
+Candidate Preferences:
+Motivation: {motivation}
+Relevant Experience: {relevant_experience}
+Career Goals: {career_goals}
+Company Knowledge: {company_knowledge}
+
+Write a professional, personalized cover letter that:
+1. Shows genuine interest and understanding of the role
+2. Highlights relevant experience and skills
+3. Demonstrates knowledge of the company
+4. Connects the candidate's goals with the opportunity
+5. Is engaging and memorable
+
+Keep it to 3-4 paragraphs and maintain a professional tone.
+""" + (ANALYSIS_SECTION if analysis else ""))
+        
+        return cover_letter_prompt, {
+            **context_inputs(job_description, user_profile),
+            **({"analysis": analysis} if analysis else {}),
             "motivation": user_preferences.motivation,
             "relevant_experience": user_preferences.relevant_experience,
             "career_goals": user_preferences.career_goals,
             "company_knowledge": user_preferences.company_knowledge
-        })
-        
-        return ApplicationDocument(
-            document_type="cover_letter",
-            title=f"Cover Letter - {job_description.title} at {job_description.company}",
-            content=content
+        }
+    
+    async def generate_cover_letter(
+        self,
+        job_description: JobDescription,
+        user_profile: UserProfile,
+        user_preferences: UserPreferences,
+        analysis: Optional[str] = None
+    ) -> ApplicationDocument:
+        """Generate a personalized cover letter."""
+        prompt, inputs = self._cover_letter_prompt(
+            job_description, user_profile, user_preferences, analysis
         )
+        content = await self._generate(prompt, inputs, step="cover_letter")
+        return self.make_document("cover_letter", job_description, content)
+    
+    def _motivation_letter_prompt(
+        self,
+        job_description: JobDescription,
+        user_profile: UserProfile,
+        user_preferences: UserPreferences,
+        analysis: Optional[str] = None
+    ) -> Tuple[ChatPromptTemplate, Dict[str, Any]]:
+        """Build the motivation letter prompt and its inputs."""
+        motivation_prompt = task_prompt("""Write a detailed motivation letter for this job application.
+
+Focus on:
+1. Deep personal motivation for this specific role
+2. Alignment with career aspirations
+3. Unique value proposition
+4. Specific examples of relevant achievements
+5. Future contributions to the company
+
+Candidate's Motivation: {motivation}
+Career Goals: {career_goals}
+Relevant Experience: {relevant_experience}
+
+Write a compelling motivation letter that goes beyond the cover letter.
+""" + (ANALYSIS_SECTION if analysis else ""))
+        
+        return motivation_prompt, {
+            **context_inputs(job_description, user_profile),
+            **({"analysis": analysis} if analysis else {}),
+            "motivation": user_preferences.motivation,
+            "career_goals": user_preferences.career_goals,
+            "relevant_experience": user_preferences.relevant_experience
+        }
     
     async def generate_motivation_letter(
         self,
         job_description: JobDescription,
         user_profile: UserProfile,
-        user_preferences: UserPreferences
+        user_preferences: UserPreferences,
+        analysis: Optional[str] = None
     ) -> ApplicationDocument:
         """Generate a motivation letter."""
-        motivation_prompt = ChatPromptTemplate.from_template("""
-        Write a detailed motivation letter for this job application:
-        
-        Job: {job_title} at {company}
+        prompt, inputs = self._motivation_letter_prompt(
+            job_description, user_profile, user_preferences, analysis
+        )
+        content = await self._generate(prompt, inputs, step="motivation_letter")
+        return self.make_document("motivation_letter", job_description, content)
+    
+    def _letter_prompts(self) -> Dict[str, Callable[..., Tuple[ChatPromptTemplate, Dict[str, Any]]]]:
+        """Prompt builders of the letters, in generation order."""
+        return {
+            "cover_letter": self._cover_letter_prompt,
+            "motivation_letter": self._motivation_letter_prompt,
+        }
+    
+    def input_fingerprints(
+        self,
+        job_description: JobDescription,
+        user_profile: UserProfile,
+        user_preferences: UserPreferences,
+        use_analysis: bool = False
+    ) -> Dict[str, str]:
+        """Fingerprint the inputs of the analysis and of each letter.
         
-        Focus on:
-        1. Deep personal motivation for this specific role
-        2. Alignment with career aspirations
-        3. Unique value proposition
-        4. Specific examples of relevant achievements
-        5. Future contributions to the company
+        A fingerprint covers the rendered prompt, so it only changes when a
+        field that prompt reads changes: the analysis ignores the
+        preferences, and no prompt reads ``concerns``. With
+        ``use_analysis`` a letter's prompt is rendered with the analysis
+        fingerprint in place of its text, so the letter goes stale whenever
+        the analysis does.
+        """
+        prompt, inputs = self._analysis_prompt(job_description, user_profile)
+        fingerprints = {"analysis": self._fingerprint(prompt, inputs)}
+        analysis = f"<analysis {fingerprints['analysis']}>" if use_analysis else None
+        for document_type, build_prompt in self._letter_prompts().items():
+            prompt, inputs = build_prompt(
+                job_description, user_profile, user_preferences, analysis
+            )
+            fingerprints[document_type] = self._fingerprint(prompt, inputs)
+        return fingerprints
+    
+    @staticmethod
+    def _reusable(
+        previous: Optional[Dict[str, Any]], fingerprints: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Results of a previous run whose input fingerprints still match."""
+        if not previous:
+            return {}
         
-        User's Motivation: {motivation}
-        Career Goals: {career_goals}
-        Relevant Experience: {relevant_experience}
+        reusable: Dict[str, Any] = {
+            doc.document_type: doc
+            for doc in previous.get("generated_documents") or []
+            if doc.metadata.get("input_fingerprint") == fingerprints.get(doc.document_type)
+        }
+        previous_analysis = (previous.get("fingerprints") or {}).get("analysis")
+        if previous.get("analysis") is not None and previous_analysis == fingerprints["analysis"]:
+            reusable["analysis"] = previous["analysis"]
+        return reusable
+    
+    def make_document(
+        self,
+        document_type: str,
+        job_description: JobDescription,
+        content: str,
+        fingerprint: Optional[str] = None
+    ) -> ApplicationDocument:
+        """Wrap generated content in an ApplicationDocument.
         
-        Write a compelling motivation letter that goes beyond the cover letter.
-        """)
+        ``fingerprint`` is the document's entry from ``input_fingerprints``,
+        kept in its metadata so a later run can tell whether it is stale.
+        """
+        label = document_type.replace("_", " ").title()
+        return ApplicationDocument(
+            document_type=document_type,
+            title=f"{label} - {job_description.title} at {job_description.company}",
+            content=content,
+            metadata={"input_fingerprint": fingerprint} if fingerprint else {}
+        )
+    
+    async def stream_application(
+        self,
+        job_description: JobDescription,
+        user_profile: UserProfile,
+        user_preferences: UserPreferences,
+        use_analysis: bool = False,
+        previous: Optional[Dict[str, Any]] = None,
+        result: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """Stream the application letters as they are generated.
         
-        chain = motivation_prompt | self.llm | StrOutputParser()
+        Yields ``(document_type, token_chunk)`` pairs, finishing one document
+        before starting the next so callers can render them in order. Both
+        letters are generated concurrently: chunks of a letter are buffered
+        until the ones before it have been yielded. Use ``make_document`` on
+        the joined chunks to get the final documents.
         
-        content = await chain.ainvoke({
-            "job_title": job_description.title,
-            "company": job_description.company,
-            "motivation": user_preferences.motivation,
-            "career_goals": user_preferences.career_goals,
-            "relevant_experience": user_preferences.relevant_experience
-        })
+        Letters of ``previous`` (shaped like a ``process_application``
+        result) whose inputs are unchanged are yielded whole instead of
+        being regenerated, and the analysis only runs when a letter needs it.
         
-        return ApplicationDocument(
-            document_type="motivation_letter",
-            title=f"Motivation Letter - {job_description.title} at {job_description.company}",
-            content=content
+        Pass a dict as ``result`` to have it filled like a
+        ``process_application`` result, with per-step ``timings`` and, if a
+        step fails, the ``error`` naming it before the exception is raised.
+        Its ``analysis`` lets a later call with ``previous=result`` reuse it.
+        """
+        fingerprints = self.input_fingerprints(
+            job_description, user_profile, user_preferences, use_analysis
         )
+        reused = self._reusable(previous, fingerprints)
+        timings: Dict[str, float] = {}
+        
+        async def timed(name: str, run: Callable[[], Awaitable[Any]]) -> Any:
+            started = time.perf_counter()
+            try:
+                return await run()
+            finally:
+                timings[name] = time.perf_counter() - started
+        
+        pending = [t for t in self._letter_prompts() if t not in reused]
+        analysis_task: Optional["asyncio.Task[str]"] = None
+        if use_analysis and pending and "analysis" not in reused:
+            analysis_task = asyncio.ensure_future(
+                timed("analysis", lambda: self.analyze_job(job_description, user_profile))
+            )
+        
+        async def generate(document_type: str, chunks: "asyncio.Queue[Any]") -> None:
+            async def run() -> None:
+                analysis = reused.get("analysis")
+                if analysis_task is not None:
+                    analysis = await asyncio.shield(analysis_task)
+                prompt, inputs = self._letter_prompts()[document_type](
+                    job_description, user_profile, user_preferences, analysis
+                )
+                async for chunk in self._stream(prompt, inputs, step=document_type):
+                    chunks.put_nowait(chunk)
+            try:
+                await timed(document_type, run)
+            finally:
+                chunks.put_nowait(_END_OF_STREAM)
+        
+        queues = {document_type: asyncio.Queue() for document_type in pending}
+        tasks = {
+            document_type: asyncio.ensure_future(generate(document_type, queue))
+            for document_type, queue in queues.items()
+        }
+        contents: Dict[str, str] = {}
+        step = None
+        try:
+            for document_type in self._letter_prompts():
+                step = document_type
+                if document_type in reused:
+                    contents[document_type] = reused[document_type].content
+                    yield document_type, contents[document_type]
+                    continue
+                parts = []
+                while True:
+                    chunk = await queues[document_type].get()
+                    if chunk is _END_OF_STREAM:
+                        break
+                    parts.append(chunk)
+                    yield document_type, chunk
+                await tasks[document_type]
+                contents[document_type] = "".join(parts)
+        except Exception as e:
+            # Report the root failure rather than a letter that was waiting for it
+            if analysis_task is not None and analysis_task.done() and not analysis_task.cancelled():
+                if analysis_task.exception() is not None:
+                    step = "analysis"
+            if result is not None:
+                result.update(error=f"Error processing application: {step}: {e}", timings=timings)
+            raise
+        finally:
+            for task in [*tasks.values(), analysis_task]:
+                if task is None:
+                    continue
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # mark as retrieved; raised above if it mattered
+        
+        if reused:
+            logger.debug(f"Reused unchanged steps: {sorted(reused)}")
+        analysis = reused.get("analysis")
+        if analysis_task is not None:
+            analysis = analysis_task.result()
+        if result is not None:
+            result.update({
+                "job_description": job_description,
+                "user_profile": user_profile,
+                "user_preferences": user_preferences,
+                "generated_documents": [
+                    self.make_document(t, job_description, content, fingerprints[t])
+                    for t, content in contents.items()
+                ],
+                "analysis": analysis,
+                "fingerprints": fingerprints,
+                "reused": sorted(reused),
+                "timings": timings,
+                "error": None
+            })
     
     async def process_application(
         self,
         job_description: JobDescription,
         user_profile: UserProfile,
-        user_preferences: UserPreferences
+        user_preferences: UserPreferences,
+        use_analysis: bool = False,
+        previous: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Process a complete job application."""
-        try:
-            # Analyze job
-            analysis = await self.analyze_job(job_description)
+        """Process a complete job application.
+        
+        The job analysis and both letters run as a step graph. By default
+        the letters do not read the analysis, so all three run concurrently;
+        with ``use_analysis`` the letters wait for it and include it in
+        their prompts. Per-step durations are returned under ``timings``.
+        
+        Pass the result of an earlier call as ``previous`` to regenerate
+        only what changed: a step whose ``input_fingerprints`` entry still
+        matches reuses its earlier result. Reused steps are listed under
+        ``reused``.
+        """
+        letter_inputs = ("analysis",) if use_analysis else ()
+        fingerprints = self.input_fingerprints(
+            job_description, user_profile, user_preferences, use_analysis
+        )
+        reused = self._reusable(previous, fingerprints)
+        
+        def step(name: str, run: Callable[..., Any], inputs: Tuple[str, ...] = ()) -> Step:
+            if name not in reused:
+                return Step(name, run, inputs=inputs)
             
-            # Generate documents
-            cover_letter = await self.generate_cover_letter(
-                job_description, user_profile, user_preferences
+            async def reuse(**_: Any) -> Any:
+                return reused[name]
+            return Step(name, reuse)
+        
+        steps = [
+            step("analysis", lambda: self.analyze_job(job_description, user_profile)),
+            step(
+                "cover_letter",
+                lambda analysis=None: self.generate_cover_letter(
+                    job_description, user_profile, user_preferences, analysis
+                ),
+                inputs=letter_inputs
+            ),
+            step(
+                "motivation_letter",
+                lambda analysis=None: self.generate_motivation_letter(
+                    job_description, user_profile, user_preferences, analysis
+                ),
+                inputs=letter_inputs
+            ),
+        ]
+        
+        try:
+            outcome = await run_steps(
+                steps, limiter=self.llm_manager.get_concurrency_limiter()
             )
             
-            motivation_letter = await self.generate_motivation_letter(
-                job_description, user_profile, user_preferences
-            )
+            if not outcome.ok:
+                # Report the root failure rather than a skipped dependent
+                name, error = next(
+                    (item for item in outcome.errors.items()
+                     if not isinstance(item[1], StepSkipped)),
+                    next(iter(outcome.errors.items()))
+                )
+                raise RuntimeError(f"{name}: {error}")
+            
+            logger.debug(f"Application critical path: {outcome.critical_path(steps)}")
+            if reused:
+                logger.debug(f"Reused unchanged steps: {sorted(reused)}")
+            
+            documents = [outcome.results["cover_letter"], outcome.results["motivation_letter"]]
+            for doc in documents:
+                doc.metadata["input_fingerprint"] = fingerprints[doc.document_type]
             
             return {
                 "job_description": job_description,
                 "user_profile": user_profile,
                 "user_preferences": user_preferences,
-                "generated_documents": [cover_letter, motivation_letter],
-                "analysis": analysis,
+                "generated_documents": documents,
+                "analysis": outcome.results["analysis"],
+                "fingerprints": fingerprints,
+                "reused": sorted(reused),
+                "timings": outcome.timings,
                 "error": None
             }
             
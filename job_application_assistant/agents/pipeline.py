@@ -0,0 +1,153 @@
+"""Small dependency-graph executor for agent steps."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from job_application_assistant.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class Step:
+    """A unit of agent work.
+
+    ``run`` is called with one keyword argument per name in ``inputs``,
+    holding the result of the step with that name.
+    """
+
+    name: str
+    run: Callable[..., Awaitable[Any]]
+    inputs: Sequence[str] = ()
+
+
+class StepSkipped(Exception):
+    """Raised for a step whose inputs failed, so it never ran."""
+    pass
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of running a step graph."""
+
+    results: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+    total_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether every step succeeded."""
+        return not self.errors
+
+    def critical_path(self, steps: Sequence[Step]) -> List[str]:
+        """Return the chain of steps with the longest summed duration."""
+        by_name = {step.name: step for step in steps}
+        memo: Dict[str, List[str]] = {}
+
+        def longest(name: str) -> List[str]:
+            if name not in memo:
+                best: List[str] = []
+                for dep in by_name[name].inputs:
+                    path = longest(dep)
+                    if self._duration(path) > self._duration(best):
+                        best = path
+                memo[name] = best + [name]
+            return memo[name]
+
+        paths = [longest(step.name) for step in steps]
+        return max(paths, key=self._duration, default=[])
+
+    def _duration(self, path: List[str]) -> float:
+        return sum(self.timings.get(name, 0.0) for name in path)
+
+
+def _validate(steps: Sequence[Step]) -> None:
+    """Check step names are unique, inputs exist and there are no cycles."""
+    names = [step.name for step in steps]
+    if len(names) != len(set(names)):
+        raise ValueError(f"Duplicate step names in {names}")
+
+    by_name = {step.name: step for step in steps}
+    for step in steps:
+        missing = [dep for dep in step.inputs if dep not in by_name]
+        if missing:
+            raise ValueError(f"Step '{step.name}' depends on unknown steps: {missing}")
+
+    visiting, visited = set(), set()
+
+    def visit(name: str) -> None:
+        if name in visited:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle detected at step '{name}'")
+        visiting.add(name)
+        for dep in by_name[name].inputs:
+            visit(dep)
+        visiting.discard(name)
+        visited.add(name)
+
+    for name in names:
+        visit(name)
+
+
+async def run_steps(
+    steps: Sequence[Step],
+    limiter: Optional[asyncio.Semaphore] = None,
+) -> PipelineResult:
+    """Run steps as soon as their inputs are ready.
+
+    Independent steps run concurrently; ``limiter`` bounds how many run at
+    once. A step is only admitted to the limiter after its inputs resolve,
+    so waiting steps never hold a slot. Failures are collected rather than
+    raised, and dependents of a failed step are skipped.
+    """
+    _validate(steps)
+
+    result = PipelineResult()
+    tasks: Dict[str, "asyncio.Task[Any]"] = {}
+
+    async def execute(step: Step) -> Any:
+        kwargs = {}
+        for dep in step.inputs:
+            try:
+                kwargs[dep] = await tasks[dep]
+            except Exception as e:
+                raise StepSkipped(f"Input '{dep}' failed: {e}") from e
+
+        async def timed() -> Any:
+            started = time.perf_counter()
+            try:
+                return await step.run(**kwargs)
+            finally:
+                result.timings[step.name] = time.perf_counter() - started
+                logger.debug(f"Step {step.name} took {result.timings[step.name]:.2f}s")
+
+        if limiter is None:
+            return await timed()
+        async with limiter:
+            return await timed()
+
+    started = time.perf_counter()
+
+    # Register every task before any of them can look up its inputs
+    for step in steps:
+        tasks[step.name] = asyncio.ensure_future(execute(step))
+
+    await asyncio.gather(*tasks.values(), return_exceptions=True)
+    result.total_seconds = time.perf_counter() - started
+
+    for name, task in tasks.items():
+        if task.cancelled():
+            raise asyncio.CancelledError()
+        error = task.exception()
+        if error is None:
+            result.results[name] = task.result()
+        elif isinstance(error, Exception):
+            result.errors[name] = error
+        else:
+            raise error
+
+    return result
@@ -0,0 +1,66 @@
+"""Prompt layout shared by the agents.
+
+Every prompt opens with the same system message holding the job and
+candidate context, followed by a task-specific human message. Ollama
+reuses its KV cache for a prompt prefix it has already processed, so once
+one step has run for a job, the other steps only prefill their short task
+instructions. Keep ``CONTEXT_TEMPLATE`` and ``context_inputs`` identical
+for every step: a difference early in the context invalidates the cache
+for everything after it.
+"""
+
+from typing import Dict, Optional
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from job_application_assistant.models.data_models import JobDescription, UserProfile
+
+CONTEXT_TEMPLATE = """You are an expert career coach helping a candidate apply and interview for a job.
+
+# Job
+Title: {job_title}
+Company: {company}
+Location: {location}
+Requirements: {requirements}
+Required Skills: {job_skills}
+Description:
+{job_description}
+
+# Candidate
+Name: {name}
+Skills: {skills}
+Experience: {experience}
+"""
+
+NOT_PROVIDED = "Not provided"
+
+
+def task_prompt(task: str) -> ChatPromptTemplate:
+    """Build a prompt from the shared context and a task-specific instruction."""
+    return ChatPromptTemplate.from_messages([
+        ("system", CONTEXT_TEMPLATE),
+        ("human", task),
+    ])
+
+
+def context_inputs(
+    job_description: JobDescription,
+    user_profile: Optional[UserProfile] = None
+) -> Dict[str, str]:
+    """Inputs for ``CONTEXT_TEMPLATE``."""
+    inputs = {
+        "job_title": job_description.title,
+        "company": job_description.company,
+        "location": job_description.location or NOT_PROVIDED,
+        "requirements": ", ".join(job_description.requirements) or NOT_PROVIDED,
+        "job_skills": ", ".join(job_description.skills) or NOT_PROVIDED,
+        "job_description": job_description.description,
+    }
+    if user_profile is None:
+        return {**inputs, "name": NOT_PROVIDED, "skills": NOT_PROVIDED, "experience": NOT_PROVIDED}
+    return {
+        **inputs,
+        "name": user_profile.name,
+        "skills": ", ".join(user_profile.skills) or NOT_PROVIDED,
+        "experience": str(user_profile.experience) if user_profile.experience else NOT_PROVIDED,
+    }
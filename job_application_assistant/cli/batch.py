@@ -0,0 +1,229 @@
+"""Batch processing of many job postings for one candidate."""
+
+import asyncio
+import csv
+import hashlib
+import json
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from job_application_assistant.core.admission import BATCH, request_context
+from job_application_assistant.core.exceptions import ValidationError
+from job_application_assistant.core.logging import get_logger
+from job_application_assistant.models.data_models import (
+    JobDescription,
+    UserPreferences,
+    UserProfile,
+)
+from job_application_assistant.tools.document_processor import (
+    extract_job_description,
+    job_description_extractions,
+    job_description_from_data,
+)
+
+logger = get_logger(__name__)
+
+# Written last in each job directory; its presence marks the job as finished
+RESULT_FILE = "result.json"
+
+
+@dataclass
+class BatchJob:
+    """One entry of a batch manifest."""
+
+    job_id: str
+    source: str
+    is_url: bool
+
+
+@dataclass
+class BatchResult:
+    """Outcome of processing one batch job."""
+
+    job_id: str
+    status: str  # "done", "skipped" or "failed"
+    seconds: float = 0.0
+    title: Optional[str] = None
+    company: Optional[str] = None
+    error: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+def _make_job_id(source: str) -> str:
+    """Derive a stable, filesystem-safe ID from a job source."""
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", source.rsplit("/", 1)[-1]).strip("-")[:40]
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:8]
+    return f"{slug}-{digest}" if slug else digest
+
+
+def _parse_entry(entry: Dict[str, Any], base_dir: Path, line: int) -> BatchJob:
+    url = (entry.get("url") or "").strip()
+    file = (entry.get("file") or "").strip()
+    if bool(url) == bool(file):
+        raise ValidationError(
+            f"Manifest entry {line} must have exactly one of 'url' or 'file'",
+            details=str(entry),
+        )
+
+    if url:
+        source, is_url = url, True
+    else:
+        path = Path(file)
+        source, is_url = str(path if path.is_absolute() else base_dir / path), False
+
+    job_id = (entry.get("id") or "").strip() or _make_job_id(url or file)
+    return BatchJob(job_id=job_id, source=source, is_url=is_url)
+
+
+def load_manifest(path: Path) -> List[BatchJob]:
+    """Load a JSONL or CSV manifest of job URLs and job description files.
+
+    Each entry has either a ``url`` or a ``file`` (relative paths resolve
+    against the manifest's directory) and an optional ``id``.
+    """
+    path = Path(path)
+    base_dir = path.parent
+
+    if path.suffix.lower() == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            entries = list(csv.DictReader(f))
+    else:
+        entries = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entries.append(json.loads(line))
+
+    jobs = [_parse_entry(entry, base_dir, i) for i, entry in enumerate(entries, 1)]
+
+    seen = set()
+    for job in jobs:
+        if job.job_id in seen:
+            raise ValidationError(f"Duplicate job id in manifest: {job.job_id}")
+        seen.add(job.job_id)
+    return jobs
+
+
+def load_job_description(job: BatchJob) -> JobDescription:
+    """Fetch or read the job description for a batch job."""
+    if job.is_url:
+        return extract_job_description(job.source)
+    return extract_job_description(Path(job.source).read_text(encoding="utf-8"))
+
+
+def is_finished(output_dir: Path, job: BatchJob) -> bool:
+    """Check whether a job completed in a previous run."""
+    return (Path(output_dir) / job.job_id / RESULT_FILE).exists()
+
+
+def _write_outputs(job_dir: Path, result: Dict[str, Any], batch_result: BatchResult) -> None:
+    job_dir.mkdir(parents=True, exist_ok=True)
+    for doc in result.get("generated_documents", []):
+        (job_dir / f"{doc.document_type}.txt").write_text(doc.content, encoding="utf-8")
+    if result.get("analysis"):
+        (job_dir / "analysis.md").write_text(result["analysis"], encoding="utf-8")
+
+    # Write the completion marker atomically, after everything else
+    tmp_path = job_dir / f"{RESULT_FILE}.tmp"
+    tmp_path.write_text(json.dumps(asdict(batch_result), indent=2), encoding="utf-8")
+    tmp_path.replace(job_dir / RESULT_FILE)
+
+
+async def run_batch(
+    jobs: List[BatchJob],
+    agent: Any,
+    user_profile: UserProfile,
+    user_preferences: UserPreferences,
+    output_dir: Path,
+    workers: int = 2,
+    use_analysis: bool = False,
+    on_result: Optional[Callable[[BatchResult], None]] = None,
+) -> List[BatchResult]:
+    """Run the application pipeline for every job with a bounded worker pool.
+
+    Jobs already finished in ``output_dir`` are skipped, so an interrupted
+    batch can be resumed by re-running it. Results keep manifest order.
+    LLM calls are queued at batch priority, behind interactive requests.
+    Job postings given by URL are fetched concurrently from the start, so
+    each job waits only for its own page; a job's ``seconds`` include the
+    time spent fetching and parsing it.
+    """
+    output_dir = Path(output_dir)
+    semaphore = asyncio.Semaphore(workers)
+    
+    async def timed(extraction: Awaitable[Dict[str, Any]]) -> Tuple[Dict[str, Any], float]:
+        started = time.perf_counter()
+        page = await extraction
+        return page, time.perf_counter() - started
+    
+    urls = list(dict.fromkeys(
+        job.source for job in jobs if job.is_url and not is_finished(output_dir, job)
+    ))
+    pages = {
+        url: asyncio.ensure_future(timed(extraction))
+        for url, extraction in zip(urls, job_description_extractions(urls) if urls else [])
+    }
+
+    async def process(job: BatchJob) -> BatchResult:
+        if is_finished(output_dir, job):
+            batch_result = BatchResult(job_id=job.job_id, status="skipped")
+        else:
+            async with semaphore:
+                with request_context(BATCH, caller="batch"):
+                    batch_result = await _process_job(job)
+        if on_result:
+            on_result(batch_result)
+        return batch_result
+
+    async def _process_job(job: BatchJob) -> BatchResult:
+        started = time.perf_counter()
+        try:
+            if job.is_url:
+                page, fetch_seconds = await pages[job.source]
+                # Count the fetch itself, not time the page sat ready for a worker
+                started = time.perf_counter() - fetch_seconds
+                if page.get("error"):
+                    raise RuntimeError(f"Could not fetch job posting: {page['error']}")
+                job_description = job_description_from_data(page)
+            else:
+                job_description = await asyncio.to_thread(load_job_description, job)
+            result = await agent.process_application(
+                job_description, user_profile, user_preferences, use_analysis=use_analysis
+            )
+            if result.get("error"):
+                raise RuntimeError(result["error"])
+
+            batch_result = BatchResult(
+                job_id=job.job_id,
+                status="done",
+                seconds=time.perf_counter() - started,
+                title=job_description.title,
+                company=job_description.company,
+                timings=result.get("timings", {}),
+            )
+            _write_outputs(output_dir / job.job_id, result, batch_result)
+            return batch_result
+
+        except Exception as e:
+            logger.error(f"Batch job {job.job_id} failed: {e}")
+            return BatchResult(
+                job_id=job.job_id,
+                status="failed",
+                seconds=time.perf_counter() - started,
+                error=str(e),
+            )
+
+    return list(await asyncio.gather(*(process(job) for job in jobs)))
+
+
+def write_summary(output_dir: Path, results: List[BatchResult]) -> Path:
+    """Write a machine-readable summary of a batch run."""
+    path = Path(output_dir) / "batch_summary.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps([asdict(result) for result in results], indent=2), encoding="utf-8"
+    )
+    return path
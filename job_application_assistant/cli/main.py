@@ -3,7 +3,7 @@
 import asyncio
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 import logging
 
 try:
@@ -13,16 +13,21 @@ try:
     from rich.panel import Panel
     from rich.markdown import Markdown
     from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.live import Live
+    from rich.text import Text
+    from rich.table import Table
 except ImportError:
     print("Required packages not installed. Please run: pip install -r requirements.txt")
     sys.exit(1)
 
 from job_application_assistant.core.config import get_settings
+from job_application_assistant.core.tracing import load_spans, serve_metrics, summarize
 from job_application_assistant.models.data_models import JobDescription, UserProfile, UserPreferences
 from job_application_assistant.agents.job_application_agent import JobApplicationAgent
 from job_application_assistant.agents.interview_prep_agent import InterviewPreparationAgent
 from job_application_assistant.tools.document_processor import process_cv_file, extract_job_description
 from job_application_assistant.utils.streamlit_helpers import get_model_info
+from job_application_assistant.cli.batch import BatchResult, load_manifest, run_batch, write_summary
 
 # Initialize components
 app = typer.Typer(help="Job Application & Interview Preparation Assistant")
@@ -202,48 +207,63 @@ def collect_user_preferences(job_desc: JobDescription) -> UserPreferences:
 async def run_job_application_workflow(
     job_desc: JobDescription,
     user_profile: UserProfile,
-    user_preferences: UserPreferences
+    user_preferences: UserPreferences,
+    use_analysis: bool = False,
+    use_cache: bool = True
 ):
     """Run the job application workflow."""
     console.print("\n[bold green]🚀 Generating your application materials...[/bold green]\n")
     
-    agent = JobApplicationAgent()
+    agent = JobApplicationAgent(use_cache=use_cache)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task("Processing application...", total=1)
-        
-        result = await agent.process_application(
+    # Render each document as its tokens arrive
+    contents: Dict[str, str] = {}
+    result: Dict[str, Any] = {}
+    live: Optional[Live] = None
+    title = ""
+    try:
+        async for document_type, chunk in agent.stream_application(
             job_description=job_desc,
             user_profile=user_profile,
-            user_preferences=user_preferences
-        )
-        
-        progress.update(task, completed=1)
-    
-    if result.get("error"):
-        console.print(f"[red]❌ Error: {result['error']}[/red]")
+            user_preferences=user_preferences,
+            use_analysis=use_analysis,
+            result=result
+        ):
+            if document_type not in contents:
+                if live:
+                    live.stop()
+                    console.print()
+                contents[document_type] = ""
+                title = agent.make_document(document_type, job_desc, "").title
+                live = Live(console=console, vertical_overflow="visible")
+                live.start()
+            
+            contents[document_type] += chunk
+            live.update(Panel(
+                Text(contents[document_type]),
+                title=f"📄 {title}",
+                border_style="green"
+            ))
+    except Exception as e:
+        if live:
+            live.stop()
+        console.print(f"[red]❌ Error: {result.get('error') or f'Error processing application: {e}'}[/red]")
         return
     
-    # Display generated documents
-    for doc in result.get("generated_documents", []):
-        console.print(Panel(
-            doc.content,
-            title=f"📄 {doc.title}",
-            border_style="green"
-        ))
+    if live:
+        live.stop()
         console.print()
     
+    logger.debug(f"Application step timings: {result['timings']}")
+    documents = result["generated_documents"]
+    
     # Save documents
     save_docs = Confirm.ask("Would you like to save these documents to files?")
     if save_docs:
         output_dir = Path("output")
         output_dir.mkdir(exist_ok=True)
         
-        for doc in result.get("generated_documents", []):
+        for doc in documents:
             filename = f"{doc.document_type}_{job_desc.company}_{job_desc.title}.txt"
             filename = "".join(c for c in filename if c.isalnum() or c in "._- ")
             
@@ -256,12 +276,14 @@ async def run_job_application_workflow(
 
 async def run_interview_preparation(
     job_desc: JobDescription,
-    user_profile: UserProfile
+    user_profile: UserProfile,
+    use_cache: bool = True,
+    structured: Optional[bool] = None
 ):
     """Run the interview preparation workflow."""
     console.print("\n[bold blue]🎯 Preparing your interview materials...[/bold blue]\n")
     
-    agent = InterviewPreparationAgent()
+    agent = InterviewPreparationAgent(use_cache=use_cache)
     
     with Progress(
         SpinnerColumn(),
@@ -272,7 +294,8 @@ async def run_interview_preparation(
         
         result = await agent.prepare_for_interview(
             job_description=job_desc,
-            user_profile=user_profile
+            user_profile=user_profile,
+            structured=structured
         )
         
         progress.update(task, completed=1)
@@ -286,6 +309,9 @@ async def run_interview_preparation(
         console.print("[red]❌ No interview preparation materials generated[/red]")
         return
     
+    for section, error in result.get("errors", {}).items():
+        console.print(f"[yellow]⚠️ Could not generate {section.replace('_', ' ')}: {error}[/yellow]")
+    
     # Display preparation materials
     console.print(Panel(
         "\n".join(f"• {item}" for item in prep.confidence_checklist),
@@ -315,7 +341,13 @@ async def run_interview_preparation(
 @app.command()
 def apply(
     job_url: Optional[str] = typer.Option(None, help="Job posting URL"),
-    cv_path: Optional[str] = typer.Option(None, help="Path to CV/resume file")
+    cv_path: Optional[str] = typer.Option(None, help="Path to CV/resume file"),
+    use_analysis: bool = typer.Option(
+        False, "--use-analysis", help="Feed the job analysis into the letters (slower)"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the LLM response cache"
+    )
 ):
     """Create a job application with personalized documents."""
     display_welcome()
@@ -328,13 +360,16 @@ def apply(
         
         # Run application workflow
         asyncio.run(run_job_application_workflow(
-            job_desc, user_profile, user_preferences
+            job_desc, user_profile, user_preferences, use_analysis,
+            use_cache=not no_cache
         ))
         
         # Ask about interview preparation
         prep_interview = Confirm.ask("\nWould you like to prepare for the interview?")
         if prep_interview:
-            asyncio.run(run_interview_preparation(job_desc, user_profile))
+            asyncio.run(run_interview_preparation(
+                job_desc, user_profile, use_cache=not no_cache
+            ))
         
         console.print("\n[bold green]🎉 All done! Good luck with your application![/bold green]")
         
@@ -348,7 +383,15 @@ def apply(
 @app.command()
 def interview(
     job_url: Optional[str] = typer.Option(None, help="Job posting URL"),
-    cv_path: Optional[str] = typer.Option(None, help="Path to CV/resume file")
+    cv_path: Optional[str] = typer.Option(None, help="Path to CV/resume file"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the LLM response cache"
+    ),
+    structured: Optional[bool] = typer.Option(
+        None, "--structured/--per-section",
+        help="Generate all sections in one JSON response, or one response per section "
+             "(default from JOB_ASSISTANT_INTERVIEW_PREP_STRUCTURED)"
+    )
 ):
     """Prepare for a job interview."""
     display_welcome()
@@ -357,7 +400,9 @@ def interview(
         user_profile = collect_user_profile()
         job_desc = collect_job_description()
         
-        asyncio.run(run_interview_preparation(job_desc, user_profile))
+        asyncio.run(run_interview_preparation(
+            job_desc, user_profile, use_cache=not no_cache, structured=structured
+        ))
         
         console.print("\n[bold green]🎉 Interview preparation complete! You've got this![/bold green]")
         
@@ -368,6 +413,88 @@ def interview(
         logger.exception("Unexpected error in interview command")
 
 
+@app.command("apply-batch")
+def apply_batch(
+    manifest: Path = typer.Argument(..., help="JSONL or CSV manifest with 'url' or 'file' per job"),
+    profile: Path = typer.Option(..., "--profile", help="User profile JSON file"),
+    preferences: Path = typer.Option(..., "--preferences", help="User preferences JSON file"),
+    output_dir: Path = typer.Option(Path("output") / "batch", "--output", help="Output directory"),
+    workers: int = typer.Option(2, "--workers", min=1, help="Jobs processed concurrently"),
+    use_analysis: bool = typer.Option(
+        False, "--use-analysis", help="Feed the job analysis into the letters (slower)"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the LLM response cache"
+    )
+):
+    """Create applications for every job in a manifest. Re-running resumes unfinished jobs."""
+    try:
+        jobs = load_manifest(manifest)
+        user_profile = UserProfile.model_validate_json(profile.read_text(encoding="utf-8"))
+        user_preferences = UserPreferences.model_validate_json(
+            preferences.read_text(encoding="utf-8")
+        )
+    except Exception as e:
+        console.print(f"[red]❌ Could not load batch inputs: {e}[/red]")
+        raise typer.Exit(1)
+    
+    console.print(f"\n[bold green]🚀 Processing {len(jobs)} jobs with {workers} workers...[/bold green]\n")
+    
+    agent = JobApplicationAgent(use_cache=not no_cache)
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    ) as progress:
+        task = progress.add_task("Processing jobs...", total=len(jobs))
+        
+        def on_result(result: BatchResult):
+            progress.advance(task)
+            if result.status == "failed":
+                progress.console.print(f"[red]❌ {result.job_id}: {result.error}[/red]")
+        
+        results = asyncio.run(run_batch(
+            jobs,
+            agent,
+            user_profile,
+            user_preferences,
+            output_dir,
+            workers=workers,
+            use_analysis=use_analysis,
+            on_result=on_result
+        ))
+    
+    summary_path = write_summary(output_dir, results)
+    
+    table = Table(title="Batch Summary", header_style="bold magenta")
+    table.add_column("Job", style="cyan")
+    table.add_column("Status")
+    table.add_column("Role")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Error", style="red")
+    
+    status_styles = {"done": "green", "skipped": "dim", "failed": "red"}
+    for result in results:
+        role = f"{result.title} at {result.company}" if result.title else ""
+        table.add_row(
+            result.job_id,
+            f"[{status_styles[result.status]}]{result.status}[/]",
+            role,
+            f"{result.seconds:.1f}" if result.status != "skipped" else "",
+            result.error or ""
+        )
+    console.print(table)
+    
+    counts = {status: sum(r.status == status for r in results) for status in status_styles}
+    console.print(
+        f"Done: {counts['done']}, skipped: {counts['skipped']}, failed: {counts['failed']}. "
+        f"Summary written to {summary_path}"
+    )
+    if counts["failed"]:
+        raise typer.Exit(1)
+
+
 @app.command()
 def info():
     """Display system information."""
@@ -384,6 +511,72 @@ def info():
     """
     
     console.print(Panel(Markdown(info_text), title="System Info", border_style="blue"))
+    _print_trace_summary()
+
+
+def _print_trace_summary() -> None:
+    """Summarize recent LLM call traces per agent step."""
+    console.print()
+    console.print("⏱️  [bold blue]Recent LLM Calls[/bold blue]")
+    
+    if not settings.tracing_enabled:
+        console.print("Tracing is disabled (JOB_ASSISTANT_TRACING_ENABLED=false)")
+        return
+    
+    summary = summarize(load_spans(settings.trace_path))
+    if not summary:
+        console.print(f"No traces recorded yet in {settings.trace_path}")
+        return
+    
+    def fmt(value: Optional[float], spec: str) -> str:
+        return "-" if value is None else format(value, spec)
+    
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Step", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("p50 (s)", justify="right")
+    table.add_column("p95 (s)", justify="right")
+    table.add_column("TTFT (s)", justify="right")
+    table.add_column("Tokens/s", justify="right")
+    table.add_column("Cache hits", justify="right")
+    table.add_column("Fallbacks", justify="right")
+    table.add_column("Errors", justify="right")
+    table.add_column("Models")
+    
+    for row in summary:
+        table.add_row(
+            f"{row['agent']}.{row['step']}",
+            str(row["calls"]),
+            fmt(row["p50_seconds"], ".2f"),
+            fmt(row["p95_seconds"], ".2f"),
+            fmt(row["mean_ttft"], ".2f"),
+            fmt(row["tokens_per_second"], ".1f"),
+            fmt(row["cache_hit_rate"], ".0%"),
+            str(row["fallbacks"]),
+            str(row["errors"]),
+            ", ".join(row["models"]),
+        )
+    
+    console.print(table)
+    console.print(f"Traces: {settings.trace_path}")
+
+
+@app.command()
+def metrics(
+    host: str = typer.Option("127.0.0.1", "--host", help="Host to bind to"),
+    port: int = typer.Option(9464, "--port", help="Port to bind to"),
+):
+    """Serve LLM call traces as Prometheus metrics at /metrics."""
+    try:
+        server = serve_metrics(settings.trace_path, host=host, port=port)
+        console.print(f"📈 Serving metrics from {settings.trace_path}")
+        console.print(f"Scrape http://{host}:{port}/metrics")
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\n👋 Metrics endpoint stopped")
+    except Exception as e:
+        console.print(f"❌ Error serving metrics: {e}", style="red")
+        raise typer.Exit(1)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,13 @@
 """Core package for job application assistant."""
 
+from .cache import ResponseCache, get_response_cache
 from .config import Settings
 from .exceptions import JobAssistantError, LLMError, DocumentProcessingError
 from .llm import LLMManager
+from .http import get_async_http_client, get_http_client
 from .logging import setup_logging
+from .ollama_client import OllamaMetadataClient, get_ollama_client
+from .tracing import Span, Tracer, get_tracer
 
 __all__ = [
     "Settings",
@@ -12,4 +16,13 @@ __all__ = [
     "DocumentProcessingError",
     "LLMManager",
     "setup_logging",
+    "ResponseCache",
+    "get_response_cache",
+    "OllamaMetadataClient",
+    "get_ollama_client",
+    "get_http_client",
+    "get_async_http_client",
+    "Span",
+    "Tracer",
+    "get_tracer",
 ]
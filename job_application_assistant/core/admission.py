@@ -0,0 +1,284 @@
+"""Admission control for LLM calls: a rate limit and a priority queue."""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, Optional, Tuple
+
+from .config import Settings
+from .exceptions import LLMError
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# Request priorities, lowest value admitted first
+INTERACTIVE = 0
+BATCH = 1
+PRIORITY_NAMES = {INTERACTIVE: "interactive", BATCH: "batch"}
+
+_priority: ContextVar[int] = ContextVar("llm_request_priority", default=INTERACTIVE)
+_caller: ContextVar[str] = ContextVar("llm_request_caller", default="default")
+_queue_timeout: ContextVar[Optional[float]] = ContextVar("llm_request_queue_timeout", default=None)
+
+
+@contextmanager
+def request_context(
+    priority: int = INTERACTIVE,
+    caller: str = "default",
+    queue_timeout: Optional[float] = None,
+) -> Iterator[None]:
+    """Set the priority and caller of LLM calls made within the block.
+
+    With a ``queue_timeout``, calls give up after queueing that many
+    seconds; the web app sets one so a busy server fails fast, while the
+    CLI and batch runs wait their turn. Tasks started inside the block
+    inherit the context.
+    """
+    priority_token = _priority.set(priority)
+    caller_token = _caller.set(caller)
+    timeout_token = _queue_timeout.set(queue_timeout)
+    try:
+        yield
+    finally:
+        _queue_timeout.reset(timeout_token)
+        _caller.reset(caller_token)
+        _priority.reset(priority_token)
+
+
+class TokenBucket:
+    """Token bucket refilling at ``rate`` tokens per second up to ``capacity``.
+
+    Not thread-safe; ``AdmissionController`` guards it with its lock.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def try_take(self) -> float:
+        """Take a token if one is available, else return seconds until one is."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def refund(self) -> None:
+        """Return a token taken for a call that did not run."""
+        self._tokens = min(self.capacity, self._tokens + 1)
+
+
+@dataclass
+class _Waiter:
+    loop: asyncio.AbstractEventLoop
+    future: "asyncio.Future[None]"
+    priority: int
+    caller: str
+    enqueued: float
+    granted: bool = False
+
+
+def _grant(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdmissionController:
+    """Admits LLM calls in priority order under a rate and concurrency limit.
+
+    Waiting calls are queued per priority and, within a priority, per
+    caller; callers are served round-robin so one caller's burst cannot
+    starve another. A call is admitted once a token is available in the
+    rate limiter and fewer than ``max_in_flight`` calls are running.
+
+    The controller is shared by every event loop in the process (the web
+    app runs each request on its own loop), so it is guarded by a thread
+    lock and wakes waiters through their own loop.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        max_in_flight: int,
+        burst: int = 1,
+    ):
+        self.bucket = TokenBucket(requests_per_minute / 60.0, capacity=max(1, burst))
+        self.max_in_flight = max_in_flight
+        self._queues: Dict[int, "OrderedDict[str, Deque[_Waiter]]"] = defaultdict(OrderedDict)
+        self._in_flight = 0
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._admitted: Dict[int, int] = defaultdict(int)
+        self._timed_out: Dict[int, int] = defaultdict(int)
+        self._wait_seconds: Dict[int, float] = defaultdict(float)
+
+    async def acquire(self, priority: Optional[int] = None, caller: Optional[str] = None) -> float:
+        """Wait until a call may run; returns the seconds spent queued.
+
+        Priority and caller default to those set with ``request_context``.
+        Calls give up with an ``LLMError`` after the context's
+        ``queue_timeout``, and by default wait indefinitely.
+        """
+        priority = _priority.get() if priority is None else priority
+        caller = _caller.get() if caller is None else caller
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(loop, loop.create_future(), priority, caller, time.monotonic())
+
+        with self._lock:
+            self._queues[priority].setdefault(caller, deque()).append(waiter)
+            self._dispatch()
+
+        timeout = _queue_timeout.get()
+        try:
+            await asyncio.wait_for(waiter.future, timeout)
+        except asyncio.TimeoutError:
+            self._abandon(waiter)
+            with self._lock:
+                self._timed_out[priority] += 1
+            raise LLMError(
+                "The assistant is busy, please try again shortly",
+                details=f"Waited over {timeout:.0f}s for an LLM request slot",
+            )
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        return time.monotonic() - waiter.enqueued
+
+    def release(self) -> None:
+        """Free the slot of a finished call."""
+        with self._lock:
+            self._in_flight -= 1
+            self._dispatch()
+
+    @asynccontextmanager
+    async def admit(self, priority: Optional[int] = None, caller: Optional[str] = None) -> AsyncIterator[None]:
+        """Hold an admission slot for the duration of the block."""
+        await self.acquire(priority, caller)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """Drop a waiter that stopped waiting, or free its slot if it won the race."""
+        with self._lock:
+            if waiter.granted:
+                self._in_flight -= 1
+                self._dispatch()
+                return
+            callers = self._queues[waiter.priority]
+            queue = callers.get(waiter.caller)
+            if queue is not None and waiter in queue:
+                queue.remove(waiter)
+                if not queue:
+                    del callers[waiter.caller]
+
+    def _next_queue(self) -> Optional[Tuple[int, str]]:
+        for priority in sorted(self._queues):
+            callers = self._queues[priority]
+            if callers:
+                return priority, next(iter(callers))
+        return None
+
+    def _dispatch(self) -> None:
+        """Admit waiters while there is capacity. Call with the lock held."""
+        while self._in_flight < self.max_in_flight:
+            head = self._next_queue()
+            if head is None:
+                return
+            priority, caller = head
+            if self._queues[priority][caller][0].loop.is_closed():
+                self._pop(priority, caller)  # the waiter's loop is gone
+                continue
+            wait = self.bucket.try_take()
+            if wait > 0:
+                self._schedule(wait)
+                return
+
+            waiter = self._pop(priority, caller)
+            try:
+                waiter.loop.call_soon_threadsafe(_grant, waiter.future)
+            except RuntimeError:
+                self.bucket.refund()  # the loop closed since the check
+                continue
+            waiter.granted = True
+            self._in_flight += 1
+            self._admitted[priority] += 1
+            self._wait_seconds[priority] += time.monotonic() - waiter.enqueued
+
+    def _pop(self, priority: int, caller: str) -> _Waiter:
+        """Remove the caller's oldest waiter, moving the caller to the back."""
+        callers = self._queues[priority]
+        waiter = callers[caller].popleft()
+        if callers[caller]:
+            callers.move_to_end(caller)  # round-robin between callers
+        else:
+            del callers[caller]
+        return waiter
+
+    def _schedule(self, delay: float) -> None:
+        if self._timer is not None and self._timer.is_alive():
+            return
+        self._timer = threading.Timer(delay, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._dispatch()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, running calls and wait statistics per priority."""
+        with self._lock:
+            def by_priority(values: Dict[int, Any]) -> Dict[str, Any]:
+                merged = {p: 0 for p in PRIORITY_NAMES}
+                merged.update(values)
+                return {PRIORITY_NAMES.get(p, str(p)): v for p, v in sorted(merged.items())}
+
+            depth = {p: sum(len(q) for q in callers.values()) for p, callers in self._queues.items()}
+            return {
+                "in_flight": self._in_flight,
+                "max_in_flight": self.max_in_flight,
+                "queue_depth": by_priority(depth),
+                "admitted": by_priority(self._admitted),
+                "timed_out": by_priority(self._timed_out),
+                "mean_wait_seconds": by_priority({
+                    p: self._wait_seconds[p] / count for p, count in self._admitted.items() if count
+                }),
+            }
+
+
+# Shared controllers, one per limit configuration
+_controllers: Dict[Tuple[Any, ...], AdmissionController] = {}
+_controllers_lock = threading.Lock()
+
+
+def get_admission_controller(settings: Settings) -> AdmissionController:
+    """Get the process-wide admission controller for the configured limits.
+
+    Calls may run on every configured Ollama node at once, so the
+    concurrency limit is ``llm_max_concurrency`` per node.
+    """
+    max_in_flight = settings.llm_max_concurrency * len(settings.ollama_endpoint_urls)
+    key = (
+        settings.max_requests_per_minute,
+        settings.llm_rate_burst,
+        max_in_flight,
+    )
+    with _controllers_lock:
+        if key not in _controllers:
+            _controllers[key] = AdmissionController(
+                settings.max_requests_per_minute,
+                max_in_flight=max_in_flight,
+                burst=settings.llm_rate_burst,
+            )
+        return _controllers[key]
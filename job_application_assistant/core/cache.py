@@ -0,0 +1,163 @@
+"""Persistent, content-addressed cache for LLM responses."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from .config import Settings
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ResponseCache:
+    """SQLite-backed response cache with TTL and size-bounded LRU eviction.
+
+    Entries are keyed on a hash of everything that determines a generation,
+    so a changed prompt, model or template simply misses. A connection is
+    opened per operation, which keeps the cache safe to share between the
+    threads Streamlit runs event loops in.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: int, max_size_bytes: int):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.path), timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        temperature: Optional[float],
+        prompt: str,
+        template_version: str,
+        output_format: Optional[Any] = None,
+    ) -> str:
+        """Build the cache key for a generation."""
+        fields = {
+            "model": model,
+            "temperature": temperature,
+            "prompt": prompt,
+            "template_version": template_version,
+        }
+        if output_format is not None:
+            fields["output_format"] = output_format
+        payload = json.dumps(fields, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response, or None if missing or expired."""
+        now = time.time()
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                value, created_at = row
+                if now - created_at > self.ttl_seconds:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    return None
+                conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+                return value
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response and evict least recently used entries over the size bound."""
+        now = time.time()
+        size = len(value.encode("utf-8"))
+        if size > self.max_size_bytes:
+            return
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (key, value, size, now, now),
+                )
+                conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?",
+                    (now - self.ttl_seconds,),
+                )
+                self._evict(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        evicted = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall():
+            if total <= self.max_size_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        logger.debug(f"Evicted {len(evicted)} cached responses")
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, int]:
+        """Get the number of entries and their total size."""
+        with self._connect() as conn:
+            count, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {"entries": count, "size_bytes": size}
+
+
+# Shared cache instances, one per database file
+_response_caches: Dict[Path, ResponseCache] = {}
+
+
+def get_response_cache(settings: Settings) -> ResponseCache:
+    """Get the shared response cache under ``settings.cache_dir``."""
+    path = settings.cache_dir / "llm_responses.sqlite3"
+    if path not in _response_caches:
+        _response_caches[path] = ResponseCache(
+            path,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+            max_size_bytes=settings.llm_cache_max_size_mb * 1024 * 1024,
+        )
+    return _response_caches[path]
@@ -2,12 +2,13 @@
 
 import os
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .exceptions import ConfigurationError
 from .logging import get_logger
+from .ollama_client import OllamaMetadataClient, get_ollama_client
 
 logger = get_logger(__name__)
 
@@ -54,6 +55,17 @@ class Settings(BaseSettings):
     # Ollama settings
     ollama_base_url: str = Field(default="http://localhost:11434")
     ollama_timeout: int = Field(default=60, gt=0)
+    ollama_metadata_ttl_seconds: float = Field(default=10.0, ge=0)
+    # Further Ollama nodes to balance requests across, alongside ollama_base_url
+    ollama_endpoints: List[str] = Field(default_factory=list)
+    llm_load_balancing: Literal["latency", "least_outstanding"] = Field(default="latency")
+    llm_model_load_seconds: float = Field(default=10.0, ge=0)
+    llm_affinity_seconds: float = Field(default=300.0, ge=0)
+    # How long Ollama keeps a model, and the KV cache of the shared prompt
+    # prefix, loaded after a request ("30m"; a negative duration for ever)
+    ollama_keep_alive: str = Field(default="30m")
+    # Context window; must fit the shared prefix and the longest task prompt
+    ollama_num_ctx: Optional[int] = Field(default=None, gt=0)
     
     # Model configurations
     primary_model_name: str = Field(default="llama3.1:8b")
@@ -62,6 +74,9 @@ class Settings(BaseSettings):
     )
     model_temperature: float = Field(default=0.7, ge=0.0, le=2.0)
     model_max_tokens: Optional[int] = Field(default=None)
+    llm_lazy_init: bool = Field(default=True)
+    llm_health_ttl_seconds: int = Field(default=3600, gt=0)
+    llm_unhealthy_retry_seconds: int = Field(default=60, gt=0)
     
     # Web interface settings
     streamlit_host: str = Field(default="localhost")
@@ -74,9 +89,53 @@ class Settings(BaseSettings):
         default=[".pdf", ".docx", ".txt", ".md"]
     )
     
+    # Document processing
+    pdf_parallel_page_threshold: int = Field(default=20, gt=0)
+    document_cache_enabled: bool = Field(default=True)
+    skills_taxonomy_file: Optional[Path] = Field(default=None)
+    # Job page fetching: largest page accepted, concurrent fetches per host,
+    # HTML parsing worker processes (default: CPU count), the BeautifulSoup
+    # parser (default: lxml when installed, else html.parser), and the
+    # on-disk cache of fetched pages, revalidated on every fetch
+    job_page_max_mb: float = Field(default=5.0, gt=0)
+    job_fetch_per_host: int = Field(default=4, gt=0)
+    html_parse_workers: Optional[int] = Field(default=None, gt=0)
+    html_parser: Optional[str] = Field(default=None)
+    job_page_cache_enabled: bool = Field(default=True)
+    
     # Rate limiting and performance
     max_requests_per_minute: int = Field(default=30, gt=0)
+    llm_rate_burst: int = Field(default=5, gt=0)
     request_timeout: int = Field(default=30, gt=0)
+    llm_max_concurrency: int = Field(default=4, gt=0)
+    
+    # Per-model circuit breakers
+    llm_breaker_failure_rate: float = Field(default=0.5, gt=0.0, le=1.0)
+    llm_breaker_window: int = Field(default=10, gt=0)
+    llm_breaker_min_calls: int = Field(default=4, gt=0)
+    llm_breaker_slow_call_seconds: float = Field(default=45.0, gt=0)
+    llm_breaker_open_seconds: float = Field(default=30.0, gt=0)
+    
+    # Pooled HTTP client
+    http_max_connections: int = Field(default=20, gt=0)
+    http_max_keepalive_connections: int = Field(default=10, ge=0)
+    http_keepalive_expiry: float = Field(default=30.0, ge=0)
+    http_enable_http2: bool = Field(default=True)
+    
+    # LLM response cache
+    llm_cache_enabled: bool = Field(default=True)
+    llm_cache_ttl_seconds: int = Field(default=7 * 24 * 3600, gt=0)
+    llm_cache_max_size_mb: int = Field(default=50, gt=0)
+    
+    # Tracing
+    tracing_enabled: bool = Field(default=True)
+    trace_file: Optional[Path] = Field(default=None)
+    trace_max_file_mb: int = Field(default=20, gt=0)
+    
+    # Interview preparation: one JSON generation for all sections instead of
+    # one generation per section, and how often to re-ask for invalid sections
+    interview_prep_structured: bool = Field(default=False)
+    interview_prep_structured_retries: int = Field(default=1, ge=0)
     
     # Content generation settings
     max_content_length: int = Field(default=5000, gt=0)
@@ -134,40 +193,54 @@ class Settings(BaseSettings):
             for name in self.fallback_model_names
         ]
     
+    @property
+    def trace_path(self) -> Path:
+        """Get the trace file, ``traces.jsonl`` in the logs directory by default."""
+        return self.trace_file or self.logs_dir / "traces.jsonl"
+    
+    @property
+    def ollama_client(self) -> OllamaMetadataClient:
+        """Get the shared, TTL-cached metadata client for the Ollama server."""
+        return get_ollama_client(
+            self.ollama_base_url,
+            ttl_seconds=self.ollama_metadata_ttl_seconds,
+        )
+    
+    @property
+    def ollama_endpoint_urls(self) -> List[str]:
+        """Get all Ollama nodes, the default ``ollama_base_url`` first."""
+        urls = []
+        for url in [self.ollama_base_url, *self.ollama_endpoints]:
+            url = url.rstrip("/")
+            if url not in urls:
+                urls.append(url)
+        return urls
+    
+    @property
+    def ollama_clients(self) -> List[OllamaMetadataClient]:
+        """Get the shared metadata clients for every Ollama node."""
+        return [
+            get_ollama_client(url, ttl_seconds=self.ollama_metadata_ttl_seconds)
+            for url in self.ollama_endpoint_urls
+        ]
+    
     @property
     def is_ollama_available(self) -> bool:
-        """Check if Ollama is available."""
-        try:
-            import requests
-            response = requests.get(
-                f"{self.ollama_base_url}/api/tags",
-                timeout=5
-            )
-            return response.status_code == 200
-        except Exception as e:
-            logger.debug(f"Ollama availability check failed: {e}")
-            return False
+        """Check if any Ollama node is available."""
+        return any(client.is_available() for client in self.ollama_clients)
     
     def get_available_models(self) -> List[str]:
-        """Get list of available Ollama models."""
-        if not self.is_ollama_available:
-            return []
-        
-        try:
-            import requests
-            response = requests.get(
-                f"{self.ollama_base_url}/api/tags",
-                timeout=self.ollama_timeout
-            )
-            if response.status_code == 200:
-                data = response.json()
-                models = [model["name"] for model in data.get("models", [])]
-                logger.debug(f"Available models: {models}")
-                return models
-        except Exception as e:
-            logger.warning(f"Failed to get available models: {e}")
-        
-        return []
+        """Get list of models available on any Ollama node."""
+        models: List[str] = []
+        for client in self.ollama_clients:
+            models.extend(name for name in client.list_models() if name not in models)
+        logger.debug(f"Available models: {models}")
+        return models
+    
+    def refresh_ollama_status(self) -> None:
+        """Discard cached Ollama metadata so the next check hits the servers."""
+        for client in self.ollama_clients:
+            client.invalidate()
     
     def get_system_status(self) -> Dict[str, Any]:
         """Get system status information."""
@@ -177,6 +250,7 @@ class Settings(BaseSettings):
             "debug_mode": self.debug,
             "ollama_available": self.is_ollama_available,
             "ollama_url": self.ollama_base_url,
+            "ollama_endpoints": self.ollama_endpoint_urls,
             "available_models": self.get_available_models(),
             "primary_model": self.primary_model_name,
             "fallback_models": self.fallback_model_names,
@@ -0,0 +1,185 @@
+"""Load balancing of LLM requests across a pool of Ollama nodes.
+
+Ranking reads each node's model listings from the metadata cache only;
+expired listings are re-fetched in worker threads by ``EndpointPool.refresh``
+(or ``refresh_async`` on the event loop), never while ranking.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from .config import Settings
+from .logging import get_logger
+from .ollama_client import OllamaMetadataClient
+
+logger = get_logger(__name__)
+
+LATENCY = "latency"
+LEAST_OUTSTANDING = "least_outstanding"
+
+
+class Endpoint:
+    """One Ollama node with its live load statistics."""
+
+    def __init__(self, client: OllamaMetadataClient):
+        self.client = client
+        self.url = client.base_url
+        self.outstanding = 0
+        self.latency: Optional[float] = None  # EWMA of request seconds
+        self.requests = 0
+        self.failures = 0
+        self._last_served: Dict[str, float] = {}  # model -> time.monotonic()
+        self._refreshing: Optional[Future] = None
+
+    def serves(self, model_name: str) -> bool:
+        """Check the node has a model pulled, from its cached model list."""
+        return model_name in self.client.cached_models()
+
+    def has_loaded(self, model_name: str, affinity_seconds: float) -> bool:
+        """Check whether a model is likely in the node's memory.
+
+        A model this process used recently is assumed still loaded;
+        otherwise the node's cached ``/api/ps`` listing decides.
+        """
+        last_served = self._last_served.get(model_name)
+        if last_served is not None and time.monotonic() - last_served < affinity_seconds:
+            return True
+        return model_name in self.client.cached_running_models()
+
+
+class EndpointPool:
+    """Routes each model's requests to the best node serving it.
+
+    With the ``latency`` strategy a node's score is its expected wait: the
+    EWMA request latency times the requests it would be serving, plus
+    ``model_load_seconds`` if the model is not loaded there. With
+    ``least_outstanding`` it is the number of outstanding requests, plus
+    one if the model is not loaded. Either way a node that already has the
+    model loaded is preferred until it is busier than loading the model
+    elsewhere would cost.
+    """
+
+    def __init__(
+        self,
+        endpoints: List[Endpoint],
+        strategy: str = LATENCY,
+        model_load_seconds: float = 10.0,
+        affinity_seconds: float = 300.0,
+        ewma_alpha: float = 0.3,
+    ):
+        if not endpoints:
+            raise ValueError("An endpoint pool needs at least one endpoint")
+        self.endpoints = endpoints
+        self.strategy = strategy
+        self.model_load_seconds = model_load_seconds
+        self.affinity_seconds = affinity_seconds
+        self.ewma_alpha = ewma_alpha
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=len(endpoints), thread_name_prefix="ollama-listings")
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "EndpointPool":
+        return cls(
+            [Endpoint(client) for client in settings.ollama_clients],
+            strategy=settings.llm_load_balancing,
+            model_load_seconds=settings.llm_model_load_seconds,
+            affinity_seconds=settings.llm_affinity_seconds,
+        )
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    @property
+    def default(self) -> Endpoint:
+        """The node at ``Settings.ollama_base_url``."""
+        return self.endpoints[0]
+
+    def _default_latency(self) -> float:
+        known = [e.latency for e in self.endpoints if e.latency is not None]
+        return sum(known) / len(known) if known else 1.0
+
+    def score(self, endpoint: Endpoint, model_name: str) -> float:
+        """Lower is better."""
+        loaded = endpoint.has_loaded(model_name, self.affinity_seconds)
+        if self.strategy == LEAST_OUTSTANDING:
+            return endpoint.outstanding + (0 if loaded else 1)
+        latency = endpoint.latency if endpoint.latency is not None else self._default_latency()
+        return (endpoint.outstanding + 1) * latency + (0 if loaded else self.model_load_seconds)
+
+    def _start_refresh(self, endpoint: Endpoint) -> Optional[Future]:
+        """Refresh a node's expired listings in a worker thread, once at a time."""
+        if not endpoint.client.listings_expired():
+            return None
+        with self._lock:
+            if endpoint._refreshing is None or endpoint._refreshing.done():
+                endpoint._refreshing = self._executor.submit(endpoint.client.refresh_listings)
+            return endpoint._refreshing
+
+    def refresh(self) -> None:
+        """Refresh expired node listings, waiting for them. For synchronous callers."""
+        for future in [self._start_refresh(e) for e in self.endpoints]:
+            if future is not None:
+                future.result()
+
+    async def refresh_async(self) -> None:
+        """Refresh expired node listings without blocking the event loop.
+
+        Nodes with listings from an earlier fetch keep being ranked on them
+        while they refresh in the background; only nodes never fetched
+        before are waited for.
+        """
+        waits = []
+        for endpoint in self.endpoints:
+            future = self._start_refresh(endpoint)
+            if future is not None and not endpoint.client.has_listings():
+                waits.append(asyncio.wrap_future(future))
+        if waits:
+            await asyncio.gather(*waits)
+
+    def rank(self, model_name: str) -> List[Endpoint]:
+        """Nodes serving a model, best first, from cached listings only."""
+        serving = [e for e in self.endpoints if e.serves(model_name)]
+        scored = [(self.score(e, model_name), e.outstanding, i, e) for i, e in enumerate(serving)]
+        return [endpoint for *_, endpoint in sorted(scored, key=lambda s: s[:3])]
+
+    @contextmanager
+    def track(self, endpoint: Endpoint, model_name: str) -> Iterator[None]:
+        """Count a request as outstanding on a node and record its latency."""
+        with self._lock:
+            endpoint.outstanding += 1
+        started = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            seconds = time.perf_counter() - started
+            with self._lock:
+                endpoint.outstanding -= 1
+                endpoint.requests += 1
+                if ok:
+                    endpoint._last_served[model_name] = time.monotonic()
+                    endpoint.latency = (
+                        seconds if endpoint.latency is None
+                        else self.ewma_alpha * seconds + (1 - self.ewma_alpha) * endpoint.latency
+                    )
+                else:
+                    endpoint.failures += 1
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Load statistics per node."""
+        with self._lock:
+            return [
+                {
+                    "url": e.url,
+                    "outstanding": e.outstanding,
+                    "latency": e.latency,
+                    "requests": e.requests,
+                    "failures": e.failures,
+                }
+                for e in self.endpoints
+            ]
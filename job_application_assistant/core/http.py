@@ -0,0 +1,77 @@
+"""Shared, connection-pooled HTTP clients."""
+
+import asyncio
+import importlib.util
+import threading
+import weakref
+from typing import Any, Dict, Optional
+
+import httpx
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+_sync_client: Optional[httpx.Client] = None
+_sync_lock = threading.Lock()
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _client_options() -> Dict[str, Any]:
+    """Build client options from the global settings."""
+    from .config import get_settings
+
+    settings = get_settings()
+    http2 = settings.http_enable_http2 and importlib.util.find_spec("h2") is not None
+    return {
+        "limits": httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        ),
+        "timeout": httpx.Timeout(settings.request_timeout),
+        "http2": http2,
+        "follow_redirects": True,
+    }
+
+
+def get_http_client() -> httpx.Client:
+    """Get the process-wide pooled synchronous HTTP client."""
+    global _sync_client
+    with _sync_lock:
+        if _sync_client is None or _sync_client.is_closed:
+            _sync_client = httpx.Client(**_client_options())
+            logger.debug("Created pooled HTTP client")
+        return _sync_client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the pooled asynchronous HTTP client for the running event loop.
+
+    Async connections cannot be shared between event loops, and Streamlit
+    runs a fresh loop per call, so one client is kept per loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _async_clients[loop] = httpx.AsyncClient(**_client_options())
+        logger.debug("Created pooled async HTTP client")
+    return client
+
+
+def close_http_clients() -> None:
+    """Close the synchronous client, releasing its pooled connections."""
+    global _sync_client
+    with _sync_lock:
+        if _sync_client is not None:
+            _sync_client.close()
+            _sync_client = None
+
+
+async def aclose_async_http_client() -> None:
+    """Close the async client bound to the running event loop, if any."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -1,16 +1,79 @@
 """LLM management with fallback support and health checking."""
 
 import asyncio
-from typing import List, Optional, Dict, Any, Union
+import json
+import time
+import weakref
+from pathlib import Path
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar,
+    Union
+)
 from langchain_ollama import ChatOllama
 from langchain_core.language_models import BaseLanguageModel
 
+from .admission import get_admission_controller
 from .config import Settings, ModelConfig
+from .endpoints import Endpoint, EndpointPool
 from .exceptions import LLMError
 from .logging import get_logger
+from .resilience import CLOSED, CircuitBreaker, is_model_failure
+from .tracing import Span, Tracer, TracingCallbackHandler, get_tracer
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+
+class ModelHealthStore:
+    """Models known to be healthy, persisted so restarts can skip re-probing.
+    
+    Only passed probes are kept. A failed probe may be a passing network
+    error, so it is never persisted and removes any stored entry.
+    """
+    
+    def __init__(self, path: Path, ttl_seconds: int):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable model health file {self.path}: {e}")
+            return {}
+    
+    @staticmethod
+    def _key(base_url: str, model_name: str) -> str:
+        return f"{base_url}|{model_name}"
+    
+    def get(self, base_url: str, model_name: str) -> Optional[bool]:
+        """Return True if stored healthy within the TTL, else None."""
+        entry = self._entries.get(self._key(base_url, model_name))
+        if not entry or not entry.get("healthy"):
+            return None
+        if time.time() - entry.get("checked_at", 0) > self.ttl_seconds:
+            return None
+        return True
+    
+    def set(self, base_url: str, model_name: str, healthy: bool) -> None:
+        """Record a health result and persist it."""
+        key = self._key(base_url, model_name)
+        if healthy:
+            self._entries[key] = {"healthy": True, "checked_at": time.time()}
+        elif self._entries.pop(key, None) is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self._entries, indent=2), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except Exception as e:
+            logger.debug(f"Failed to persist model health: {e}")
+
 
 class LLMManager:
     """Manages LLM instances with fallback support and health monitoring."""
@@ -20,31 +83,38 @@ class LLMManager:
         self._primary_llm: Optional[BaseLanguageModel] = None
         self._fallback_llms: List[BaseLanguageModel] = []
         self._model_health: Dict[str, bool] = {}
+        self._unhealthy_until: Dict[str, float] = {}  # model -> time.monotonic()
+        self._health_store = ModelHealthStore(
+            settings.cache_dir / "model_health.json",
+            ttl_seconds=settings.llm_health_ttl_seconds,
+        )
         self._initialized = False
+        self._limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.pool = EndpointPool.from_settings(settings)
+        self.admission = get_admission_controller(settings)
+        self._endpoint_llms: Dict[str, BaseLanguageModel] = {}
+        self.tracer: Optional[Tracer] = get_tracer(settings) if settings.tracing_enabled else None
+        self._tracing_handler = TracingCallbackHandler(self.tracer) if self.tracer else None
         
     async def initialize(self) -> None:
-        """Initialize LLM instances asynchronously."""
+        """Initialize LLM instances asynchronously.
+        
+        With ``Settings.llm_lazy_init`` (the default) no model is loaded or
+        tested here; each is health-checked on first use instead.
+        """
         if self._initialized:
             return
+        
+        if self.settings.llm_lazy_init:
+            self.initialize_lazily()
+            return
             
         logger.info("Initializing LLM manager...")
         
-        # Check Ollama availability
-        if not self.settings.is_ollama_available:
-            raise LLMError(
-                "Ollama is not available. Please ensure Ollama is installed and running.",
-                details="Visit https://ollama.ai/download for installation instructions"
-            )
-        
-        # Get available models
-        available_models = self.settings.get_available_models()
-        logger.info(f"Available models: {available_models}")
-        
-        if not available_models:
-            raise LLMError(
-                "No models available in Ollama",
-                details="Please download at least one model using 'ollama pull <model-name>'"
-            )
+        available_models = self._get_available_models()
         
         # Initialize primary model
         primary_model = self.settings.primary_model
@@ -74,29 +144,138 @@ class LLMManager:
         self._initialized = True
         logger.info("LLM manager initialization complete")
     
+    def initialize_lazily(self) -> None:
+        """Create LLM clients without loading or testing any model.
+        
+        Only the cheap model listing is fetched. Health is taken from the
+        persisted store when fresh, and otherwise probed on first use.
+        """
+        if self._initialized:
+            return
+        
+        available_models = self._get_available_models()
+        
+        primary_model = self.settings.primary_model
+        if primary_model.name in available_models:
+            self._primary_llm = self._build_llm(primary_model)
+        else:
+            logger.warning(f"Primary model {primary_model.name} not available")
+        
+        for model_config in self.settings.fallback_models:
+            if model_config.name in available_models:
+                self._fallback_llms.append(self._build_llm(model_config))
+        
+        for llm in self._all_llms():
+            model_name = getattr(llm, 'model', 'unknown')
+            known = self._health_store.get(self.settings.ollama_base_url, model_name)
+            if known is not None:
+                self._model_health[model_name] = known
+        
+        if not self._primary_llm and not self._fallback_llms:
+            raise LLMError(
+                "No configured LLM models are available",
+                details="Please download a configured model using 'ollama pull <model-name>'"
+            )
+        
+        self._initialized = True
+        logger.debug("LLM manager initialized lazily")
+    
+    def _get_available_models(self) -> List[str]:
+        """Check Ollama is reachable and return its models."""
+        if not self.settings.is_ollama_available:
+            raise LLMError(
+                "Ollama is not available. Please ensure Ollama is installed and running.",
+                details="Visit https://ollama.ai/download for installation instructions"
+            )
+        
+        available_models = self.settings.get_available_models()
+        logger.info(f"Available models: {available_models}")
+        
+        if not available_models:
+            raise LLMError(
+                "No models available in Ollama",
+                details="Please download at least one model using 'ollama pull <model-name>'"
+            )
+        return available_models
+    
+    def _all_llms(self) -> List[BaseLanguageModel]:
+        """Primary and fallback LLMs in preference order."""
+        return ([self._primary_llm] if self._primary_llm else []) + self._fallback_llms
+    
+    def _build_llm(
+        self, model_config: ModelConfig, base_url: Optional[str] = None
+    ) -> BaseLanguageModel:
+        """Build an LLM client without contacting the model."""
+        return ChatOllama(
+            model=model_config.name,
+            base_url=base_url or self.settings.ollama_base_url,
+            temperature=model_config.temperature,
+            timeout=model_config.timeout,
+            keep_alive=self.settings.ollama_keep_alive,
+            num_ctx=self.settings.ollama_num_ctx,
+        )
+    
+    def _record_health(self, model_name: str, healthy: bool) -> None:
+        """Record a health result; failures are only trusted for a short while.
+        
+        An unhealthy model is re-probed after ``llm_unhealthy_retry_seconds``.
+        Failures of a model in use are left to its circuit breaker.
+        """
+        self._model_health[model_name] = healthy
+        if healthy:
+            self._unhealthy_until.pop(model_name, None)
+        else:
+            self._unhealthy_until[model_name] = (
+                time.monotonic() + self.settings.llm_unhealthy_retry_seconds
+            )
+        self._health_store.set(self.settings.ollama_base_url, model_name, healthy)
+    
+    def _needs_probe(self, model_name: str) -> bool:
+        """Check whether a model is unchecked, or unhealthy long enough ago to retry."""
+        if model_name not in self._model_health:
+            return True
+        if self._model_health[model_name]:
+            return False
+        return time.monotonic() >= self._unhealthy_until.get(model_name, 0)
+    
+    def _probe_model(self, model_name: str) -> bool:
+        """Check a model exists via Ollama's metadata endpoint, without loading it.
+        
+        Blocks on HTTP; async code runs it in a worker thread.
+        """
+        client = self.settings.ollama_client
+        client.invalidate(model_name)
+        healthy = client.show_model(model_name) is not None
+        
+        if not healthy:
+            logger.warning(f"Model failed metadata probe: {model_name}")
+        self._record_health(model_name, healthy)
+        return healthy
+    
+    def _is_healthy(self, model_name: str) -> bool:
+        """Get model health, probing models not checked yet or due a retry."""
+        if self._needs_probe(model_name):
+            return self._probe_model(model_name)
+        return self._model_health[model_name]
+    
     async def _create_llm(self, model_config: ModelConfig) -> Optional[BaseLanguageModel]:
         """Create LLM instance from configuration."""
         try:
             if model_config.provider == "ollama":
-                llm = ChatOllama(
-                    model=model_config.name,
-                    base_url=self.settings.ollama_base_url,
-                    temperature=model_config.temperature,
-                    timeout=model_config.timeout,
-                )
+                llm = self._build_llm(model_config)
                 
                 # Test the model
                 if await self._test_model(llm, model_config.name):
-                    self._model_health[model_config.name] = True
+                    self._record_health(model_config.name, True)
                     logger.info(f"Successfully initialized model: {model_config.name}")
                     return llm
                 else:
-                    self._model_health[model_config.name] = False
+                    self._record_health(model_config.name, False)
                     logger.warning(f"Model failed health check: {model_config.name}")
                     
         except Exception as e:
             logger.error(f"Failed to create LLM {model_config.name}: {e}")
-            self._model_health[model_config.name] = False
+            self._record_health(model_config.name, False)
         
         return None
     
@@ -128,39 +307,318 @@ class LLMManager:
             logger.warning(f"Model {model_name} failed health check: {e}")
             return False
     
-    def get_llm(self) -> BaseLanguageModel:
-        """Get working LLM instance with fallback."""
+    def _ordered_llms(self) -> List[Tuple[str, BaseLanguageModel]]:
+        """The primary model then the fallbacks, with their names."""
+        ordered = []
+        if self._primary_llm:
+            ordered.append((self.settings.primary_model.name, self._primary_llm))
+        for llm in self._fallback_llms:
+            ordered.append((getattr(llm, 'model', 'unknown'), llm))
+        return ordered
+    
+    def _endpoint_llm(self, key: str, model_name: str, endpoint: Endpoint) -> BaseLanguageModel:
+        """Get the client for a model on a node other than the default one."""
+        if key not in self._endpoint_llms:
+            model_configs = [self.settings.primary_model, *self.settings.fallback_models]
+            model_config = next(m for m in model_configs if m.name == model_name)
+            self._endpoint_llms[key] = self._build_llm(model_config, base_url=endpoint.url)
+        return self._endpoint_llms[key]
+    
+    def breaker(self, model_name: str) -> CircuitBreaker:
+        """Get the circuit breaker guarding a model.
+        
+        Models on nodes other than the default one have their own breaker,
+        keyed ``<model>@<url>``.
+        """
+        if model_name not in self._breakers:
+            self._breakers[model_name] = CircuitBreaker(
+                model_name,
+                failure_rate_threshold=self.settings.llm_breaker_failure_rate,
+                window_size=self.settings.llm_breaker_window,
+                min_calls=self.settings.llm_breaker_min_calls,
+                slow_call_seconds=self.settings.llm_breaker_slow_call_seconds,
+                open_seconds=self.settings.llm_breaker_open_seconds,
+                probe=lambda: self._probe_generation(model_name),
+            )
+        return self._breakers[model_name]
+    
+    def _probe_generation(self, model_name: str) -> bool:
+        """Check an open-circuit model with a tiny generation, off the event loop."""
+        llm = dict(self._ordered_llms()).get(model_name) or self._endpoint_llms.get(model_name)
+        if llm is None:
+            return False
+        try:
+            response = llm.invoke("Respond with exactly 'OK'.")
+            return "ok" in str(getattr(response, "content", response)).lower()
+        except Exception as e:
+            logger.debug(f"Generation probe failed for {model_name}: {e}")
+            return False
+    
+    def _ensure_initialized(self) -> None:
         if not self._initialized:
-            raise LLMError("LLM manager not initialized. Call initialize() first.")
+            if not self.settings.llm_lazy_init:
+                raise LLMError("LLM manager not initialized. Call initialize() first.")
+            self.initialize_lazily()
+    
+    def get_llm(self) -> BaseLanguageModel:
+        """Get working LLM instance with fallback.
         
-        # Try primary model first
-        primary_model_name = self.settings.primary_model.name
-        if (self._primary_llm and 
-            self._model_health.get(primary_model_name, False)):
-            logger.debug(f"Using primary model: {primary_model_name}")
-            return self._primary_llm
+        Models with an open circuit breaker are skipped. With several
+        Ollama nodes, the client for the best node serving the model is
+        returned.
+        """
+        self._ensure_initialized()
         
-        # Try fallback models
-        for llm in self._fallback_llms:
-            model_name = getattr(llm, 'model', 'unknown')
-            if self._model_health.get(model_name, False):
-                logger.info(f"Using fallback model: {model_name}")
-                return llm
+        for key, llm, breaker, _ in self._failover_candidates():
+            if breaker.state == CLOSED:
+                return self._chosen(key, llm)
+        raise self._no_working_model()
+    
+    def _chosen(self, key: str, llm: BaseLanguageModel) -> BaseLanguageModel:
+        if self.is_fallback(llm):
+            logger.info(f"Using fallback model: {key}")
+        else:
+            logger.debug(f"Using primary model: {key}")
+        return llm
+    
+    @staticmethod
+    def _no_working_model() -> LLMError:
+        return LLMError(
+            "No working LLM models available",
+            details="All configured models failed health checks or have open circuits"
+        )
+    
+    def _model_candidates(
+        self, model_name: str, llm: BaseLanguageModel
+    ) -> Iterator[Tuple[str, BaseLanguageModel, CircuitBreaker, Endpoint]]:
+        """One model on its nodes best first, from cached node listings only."""
+        if len(self.pool) == 1:
+            if self._model_health.get(model_name):
+                yield model_name, llm, self.breaker(model_name), self.pool.default
+            return
+        for endpoint in self.pool.rank(model_name):
+            if endpoint is self.pool.default:
+                if not self._model_health.get(model_name):
+                    continue
+                key, endpoint_llm = model_name, llm
+            else:
+                key = f"{model_name}@{endpoint.url}"
+                endpoint_llm = self._endpoint_llm(key, model_name, endpoint)
+            yield key, endpoint_llm, self.breaker(key), endpoint
+    
+    def _failover_candidates(
+        self
+    ) -> Iterator[Tuple[str, BaseLanguageModel, CircuitBreaker, Endpoint]]:
+        """Healthy models in preference order, each on its nodes best first.
+        
+        Lazy, so models after the first usable one are only probed when
+        a request actually fails over to them. Blocks on node listings
+        and probes; async code uses ``_failover_candidates_async``.
+        """
+        self._ensure_initialized()
+        if len(self.pool) > 1:
+            self.pool.refresh()
+        for model_name, llm in self._ordered_llms():
+            self._is_healthy(model_name)
+            yield from self._model_candidates(model_name, llm)
+    
+    async def _failover_candidates_async(
+        self
+    ) -> AsyncIterator[Tuple[str, BaseLanguageModel, CircuitBreaker, Endpoint]]:
+        """Like ``_failover_candidates``, with listings and probes off the event loop."""
+        self._ensure_initialized()
+        if len(self.pool) > 1:
+            await self.pool.refresh_async()
+        for model_name, llm in self._ordered_llms():
+            if self._needs_probe(model_name):
+                await asyncio.to_thread(self._probe_model, model_name)
+            for candidate in self._model_candidates(model_name, llm):
+                yield candidate
+    
+    @staticmethod
+    async def _next_allowed(
+        candidates: AsyncIterator[Tuple[str, BaseLanguageModel, CircuitBreaker, Endpoint]]
+    ) -> Optional[Tuple[str, BaseLanguageModel, CircuitBreaker, Endpoint]]:
+        """The next candidate whose breaker lets a request through, or None."""
+        async for candidate in candidates:
+            if candidate[2].allow_request():
+                return candidate
+        return None
+    
+    async def run_with_failover(
+        self, call: Callable[[BaseLanguageModel], Awaitable[T]]
+    ) -> Tuple[T, BaseLanguageModel]:
+        """Run ``call`` on the preferred model, retrying on the next one on failure.
+        
+        Every attempt is recorded in the model's circuit breaker, so a model
+        that starts failing or timing out stops receiving requests after the
+        first timeout instead of costing one per request. Only transport,
+        timeout and Ollama errors fail over; any other error is raised.
+        Each attempt waits its turn in the admission queue and holds its
+        slot only while that model runs; nodes are ranked once admitted, so
+        the ranking sees the calls running then. Returns the result and the
+        model that produced it.
+        """
+        errors = []
+        candidates = self._failover_candidates_async()
+        try:
+            while True:
+                async with self.admission.admit():
+                    candidate = await self._next_allowed(candidates)
+                    if candidate is None:
+                        break
+                    model_name, llm, breaker, endpoint = candidate
+                    started = time.perf_counter()
+                    try:
+                        with self.pool.track(endpoint, getattr(llm, "model", model_name)):
+                            result = await call(llm)
+                    except Exception as e:
+                        if not is_model_failure(e):
+                            breaker.release()
+                            raise
+                        breaker.record_failure(e)
+                        errors.append(f"{model_name}: {e}")
+                        logger.warning(f"Model {model_name} failed, trying next model: {e}")
+                        continue
+                breaker.record_success(time.perf_counter() - started)
+                return result, llm
+        finally:
+            await candidates.aclose()
         
-        # If we get here, no models are working
         raise LLMError(
             "No working LLM models available",
-            details="All configured models failed health checks"
+            details="; ".join(errors) or "All models have open circuits"
+        )
+    
+    async def stream_with_failover(
+        self, stream: Callable[[BaseLanguageModel], AsyncIterator[str]]
+    ) -> AsyncIterator[Tuple[BaseLanguageModel, str]]:
+        """Stream from the preferred model, failing over until output starts.
+        
+        Yields ``(model, chunk)`` pairs. A model failing before its first
+        chunk is skipped like in ``run_with_failover``; once chunks have been
+        yielded the error is raised, since the output cannot be retracted.
+        """
+        errors = []
+        candidates = self._failover_candidates_async()
+        try:
+            while True:
+                async with self.admission.admit():
+                    candidate = await self._next_allowed(candidates)
+                    if candidate is None:
+                        break
+                    model_name, llm, breaker, endpoint = candidate
+                    started = time.perf_counter()
+                    streamed = False
+                    try:
+                        with self.pool.track(endpoint, getattr(llm, "model", model_name)):
+                            async for chunk in stream(llm):
+                                streamed = True
+                                yield llm, chunk
+                    except Exception as e:
+                        if not is_model_failure(e):
+                            breaker.release()
+                            raise
+                        breaker.record_failure(e)
+                        if streamed:
+                            raise
+                        errors.append(f"{model_name}: {e}")
+                        logger.warning(f"Model {model_name} failed, trying next model: {e}")
+                        continue
+                breaker.record_success(time.perf_counter() - started)
+                return
+        finally:
+            await candidates.aclose()
+        
+        raise LLMError(
+            "No working LLM models available",
+            details="; ".join(errors) or "All models have open circuits"
         )
     
     async def get_llm_async(self) -> BaseLanguageModel:
-        """Get working LLM instance asynchronously."""
+        """Get working LLM instance asynchronously, like ``get_llm``.
+        
+        Node listings and health probes run off the event loop.
+        """
         if not self._initialized:
             await self.initialize()
-        return self.get_llm()
+        async for key, llm, breaker, _ in self._failover_candidates_async():
+            if breaker.state == CLOSED:
+                return self._chosen(key, llm)
+        raise self._no_working_model()
+    
+    def get_concurrency_limiter(self, backend: Optional[str] = None) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent requests to a backend.
+        
+        Semaphores are bound to the event loop they are used in, so one is
+        kept per running loop and backend URL. Without a backend, the limit
+        covers the whole endpoint pool and scales with its size.
+        
+        This bounds the steps one pipeline runs at once. LLM calls are
+        governed process-wide by ``admission``, which every attempt in
+        ``run_with_failover`` and ``stream_with_failover`` goes through.
+        """
+        limit = self.settings.llm_max_concurrency
+        if backend is None:
+            backend = "pool"
+            limit *= len(self.pool)
+        loop = asyncio.get_running_loop()
+        limiters = self._limiters.setdefault(loop, {})
+        if backend not in limiters:
+            limiters[backend] = asyncio.Semaphore(limit)
+        return limiters[backend]
+    
+    def is_fallback(self, llm: BaseLanguageModel) -> bool:
+        """Check whether an LLM is serving in place of the primary model."""
+        if llm is self._primary_llm:
+            return False
+        return getattr(llm, "model", None) != self.settings.primary_model.name
+    
+    def run_config(
+        self,
+        llm: BaseLanguageModel,
+        agent: str,
+        step: str,
+        cache_hit: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """Build the LangChain run config for an agent step's LLM call.
+        
+        The metadata identifies the step for tracing, and the tracing
+        callback handler is attached when tracing is enabled.
+        """
+        config: Dict[str, Any] = {
+            "run_name": f"{agent}.{step}",
+            "metadata": {
+                "agent": agent,
+                "step": step,
+                "model": str(getattr(llm, "model", type(llm).__name__)),
+                "fallback": self.is_fallback(llm),
+                "cache_hit": cache_hit,
+            },
+        }
+        if self._tracing_handler is not None:
+            config["callbacks"] = [self._tracing_handler]
+        return config
+    
+    def trace_cache_hit(
+        self, llm: BaseLanguageModel, agent: str, step: str, duration: float
+    ) -> None:
+        """Record a span for a step answered from the response cache."""
+        if self.tracer is None:
+            return
+        self.tracer.record(Span(
+            agent=agent,
+            step=step,
+            model=str(getattr(llm, "model", type(llm).__name__)),
+            started_at=time.time() - duration,
+            duration=duration,
+            cache_hit=True,
+            fallback=self.is_fallback(llm),
+        ))
     
     async def health_check(self) -> Dict[str, Any]:
         """Perform health check on all models."""
+        self.settings.refresh_ollama_status()
         health_status = {}
         
         # Check primary model
@@ -169,13 +627,13 @@ class LLMManager:
             health_status[primary_name] = await self._test_model(
                 self._primary_llm, primary_name
             )
-            self._model_health[primary_name] = health_status[primary_name]
+            self._record_health(primary_name, health_status[primary_name])
         
         # Check fallback models
         for llm in self._fallback_llms:
             model_name = getattr(llm, 'model', 'unknown')
             health_status[model_name] = await self._test_model(llm, model_name)
-            self._model_health[model_name] = health_status[model_name]
+            self._record_health(model_name, health_status[model_name])
         
         return {
             "models": health_status,
@@ -194,6 +652,9 @@ class LLMManager:
             "primary_model": self.settings.primary_model.name,
             "fallback_models": [m.name for m in self.settings.fallback_models],
             "has_working_model": any(self._model_health.values()),
+            "endpoints": self.pool.stats(),
+            "admission": self.admission.metrics(),
+            "circuits": {name: breaker.state for name, breaker in self._breakers.items()},
         }
 
 
@@ -0,0 +1,168 @@
+"""TTL-cached client for Ollama's metadata endpoints."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from .http import get_http_client
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# Sentinel distinguishing "not cached" from a cached None
+_MISSING = object()
+
+
+class OllamaMetadataClient:
+    """Cached view of an Ollama server's availability and models.
+
+    ``/api/tags`` backs both availability and the model listing, so one
+    request answers both within the TTL. Failures are cached too, so an
+    unreachable server is not re-polled on every Streamlit rerun.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        ttl_seconds: float,
+        timeout: float = 5,
+        http_client: Optional[httpx.Client] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.ttl_seconds = ttl_seconds
+        self.timeout = timeout
+        self._http_client = http_client
+        self._cache: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _cached(self, key: Tuple[str, ...], fetch: Callable[[], Any]) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            expires_at, value = self._cache.get(key, (0.0, _MISSING))
+            if value is not _MISSING and now < expires_at:
+                return value
+
+        value = fetch()
+        with self._lock:
+            self._cache[key] = (time.monotonic() + self.ttl_seconds, value)
+        return value
+
+    def _peek(self, key: Tuple[str, ...]) -> Any:
+        """The last fetched value, even if expired, or ``_MISSING``. Never fetches."""
+        with self._lock:
+            return self._cache.get(key, (0.0, _MISSING))[1]
+
+    def _is_fresh(self, key: Tuple[str, ...]) -> bool:
+        with self._lock:
+            expires_at, value = self._cache.get(key, (0.0, _MISSING))
+            return value is not _MISSING and time.monotonic() < expires_at
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """The HTTP client used for requests, the shared pool by default."""
+        return self._http_client or get_http_client()
+
+    def _fetch_tags(self) -> Optional[Dict[str, Any]]:
+        try:
+            response = self.http_client.get(f"{self.base_url}/api/tags", timeout=self.timeout)
+            if response.status_code == 200:
+                return response.json()
+            logger.debug(f"Ollama /api/tags returned {response.status_code}")
+        except Exception as e:
+            logger.debug(f"Ollama availability check failed: {e}")
+        return None
+
+    def _fetch_show(self, model_name: str) -> Optional[Dict[str, Any]]:
+        try:
+            response = self.http_client.post(
+                f"{self.base_url}/api/show",
+                json={"model": model_name, "name": model_name},
+                timeout=self.timeout,
+            )
+            if response.status_code == 200:
+                return response.json()
+            logger.debug(f"Ollama /api/show {model_name} returned {response.status_code}")
+        except Exception as e:
+            logger.warning(f"Metadata probe failed for {model_name}: {e}")
+        return None
+
+    def _fetch_ps(self) -> List[str]:
+        try:
+            response = self.http_client.get(f"{self.base_url}/api/ps", timeout=self.timeout)
+            if response.status_code == 200:
+                return [model["name"] for model in response.json().get("models", [])]
+            logger.debug(f"Ollama /api/ps returned {response.status_code}")
+        except Exception as e:
+            logger.debug(f"Ollama running models check failed: {e}")
+        return []
+
+    def tags(self) -> Optional[Dict[str, Any]]:
+        """Get the raw ``/api/tags`` payload, or None if Ollama is unreachable."""
+        return self._cached(("tags",), self._fetch_tags)
+
+    def is_available(self) -> bool:
+        """Check if Ollama is reachable."""
+        return self.tags() is not None
+
+    def list_models(self) -> List[str]:
+        """Get the names of the models pulled into Ollama."""
+        data = self.tags() or {}
+        return [model["name"] for model in data.get("models", [])]
+
+    def running_models(self) -> List[str]:
+        """Get the names of the models currently loaded in memory."""
+        return self._cached(("ps",), self._fetch_ps)
+
+    def refresh_listings(self) -> None:
+        """Re-fetch the model listings that have expired. Blocks on HTTP."""
+        self.tags()
+        self.running_models()
+
+    def listings_expired(self) -> bool:
+        """Check whether the model listings need fetching again."""
+        return not (self._is_fresh(("tags",)) and self._is_fresh(("ps",)))
+
+    def has_listings(self) -> bool:
+        """Check whether the model listings were ever fetched."""
+        return self._peek(("tags",)) is not _MISSING and self._peek(("ps",)) is not _MISSING
+
+    def cached_models(self) -> List[str]:
+        """Like ``list_models`` but from the last fetch, even if expired; never fetches."""
+        data = self._peek(("tags",))
+        if data is _MISSING or data is None:
+            return []
+        return [model["name"] for model in data.get("models", [])]
+
+    def cached_running_models(self) -> List[str]:
+        """Like ``running_models`` but from the last fetch, even if expired; never fetches."""
+        running = self._peek(("ps",))
+        return [] if running is _MISSING else running
+
+    def show_model(self, model_name: str) -> Optional[Dict[str, Any]]:
+        """Get a model's metadata without loading it, or None if it is missing."""
+        return self._cached(("show", model_name), lambda: self._fetch_show(model_name))
+
+    def invalidate(self, model_name: Optional[str] = None) -> None:
+        """Drop cached metadata, for one model or everything."""
+        with self._lock:
+            if model_name is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(("show", model_name), None)
+
+
+# Shared clients, one per Ollama server
+_clients: Dict[str, OllamaMetadataClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_ollama_client(base_url: str, ttl_seconds: float, timeout: float = 5) -> OllamaMetadataClient:
+    """Get the shared metadata client for an Ollama server."""
+    key = base_url.rstrip("/")
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = OllamaMetadataClient(key, ttl_seconds, timeout)
+        return client
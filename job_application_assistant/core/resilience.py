@@ -0,0 +1,186 @@
+"""Circuit breakers for routing LLM requests away from failing models."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Optional
+
+import httpx
+from ollama import ResponseError
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def is_timeout(error: BaseException) -> bool:
+    """Check whether an error is a timeout, whichever client raised it."""
+    return isinstance(error, TimeoutError) or "timeout" in type(error).__name__.lower()
+
+
+# Errors meaning the model or its node failed, rather than the calling code
+MODEL_FAILURES = (httpx.HTTPError, ResponseError, ConnectionError, TimeoutError, asyncio.TimeoutError)
+
+
+def is_model_failure(error: BaseException) -> bool:
+    """Check whether an error is a transport, timeout or Ollama error.
+
+    Only these count against a model's breaker and are retried on another
+    model; any other error is a bug in the call and is raised as is.
+    """
+    return isinstance(error, MODEL_FAILURES) or is_timeout(error)
+
+
+class CircuitBreaker:
+    """Tracks a model's recent failures and slow calls and stops routing to it.
+
+    The breaker opens when the share of failed or slow calls among the last
+    ``window_size`` calls reaches ``failure_rate_threshold`` (once at least
+    ``min_calls`` were seen), and immediately on a timeout, since every
+    further request would wait out the same timeout. While open, requests
+    go elsewhere. After ``open_seconds`` a background probe checks the
+    model: success closes the breaker, failure reopens it with the wait
+    doubled up to ``max_open_seconds``. Without a probe, the breaker turns
+    half-open and admits one trial request instead.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 10,
+        min_calls: int = 4,
+        slow_call_seconds: Optional[float] = None,
+        open_seconds: float = 30.0,
+        max_open_seconds: float = 300.0,
+        probe: Optional[Callable[[], bool]] = None,
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.probe = probe
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)  # True for a bad call
+        self._state = CLOSED
+        self._current_open_seconds = open_seconds
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if (
+                self._state == OPEN
+                and self.probe is None
+                and time.monotonic() - self._opened_at >= self._current_open_seconds
+            ):
+                self._state = HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        """Whether a request may be routed to this model now."""
+        with self._lock:
+            state = self.state
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self.probe is None and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self, seconds: float) -> None:
+        """Record a completed call and how long it took."""
+        slow = self.slow_call_seconds is not None and seconds > self.slow_call_seconds
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._trial_in_flight = False
+                if slow:
+                    self._open(f"slow trial call ({seconds:.1f}s)")
+                else:
+                    self._close()
+            elif self._state == CLOSED:
+                self._record(slow, f"slow call ({seconds:.1f}s)")
+
+    def release(self) -> None:
+        """Give back a request that ended without an outcome for the model."""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._trial_in_flight = False
+
+    def record_failure(self, error: BaseException) -> None:
+        """Record a failed call."""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._trial_in_flight = False
+                self._open(f"trial call failed: {error}")
+            elif self._state == CLOSED:
+                if is_timeout(error):
+                    self._open(f"timeout: {error}")
+                else:
+                    self._record(True, str(error))
+
+    def _record(self, bad: bool, reason: str) -> None:
+        self._outcomes.append(bad)
+        calls = len(self._outcomes)
+        if bad and calls >= self.min_calls:
+            rate = sum(self._outcomes) / calls
+            if rate >= self.failure_rate_threshold:
+                self._open(f"{rate:.0%} of last {calls} calls failed or were slow; last: {reason}")
+
+    def _open(self, reason: str) -> None:
+        if self._state != CLOSED:
+            # Reopening after a failed probe or trial: back off
+            self._current_open_seconds = min(
+                self._current_open_seconds * 2, self.max_open_seconds
+            )
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        logger.warning(
+            f"Circuit opened for {self.name} for {self._current_open_seconds:.0f}s: {reason}"
+        )
+        if self.probe is not None:
+            self._timer = threading.Timer(self._current_open_seconds, self._run_probe)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _close(self) -> None:
+        self._state = CLOSED
+        self._current_open_seconds = self.open_seconds
+        self._outcomes.clear()
+        logger.info(f"Circuit closed for {self.name}")
+
+    def _run_probe(self) -> None:
+        with self._lock:
+            if self._state != OPEN:
+                return
+            self._state = HALF_OPEN
+        try:
+            healthy = bool(self.probe())
+        except Exception as e:
+            logger.debug(f"Probe for {self.name} failed: {e}")
+            healthy = False
+        with self._lock:
+            if self._state != HALF_OPEN:
+                return
+            if healthy:
+                self._close()
+            else:
+                self._open("background probe failed")
+
+    def reset(self) -> None:
+        """Close the breaker and forget recorded calls."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._trial_in_flight = False
+            self._close()
@@ -0,0 +1,324 @@
+"""Per-step tracing of LLM calls, exported as JSONL and Prometheus metrics."""
+
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass, fields
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from .config import Settings
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class Span:
+    """Timing and usage of one agent step's LLM call."""
+
+    agent: str
+    step: str
+    model: str
+    started_at: float  # Unix time
+    duration: float
+    ttft: Optional[float] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    tokens_per_second: Optional[float] = None
+    cache_hit: Optional[bool] = None  # None when the cache is disabled
+    fallback: bool = False
+    error: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Span":
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+
+class Tracer:
+    """Collects spans in memory and appends them to a JSONL file.
+
+    The file is rotated to ``<name>.1`` once it exceeds ``max_file_bytes``,
+    so it can be tailed by other processes (the CLI status command and the
+    metrics endpoint read it) without growing unbounded.
+    """
+
+    def __init__(self, path: Optional[Path], max_file_bytes: int, max_spans: int = 1000):
+        self.path = Path(path) if path else None
+        self.max_file_bytes = max_file_bytes
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def record(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+            if self.path is None:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                if self.path.exists() and self.path.stat().st_size > self.max_file_bytes:
+                    self.path.replace(self.path.with_name(self.path.name + ".1"))
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(asdict(span)) + "\n")
+            except OSError as e:
+                logger.debug(f"Failed to write trace span: {e}")
+
+    def spans(self) -> List[Span]:
+        """Spans recorded by this process, oldest first."""
+        with self._lock:
+            return list(self._spans)
+
+
+def load_spans(path: Path, limit: int = 1000) -> List[Span]:
+    """Read the most recent spans from a trace file."""
+    lines: Deque[str] = deque(maxlen=limit)
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines.extend(line for line in f if line.strip())
+    except FileNotFoundError:
+        return []
+
+    spans = []
+    for line in lines:
+        try:
+            spans.append(Span.from_dict(json.loads(line)))
+        except (ValueError, TypeError):
+            continue  # a partially written line
+    return spans
+
+
+class TracingCallbackHandler(BaseCallbackHandler):
+    """LangChain callback handler turning chat model runs into spans.
+
+    The agent, step, cache and fallback details are read from the run's
+    metadata, as set by ``LLMManager.run_config``.
+    """
+
+    run_inline = True  # time callbacks on the calling thread, not an executor
+
+    def __init__(self, tracer: Tracer):
+        self.tracer = tracer
+        self._runs: Dict[UUID, Dict[str, Any]] = {}
+
+    def _start(self, run_id: UUID, metadata: Optional[Dict[str, Any]]) -> None:
+        metadata = metadata or {}
+        self._runs[run_id] = {
+            "metadata": metadata,
+            "started_at": time.time(),
+            "started": time.perf_counter(),
+            "first_token": None,
+        }
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: Any, *,
+                            run_id: UUID, metadata: Optional[Dict[str, Any]] = None,
+                            **kwargs: Any) -> None:
+        self._start(run_id, metadata)
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *,
+                     run_id: UUID, metadata: Optional[Dict[str, Any]] = None,
+                     **kwargs: Any) -> None:
+        self._start(run_id, metadata)
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        run = self._runs.get(run_id)
+        if run is not None and run["first_token"] is None:
+            run["first_token"] = time.perf_counter()
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        run = self._runs.pop(run_id, None)
+        if run is not None:
+            self.tracer.record(self._span(run, *_token_usage(response)))
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        run = self._runs.pop(run_id, None)
+        if run is not None:
+            self.tracer.record(self._span(run, None, None, error=str(error) or type(error).__name__))
+
+    def _span(self, run: Dict[str, Any], prompt_tokens: Optional[int],
+              completion_tokens: Optional[int], error: Optional[str] = None) -> Span:
+        metadata = run["metadata"]
+        duration = time.perf_counter() - run["started"]
+        ttft = run["first_token"] - run["started"] if run["first_token"] else None
+
+        tokens_per_second = None
+        generation_seconds = duration - (ttft or 0.0)
+        if completion_tokens and generation_seconds > 0:
+            tokens_per_second = completion_tokens / generation_seconds
+
+        return Span(
+            agent=metadata.get("agent", "unknown"),
+            step=metadata.get("step", "unknown"),
+            model=metadata.get("model") or metadata.get("ls_model_name", "unknown"),
+            started_at=run["started_at"],
+            duration=duration,
+            ttft=ttft,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            tokens_per_second=tokens_per_second,
+            cache_hit=metadata.get("cache_hit"),
+            fallback=bool(metadata.get("fallback", False)),
+            error=error,
+        )
+
+
+def _token_usage(response: LLMResult) -> Tuple[Optional[int], Optional[int]]:
+    """Prompt and completion token counts reported by the model, if any."""
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                return usage.get("input_tokens"), usage.get("output_tokens")
+            info = generation.generation_info or {}
+            if "eval_count" in info:
+                return info.get("prompt_eval_count"), info.get("eval_count")
+    return None, None
+
+
+def _percentile(values: List[float], fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _mean(values: List[float]) -> Optional[float]:
+    return sum(values) / len(values) if values else None
+
+
+def summarize(spans: Iterable[Span]) -> List[Dict[str, Any]]:
+    """Aggregate spans per agent step."""
+    groups: Dict[Tuple[str, str], List[Span]] = defaultdict(list)
+    for span in spans:
+        groups[(span.agent, span.step)].append(span)
+
+    summary = []
+    for (agent, step), group in sorted(groups.items()):
+        generated = [s for s in group if not s.cache_hit and not s.error]
+        cached = [s for s in group if s.cache_hit is not None]
+        summary.append({
+            "agent": agent,
+            "step": step,
+            "calls": len(group),
+            "errors": sum(1 for s in group if s.error),
+            "p50_seconds": _percentile([s.duration for s in generated], 0.5),
+            "p95_seconds": _percentile([s.duration for s in generated], 0.95),
+            "mean_ttft": _mean([s.ttft for s in generated if s.ttft is not None]),
+            "tokens_per_second": _mean(
+                [s.tokens_per_second for s in generated if s.tokens_per_second]
+            ),
+            "cache_hit_rate": (
+                sum(1 for s in cached if s.cache_hit) / len(cached) if cached else None
+            ),
+            "fallbacks": sum(1 for s in group if s.fallback),
+            "models": sorted({s.model for s in group}),
+        })
+    return summary
+
+
+def _labels(**labels: str) -> str:
+    escaped = (
+        key + '="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for key, value in labels.items()
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def render_prometheus(spans: Iterable[Span]) -> str:
+    """Render span aggregates in the Prometheus text exposition format.
+
+    Aggregates cover only the spans given (the metrics endpoint passes the
+    most recent ones), so they can go down as old spans drop out and are
+    exposed as gauges rather than ``_total`` counters.
+    """
+    requests: Dict[str, int] = defaultdict(int)
+    durations: Dict[str, List[float]] = defaultdict(list)
+    ttfts: Dict[str, List[float]] = defaultdict(list)
+    tokens: Dict[str, int] = defaultdict(int)
+
+    for span in spans:
+        cache = "disabled" if span.cache_hit is None else ("hit" if span.cache_hit else "miss")
+        key = _labels(
+            agent=span.agent, step=span.step, model=span.model, cache=cache,
+            fallback=str(span.fallback).lower(), status="error" if span.error else "ok",
+        )
+        requests[key] += 1
+        if not span.cache_hit:
+            step_key = _labels(agent=span.agent, step=span.step, model=span.model)
+            durations[step_key].append(span.duration)
+            if span.ttft is not None:
+                ttfts[step_key].append(span.ttft)
+        for kind, count in (("prompt", span.prompt_tokens), ("completion", span.completion_tokens)):
+            if count:
+                tokens[_labels(model=span.model, kind=kind)] += count
+
+    lines = [
+        "# HELP job_assistant_llm_requests Agent step LLM calls among the recent spans.",
+        "# TYPE job_assistant_llm_requests gauge",
+    ]
+    lines += [f"job_assistant_llm_requests{k} {v}" for k, v in sorted(requests.items())]
+    for name, help_text, series in (
+        ("job_assistant_llm_duration_seconds", "Generation time of agent steps.", durations),
+        ("job_assistant_llm_ttft_seconds", "Time to first token of agent steps.", ttfts),
+    ):
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} summary"]
+        for key, values in sorted(series.items()):
+            for quantile in (0.5, 0.95):
+                quantile_key = key[:-1] + f',quantile="{quantile}"' + "}"
+                lines.append(f"{name}{quantile_key} {_percentile(values, quantile)}")
+            lines.append(f"{name}_sum{key} {sum(values)}")
+            lines.append(f"{name}_count{key} {len(values)}")
+    lines += [
+        "# HELP job_assistant_llm_tokens Tokens processed by the model among the recent spans.",
+        "# TYPE job_assistant_llm_tokens gauge",
+    ]
+    lines += [f"job_assistant_llm_tokens{k} {v}" for k, v in sorted(tokens.items())]
+    return "\n".join(lines) + "\n"
+
+
+def serve_metrics(trace_file: Path, host: str = "127.0.0.1", port: int = 9464,
+                  limit: int = 10000) -> ThreadingHTTPServer:
+    """Create an HTTP server exposing the trace file at ``/metrics``.
+
+    Metrics are recomputed from the most recent ``limit`` spans on every
+    scrape, so spans written by any process sharing the file are included.
+    Call ``serve_forever()`` on the returned server to start it.
+    """
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render_prometheus(load_spans(trace_file, limit)).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(f"Metrics request: {format % args}")
+
+    return ThreadingHTTPServer((host, port), MetricsHandler)
+
+
+# Shared tracers, one per trace file
+_tracers: Dict[Optional[Path], Tracer] = {}
+_tracers_lock = threading.Lock()
+
+
+def get_tracer(settings: Settings) -> Tracer:
+    """Get the shared tracer writing to the configured trace file."""
+    path = settings.trace_path
+    with _tracers_lock:
+        if path not in _tracers:
+            _tracers[path] = Tracer(
+                path, max_file_bytes=settings.trace_max_file_mb * 1024 * 1024
+            )
+        return _tracers[path]
@@ -4,12 +4,22 @@ from .document_processor import (
     DocumentProcessor,
     JobDescriptionExtractor,
     process_cv_file,
-    extract_job_description
+    extract_job_description,
+    extract_job_descriptions_async,
+    job_description_extractions,
+    job_description_from_data
 )
+from .skills import Skill, SkillMatcher, get_skill_matcher
 
 __all__ = [
     "DocumentProcessor",
     "JobDescriptionExtractor", 
     "process_cv_file",
-    "extract_job_description"
+    "extract_job_description",
+    "extract_job_descriptions_async",
+    "job_description_extractions",
+    "job_description_from_data",
+    "Skill",
+    "SkillMatcher",
+    "get_skill_matcher",
 ]
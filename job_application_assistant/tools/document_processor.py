@@ -1,8 +1,15 @@
 """Document processing utilities for CV/resume and job descriptions."""
 
-import re
-import requests
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+import asyncio
+import atexit
+import hashlib
+import multiprocessing
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Coroutine, Dict, List, Mapping, Optional, Any, Sequence, Tuple, TYPE_CHECKING
 from pathlib import Path
 import logging
 from urllib.parse import urlparse
@@ -27,33 +34,273 @@ try:
 except ImportError:
     BeautifulSoup = None
 
+from job_application_assistant.core.exceptions import DocumentProcessingError
+from job_application_assistant.core.http import get_async_http_client, get_http_client
 from job_application_assistant.models.data_models import JobDescription, UserProfile
+from job_application_assistant.tools.extraction_rules import (
+    OG_DESCRIPTION_COMPANY,
+    extract_contact_info,
+    extract_requirements,
+    find_company,
+    find_location,
+    is_abbreviation,
+    strip_linkedin_chrome,
+)
+from job_application_assistant.tools.html_parsing import (
+    RegionFilter,
+    class_region,
+    compile_selectors,
+    page_text_region,
+    resolve_parser,
+)
+from job_application_assistant.tools.main_content import estimate_tokens, extract_main_content
+from job_application_assistant.tools.page_cache import CachedPage, PageCache
+from job_application_assistant.tools.skills import get_skill_matcher
+from job_application_assistant.tools.structured_data import find_job_posting
 
 logger = logging.getLogger(__name__)
 
 
+# Bump when extraction output changes so stale cached text is not reused
+PDF_EXTRACTION_VERSION = "1"
+# Bump when job page parsing changes so cached job data is re-parsed
+JOB_PAGE_PARSE_VERSION = "1"
+
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+PAGE_TIMEOUT_SECONDS = 15
+
+PLATFORM_NAMES = {'linkedin': "LinkedIn", 'indeed': "Indeed"}
+
+# JobPosting fields copied into job data; the rest are not in its shape
+POSTING_FIELDS = ("title", "company", "location", "description")
+
+# CSS selectors per platform and field, tried in order until one matches
+PLATFORM_SELECTORS = {
+    'linkedin': {
+        'title': [
+            'h1.t-24.t-bold.inline',
+            'h1[data-automation-id="job-title"]',
+            '.jobs-unified-top-card__job-title h1',
+            'h1.jobs-unified-top-card__job-title',
+            '.job-details-jobs-unified-top-card__job-title h1',
+        ],
+        'company': [
+            'span.jobs-unified-top-card__company-name a',
+            'a[data-automation-id="company-name"]',
+            '.job-details-jobs-unified-top-card__company-name a',
+            'span.jobs-unified-top-card__company-name',
+            '.jobs-unified-top-card__primary-description a',
+        ],
+        'location': [
+            'span.jobs-unified-top-card__bullet',
+            '[data-automation-id="job-location"]',
+            '.jobs-unified-top-card__primary-description-container span',
+        ],
+        'description': [
+            'div.jobs-description__content',
+            '[data-automation-id="job-description"]',
+            '.job-details-jobs-unified-top-card__job-description',
+            'div.jobs-box__content',
+        ],
+    },
+    'generic': {
+        'title': [
+            'h1',
+            '.job-title',
+            '.jobsearch-JobInfoHeader-title',
+            '[data-testid="job-title"]',
+            '.job-header-title',
+        ],
+        'company': [
+            '.company',
+            '.employer',
+            '.company-name',
+            '[data-testid="company-name"]',
+            '.jobsearch-InlineCompanyRating',
+        ],
+    },
+}
+# Classes of the LinkedIn top card and description, the only regions the
+# LinkedIn selectors read
+LINKEDIN_REGION_CLASSES = (
+    'jobs-unified-top-card', 'job-details-jobs-unified-top-card', 'jobs-description', 'jobs-box'
+)
+
+_process_pools: Dict[str, ProcessPoolExecutor] = {}
+_process_pools_lock = threading.Lock()
+
+
+def _worker_context() -> multiprocessing.context.BaseContext:
+    """Start method for worker pools that is safe in a threaded process.
+    
+    Forking copies locks held by other threads (HTTP pools, the event loop,
+    Streamlit's server) into the child, so workers come from a fork server,
+    or are spawned where there is none.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _get_process_pool(name: str, max_workers: int) -> ProcessPoolExecutor:
+    """Get a shared process pool, created on first use and shut down at exit."""
+    with _process_pools_lock:
+        pool = _process_pools.get(name)
+        if pool is None:
+            pool = _process_pools[name] = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=_worker_context()
+            )
+            atexit.register(pool.shutdown)
+        return pool
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool that parses fetched job pages."""
+    from job_application_assistant.core.config import get_settings
+    return _get_process_pool("html", get_settings().html_parse_workers)
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool that extracts PDF pages, one worker per CPU."""
+    return _get_process_pool("pdf", os.cpu_count() or 1)
+
+
+@lru_cache(maxsize=None)
+def _platform_selectors(platform: str) -> Dict[str, List[Any]]:
+    """Get a platform's compiled selectors, compiled on first use."""
+    return compile_selectors(PLATFORM_SELECTORS[platform])
+
+
+@lru_cache(maxsize=None)
+def _platform_region(platform: str) -> RegionFilter:
+    """Get the part of a page the platform's parser reads."""
+    if platform == 'linkedin':
+        return class_region(
+            LINKEDIN_REGION_CLASSES,
+            names=('h1',),
+            attributes=('data-automation-id',),
+            meta_properties=('og:description',),
+        )
+    return page_text_region()
+
+
+def _extract_pdf_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """Extract the text of pages ``[start, stop)``. Runs in worker processes."""
+    with pdfplumber.open(file_path) as pdf:
+        return [pdf.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
 class DocumentProcessor:
     """Utility class for processing various document types."""
     
-    def __init__(self):
-        """Initialize the document processor."""
-        pass
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        parallel_page_threshold: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ):
+        """Initialize the document processor.
+        
+        Args:
+            cache_dir: Directory for cached extracted text. Defaults to
+                ``documents`` under ``Settings.cache_dir``.
+            parallel_page_threshold: PDFs with at least this many pages are
+                extracted in a process pool. Defaults to
+                ``Settings.pdf_parallel_page_threshold``.
+            max_workers: Page ranges a PDF is split into, at most the CPU
+                count. Defaults to the CPU count.
+        """
+        self._cache_dir = cache_dir
+        self._parallel_page_threshold = parallel_page_threshold
+        self.max_workers = max_workers
+    
+    @property
+    def cache_dir(self) -> Optional[Path]:
+        """Directory for cached extracted text, or None when caching is off."""
+        if self._cache_dir is None:
+            from job_application_assistant.core.config import get_settings
+            settings = get_settings()
+            if not settings.document_cache_enabled:
+                return None
+            self._cache_dir = settings.cache_dir / "documents"
+        return self._cache_dir
+    
+    @property
+    def parallel_page_threshold(self) -> int:
+        """Minimum page count for page-parallel PDF extraction."""
+        if self._parallel_page_threshold is None:
+            from job_application_assistant.core.config import get_settings
+            self._parallel_page_threshold = get_settings().pdf_parallel_page_threshold
+        return self._parallel_page_threshold
+    
+    def _cache_path(self, file_path: str) -> Optional[Path]:
+        """Path of the cached text for a file, keyed by its content hash."""
+        cache_dir = self.cache_dir
+        if cache_dir is None:
+            return None
+        digest = hashlib.sha256(f"pdf-v{PDF_EXTRACTION_VERSION}:".encode("utf-8"))
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return cache_dir / f"{digest.hexdigest()}.txt"
     
     def extract_text_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF file."""
+        """Extract text from PDF file.
+        
+        Long PDFs are split into page ranges extracted in parallel worker
+        processes. Results are cached on disk by file content, so the same
+        file is only ever extracted once.
+        """
         if not pdfplumber:
             raise ImportError("pdfplumber is required for PDF processing")
         
         try:
+            cache_path = self._cache_path(file_path)
+            if cache_path is not None and cache_path.exists():
+                logger.debug(f"Using cached PDF text for {file_path}")
+                return cache_path.read_text(encoding="utf-8")
+            
             with pdfplumber.open(file_path) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    text += page.extract_text() or ""
-                return text
+                page_count = len(pdf.pages)
+                if page_count < self.parallel_page_threshold:
+                    pages = [page.extract_text() or "" for page in pdf.pages]
+            
+            if page_count >= self.parallel_page_threshold:
+                pages = self._extract_pdf_pages_parallel(file_path, page_count)
+            
+            text = "\n".join(pages)
+            
+            if cache_path is not None:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                tmp_path.write_text(text, encoding="utf-8")
+                tmp_path.replace(cache_path)
+            
+            return text
         except Exception as e:
             logger.error(f"Error extracting text from PDF: {e}")
             return ""
     
+    def _extract_pdf_pages_parallel(self, file_path: str, page_count: int) -> List[str]:
+        """Extract pages in contiguous ranges across the shared PDF process pool."""
+        cpus = os.cpu_count() or 1
+        workers = min(self.max_workers or cpus, cpus, page_count)
+        chunk_size = -(-page_count // workers)  # ceiling division
+        ranges = [
+            (start, min(start + chunk_size, page_count))
+            for start in range(0, page_count, chunk_size)
+        ]
+        logger.debug(f"Extracting {page_count} PDF pages in {len(ranges)} workers")
+        
+        chunks = _get_pdf_pool().map(
+            _extract_pdf_page_range,
+            [file_path] * len(ranges),
+            [start for start, _ in ranges],
+            [stop for _, stop in ranges]
+        )
+        return [page for chunk in chunks for page in chunk]
+    
     def extract_text_from_docx(self, file_path: str) -> str:
         """Extract text from DOCX file."""
         if not docx2txt:
@@ -102,30 +349,11 @@ class DocumentProcessor:
             "contact_info": {}
         }
         
-        # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, cv_text)
-        if emails:
-            parsed_data["contact_info"]["email"] = emails[0]
-        
-        # Extract phone numbers
-        phone_pattern = r'[\+]?[1-9]?[0-9]{7,15}'
-        phones = re.findall(phone_pattern, cv_text)
-        if phones:
-            parsed_data["contact_info"]["phone"] = phones[0]
-        
-        # Extract skills (simple keyword matching)
-        skill_keywords = [
-            "Python", "JavaScript", "Java", "C++", "React", "Node.js",
-            "Machine Learning", "Data Science", "SQL", "MongoDB",
-            "Docker", "Kubernetes", "AWS", "Azure", "Git", "Linux"
-        ]
+        # Extract email and phone number
+        parsed_data["contact_info"].update(extract_contact_info(cv_text))
         
-        found_skills = []
-        for skill in skill_keywords:
-            if skill.lower() in cv_text.lower():
-                found_skills.append(skill)
-        parsed_data["skills"] = found_skills
+        # Extract skills in one pass over the text
+        parsed_data["skills"] = get_skill_matcher().find(cv_text)
         
         return parsed_data
 
@@ -133,40 +361,256 @@ class DocumentProcessor:
 class JobDescriptionExtractor:
     """Extract job descriptions from various sources."""
     
-    def __init__(self):
-        """Initialize the job description extractor."""
-        pass
+    def __init__(self, html_parser: Optional[str] = None, page_cache_dir: Optional[Path] = None):
+        """Initialize the job description extractor.
+        
+        Args:
+            html_parser: BeautifulSoup parser to use (default
+                ``Settings.html_parser``, else the fastest installed)
+            page_cache_dir: Directory for cached job pages. Defaults to
+                ``job_pages`` under ``Settings.cache_dir``.
+        """
+        self._html_parser = html_parser
+        self._page_cache_dir = page_cache_dir
+    
+    @property
+    def page_cache(self) -> Optional[PageCache]:
+        """Cache of downloaded job pages, or None when caching is off."""
+        directory = self._page_cache_dir
+        if directory is None:
+            from job_application_assistant.core.config import get_settings
+            settings = get_settings()
+            if not settings.job_page_cache_enabled:
+                return None
+            directory = settings.cache_dir / "job_pages"
+        return PageCache(directory, JOB_PAGE_PARSE_VERSION)
+    
+    @property
+    def html_parser(self) -> str:
+        """The BeautifulSoup parser used for job pages."""
+        name = self._html_parser
+        if name is None:
+            from job_application_assistant.core.config import get_settings
+            name = get_settings().html_parser
+        return resolve_parser(name)
+    
+    def make_soup(self, content: bytes, region: Optional[RegionFilter] = None) -> BS4BeautifulSoup:
+        """Parse a page, building only ``region`` of it when given."""
+        return BeautifulSoup(content, self.html_parser, parse_only=region)
     
     def extract_from_url(self, url: str) -> Dict[str, Any]:
-        """Extract job description from URL with platform-specific parsing."""
+        """Extract job description from URL with platform-specific parsing.
+        
+        Pages seen before are revalidated with a conditional GET, and an
+        unchanged page is neither downloaded nor parsed again.
+        """
         if not BeautifulSoup:
             raise ImportError("beautifulsoup4 is required for web scraping")
         
         try:
-            # Identify platform
-            platform = self._identify_platform(url)
-            logger.info(f"Detected platform: {platform} for URL: {url}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Use platform-specific parsing
-            if platform == 'linkedin':
-                return self._parse_linkedin_job(soup, url)
-            elif platform == 'indeed':
-                return self._parse_indeed_job(soup, url)
-            else:
-                return self._parse_generic_job(soup, url)
-                
+            cache = self.page_cache
+            cached = cache.get(url) if cache is not None else None
+            content, headers = self._download(url, cached)
+            if content is None:
+                job_data = self._cached_job(cached, url)
+                if job_data is None:
+                    job_data = self.parse_html(cached.body(), url)
+                    if "error" not in job_data:
+                        cache.store_job(cached, job_data)
+                return job_data
+            job_data = self.parse_html(content, url)
+            if cache is not None and "error" not in job_data:
+                cache.store(url, headers, content, job_data)
+            return job_data
         except Exception as e:
             logger.error(f"Error extracting job description from URL: {e}")
             return {"error": str(e), "url": url}
     
+    async def extract_from_url_async(self, url: str) -> Dict[str, Any]:
+        """Extract a job description from a URL without blocking the event loop."""
+        return (await self.extract_from_urls_async([url]))[0]
+    
+    async def extract_from_urls_async(
+        self,
+        urls: Sequence[str],
+        per_host: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Extract job descriptions from many URLs concurrently.
+        
+        Pages are fetched with the pooled async HTTP client, at most
+        ``per_host`` (default ``Settings.job_fetch_per_host``) at a time from
+        any one host, and parsed in worker processes so the event loop stays
+        free; page cache reads and writes run in worker threads. Results keep
+        the order of ``urls``; a failed URL gives ``{"error": ..., "url": ...}``
+        like ``extract_from_url``.
+        """
+        return list(await asyncio.gather(*self.extractions(urls, per_host)))
+    
+    def extractions(
+        self,
+        urls: Sequence[str],
+        per_host: Optional[int] = None
+    ) -> List[Coroutine[Any, Any, Dict[str, Any]]]:
+        """Build one extraction per URL, sharing the per-host fetch limit.
+        
+        Await each one separately to use a page as soon as it is ready;
+        ``extract_from_urls_async`` describes how pages are fetched and parsed.
+        """
+        if not BeautifulSoup:
+            raise ImportError("beautifulsoup4 is required for web scraping")
+        
+        if per_host is None:
+            from job_application_assistant.core.config import get_settings
+            per_host = get_settings().job_fetch_per_host
+        host_limits: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(per_host)
+        )
+        
+        cache = self.page_cache
+        
+        async def extract(url: str) -> Dict[str, Any]:
+            loop = asyncio.get_running_loop()
+            try:
+                cached = await asyncio.to_thread(cache.get, url) if cache is not None else None
+                async with host_limits[urlparse(url).netloc.lower()]:
+                    content, headers = await self._download_async(url, cached)
+                if content is None:
+                    job_data = self._cached_job(cached, url)
+                    if job_data is None:
+                        body = await asyncio.to_thread(cached.body)
+                        job_data = await loop.run_in_executor(_get_parse_pool(), self.parse_html, body, url)
+                        if "error" not in job_data:
+                            await asyncio.to_thread(cache.store_job, cached, job_data)
+                    return job_data
+                job_data = await loop.run_in_executor(_get_parse_pool(), self.parse_html, content, url)
+                if cache is not None and "error" not in job_data:
+                    await asyncio.to_thread(cache.store, url, headers, content, job_data)
+                return job_data
+            except Exception as e:
+                logger.error(f"Error extracting job description from URL: {e}")
+                return {"error": str(e), "url": url}
+        
+        return [extract(url) for url in urls]
+    
+    def _max_page_bytes(self) -> int:
+        from job_application_assistant.core.config import get_settings
+        return int(get_settings().job_page_max_mb * 1024 * 1024)
+    
+    def _check_page_size(self, url: str, size: int, limit: int) -> None:
+        if size > limit:
+            raise DocumentProcessingError(
+                f"Job page is larger than {limit // 1024} KB", details=url
+            )
+    
+    def _cached_job(self, cached: CachedPage, url: str) -> Optional[Dict[str, Any]]:
+        """Job data of a page the server reported unchanged, if parsed by this version."""
+        if cached.job_data is None:
+            logger.info(f"Job page unchanged, re-parsing the cached page: {url}")
+            return None
+        logger.info(f"Job page unchanged, using cached job data: {url}")
+        return {**cached.job_data, "url": url}
+    
+    def fetch_page(self, url: str) -> bytes:
+        """Download a job page, refusing pages over ``Settings.job_page_max_mb``."""
+        return self._download(url)[0]
+    
+    def _download(
+        self,
+        url: str,
+        cached: Optional[CachedPage] = None
+    ) -> Tuple[Optional[bytes], Mapping[str, str]]:
+        """Download a job page, revalidating ``cached`` if given.
+        
+        Returns the page and the response headers; the page is None when
+        the server answers that ``cached`` is still current.
+        """
+        limit = self._max_page_bytes()
+        headers = {**REQUEST_HEADERS, **(cached.conditional_headers() if cached else {})}
+        with get_http_client().stream(
+            "GET", url, headers=headers, timeout=PAGE_TIMEOUT_SECONDS
+        ) as response:
+            if cached is not None and response.status_code == 304:
+                return None, response.headers
+            response.raise_for_status()
+            self._check_page_size(url, int(response.headers.get("Content-Length") or 0), limit)
+            content = bytearray()
+            for chunk in response.iter_bytes():
+                content += chunk
+                self._check_page_size(url, len(content), limit)
+        return bytes(content), response.headers
+    
+    async def fetch_page_async(self, url: str) -> bytes:
+        """Download a job page with the pooled async client; see ``fetch_page``."""
+        return (await self._download_async(url))[0]
+    
+    async def _download_async(
+        self,
+        url: str,
+        cached: Optional[CachedPage] = None
+    ) -> Tuple[Optional[bytes], Mapping[str, str]]:
+        """Download a job page with the pooled async client; see ``_download``."""
+        limit = self._max_page_bytes()
+        headers = {**REQUEST_HEADERS, **(cached.conditional_headers() if cached else {})}
+        async with get_async_http_client().stream(
+            "GET", url, headers=headers, timeout=PAGE_TIMEOUT_SECONDS
+        ) as response:
+            if cached is not None and response.status_code == 304:
+                return None, response.headers
+            response.raise_for_status()
+            self._check_page_size(url, int(response.headers.get("Content-Length") or 0), limit)
+            content = bytearray()
+            async for chunk in response.aiter_bytes():
+                content += chunk
+                self._check_page_size(url, len(content), limit)
+        return bytes(content), response.headers
+    
+    def parse_html(self, content: bytes, url: str) -> Dict[str, Any]:
+        """Parse a downloaded job page.
+        
+        A schema.org JobPosting embedded in the page is used when it has a
+        description; otherwise the page is parsed with the parser for its
+        platform, keeping the fields a description-less posting did give.
+        """
+        platform = self._identify_platform(url)
+        logger.info(f"Detected platform: {platform} for URL: {url}")
+        
+        posting = find_job_posting(content)
+        if posting is not None and posting.get("description"):
+            logger.info(f"Using {posting['source']} JobPosting data for URL: {url}")
+            return self._job_data_from_posting(posting, url, platform)
+        
+        # Only the regions the platform parser reads are built
+        soup = self.make_soup(content, _platform_region(platform))
+        
+        # Use platform-specific parsing
+        if platform == 'linkedin':
+            job_data = self._parse_linkedin_job(soup, url, page=content)
+        elif platform == 'indeed':
+            job_data = self._parse_indeed_job(soup, url)
+        else:
+            job_data = self._parse_generic_job(soup, url)
+        
+        if posting is not None:
+            logger.info(f"Using {posting['source']} JobPosting fields without a description for URL: {url}")
+            job_data.update({key: posting[key] for key in POSTING_FIELDS if key in posting})
+        return job_data
+    
+    def _job_data_from_posting(self, posting: Dict[str, Any], url: str, platform: str) -> Dict[str, Any]:
+        """Job data in the shape the platform parsers return, from a JobPosting."""
+        job_data = {
+            "title": "Unknown Position",
+            "company": "Unknown Company",
+            "description": "",
+            "location": "Unknown Location",
+            "url": url,
+            "platform": PLATFORM_NAMES.get(platform, "Generic"),
+            "requirements": [],
+        }
+        job_data.update({key: posting[key] for key in POSTING_FIELDS if key in posting})
+        if job_data["description"]:
+            job_data["requirements"] = self._extract_requirements_from_text(job_data["description"])
+        return job_data
+    
     def _identify_platform(self, url: str) -> str:
         """Identify the job platform from URL."""
         parsed_url = urlparse(url.lower())
@@ -181,8 +625,13 @@ class JobDescriptionExtractor:
         else:
             return 'generic'
     
-    def _parse_linkedin_job(self, soup: Any, url: str) -> Dict[str, Any]:
-        """Parse LinkedIn job posting with improved extraction."""
+    def _parse_linkedin_job(self, soup: Any, url: str, page: Optional[bytes] = None) -> Dict[str, Any]:
+        """Parse LinkedIn job posting with improved extraction.
+        
+        ``page`` is the raw page when ``soup`` holds only the top card and
+        description; the page text is then parsed separately if the
+        description has to fall back to it.
+        """
         job_data = {
             "title": "Unknown Position",
             "company": "Unknown Company",
@@ -194,34 +643,19 @@ class JobDescriptionExtractor:
             "employment_type": "Unknown"
         }
         
+        selectors = _platform_selectors('linkedin')
         try:
             # Extract job title - LinkedIn uses specific selectors
-            title_selectors = [
-                'h1.t-24.t-bold.inline',
-                'h1[data-automation-id="job-title"]',
-                '.jobs-unified-top-card__job-title h1',
-                'h1.jobs-unified-top-card__job-title',
-                '.job-details-jobs-unified-top-card__job-title h1'
-            ]
-            
-            for selector in title_selectors:
-                title_elem = soup.select_one(selector)
+            for selector in selectors['title']:
+                title_elem = selector.select_one(soup)
                 if title_elem:
                     job_data["title"] = title_elem.get_text().strip()
                     logger.info(f"Found job title: {job_data['title']}")
                     break
             
             # Extract company name - Make sure it's NOT LinkedIn
-            company_selectors = [
-                'span.jobs-unified-top-card__company-name a',
-                'a[data-automation-id="company-name"]',
-                '.job-details-jobs-unified-top-card__company-name a',
-                'span.jobs-unified-top-card__company-name',
-                '.jobs-unified-top-card__primary-description a'
-            ]
-            
-            for selector in company_selectors:
-                company_elem = soup.select_one(selector)
+            for selector in selectors['company']:
+                company_elem = selector.select_one(soup)
                 if company_elem:
                     company_text = company_elem.get_text().strip()
                     # Ensure we're not getting "LinkedIn" as the company
@@ -237,19 +671,13 @@ class JobDescriptionExtractor:
                 if meta_company:
                     content = meta_company.get('content', '')
                     # Try to extract company from description
-                    company_match = re.search(r'at\s+([^.]+)', content)
+                    company_match = OG_DESCRIPTION_COMPANY.search(content)
                     if company_match:
                         job_data["company"] = company_match.group(1).strip()
             
             # Extract location
-            location_selectors = [
-                'span.jobs-unified-top-card__bullet',
-                '[data-automation-id="job-location"]',
-                '.jobs-unified-top-card__primary-description-container span'
-            ]
-            
-            for selector in location_selectors:
-                location_elem = soup.select_one(selector)
+            for selector in selectors['location']:
+                location_elem = selector.select_one(soup)
                 if location_elem:
                     location_text = location_elem.get_text().strip()
                     # Make sure it's actually a location, not other metadata
@@ -259,15 +687,8 @@ class JobDescriptionExtractor:
                         break
             
             # Extract job description
-            description_selectors = [
-                'div.jobs-description__content',
-                '[data-automation-id="job-description"]',
-                '.job-details-jobs-unified-top-card__job-description',
-                'div.jobs-box__content'
-            ]
-            
-            for selector in description_selectors:
-                desc_elem = soup.select_one(selector)
+            for selector in selectors['description']:
+                desc_elem = selector.select_one(soup)
                 if desc_elem:
                     # Get text but preserve some structure
                     description_text = desc_elem.get_text(separator='\n', strip=True)
@@ -277,9 +698,11 @@ class JobDescriptionExtractor:
             
             # If no specific description found, get general content but filter out LinkedIn UI
             if not job_data["description"]:
-                all_text = soup.get_text(separator=' ', strip=True)
+                if page is not None:
+                    soup = self.make_soup(page, _platform_region('generic'))
+                all_text = self._page_description(soup)
                 # Filter out LinkedIn-specific UI text
-                filtered_text = re.sub(r'LinkedIn.*?Sign in.*?Join now', '', all_text, flags=re.DOTALL)
+                filtered_text = strip_linkedin_chrome(all_text)
                 if len(filtered_text) > 100:
                     job_data["description"] = filtered_text[:2000]
             
@@ -322,34 +745,24 @@ class JobDescriptionExtractor:
             "requirements": []
         }
         
+        selectors = _platform_selectors('generic')
         try:
-            # Common selectors for job sites
-            title_selectors = [
-                'h1', '.job-title', '.jobsearch-JobInfoHeader-title',
-                '[data-testid="job-title"]', '.job-header-title'
-            ]
-            
-            company_selectors = [
-                '.company', '.employer', '.company-name',
-                '[data-testid="company-name"]', '.jobsearch-InlineCompanyRating'
-            ]
-            
             # Extract title
-            for selector in title_selectors:
-                element = soup.select_one(selector)
+            for selector in selectors['title']:
+                element = selector.select_one(soup)
                 if element:
                     job_data["title"] = element.get_text(strip=True)
                     break
             
             # Extract company
-            for selector in company_selectors:
-                element = soup.select_one(selector)
+            for selector in selectors['company']:
+                element = selector.select_one(soup)
                 if element:
                     job_data["company"] = element.get_text(strip=True)
                     break
             
-            # Extract description (get all text content)
-            job_data["description"] = soup.get_text(separator=' ', strip=True)
+            # Extract description
+            job_data["description"] = self._page_description(soup)
             
             # Extract requirements
             if job_data["description"]:
@@ -361,38 +774,22 @@ class JobDescriptionExtractor:
         
         return job_data
     
+    def _page_description(self, soup: Any) -> str:
+        """The main content of a page, or all of its text if none stands out."""
+        page_text = soup.get_text(separator=' ', strip=True)
+        content = extract_main_content(soup)
+        if content is None:
+            logger.info("No main content found, using the whole page text")
+            return page_text
+        logger.info(
+            f"Main content kept {estimate_tokens(content)} of "
+            f"{estimate_tokens(page_text)} estimated tokens of page text"
+        )
+        return content
+    
     def _extract_requirements_from_text(self, text: str) -> List[str]:
         """Extract requirements and skills from job description text."""
-        requirements = []
-        
-        # Common requirement patterns
-        patterns = [
-            r'(?:require[sd]?|must have|need|looking for)[:\s-]*([^.!?]+)',
-            r'(?:experience with|knowledge of|proficient in|familiar with)[:\s-]*([^.!?]+)',
-            r'(?:skills?)[:\s-]*([^.!?]+)',
-            r'(?:\d+\+?\s*years?)[^.]*?(?:experience|exp)[^.]*?(?:in|with)\s+([^.!?]+)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                # Clean up the match
-                cleaned = re.sub(r'[^\w\s,+#/-]', '', match).strip()
-                if cleaned and len(cleaned) > 3 and len(cleaned) < 100:
-                    # Split by common delimiters and add individual requirements
-                    sub_requirements = [req.strip() for req in re.split(r'[,;]', cleaned) if req.strip()]
-                    requirements.extend(sub_requirements)
-        
-        # Remove duplicates and return top 10
-        seen = set()
-        unique_requirements = []
-        for req in requirements:
-            req_lower = req.lower()
-            if req_lower not in seen and len(req) > 2:
-                seen.add(req_lower)
-                unique_requirements.append(req)
-        
-        return unique_requirements[:10]
+        return extract_requirements(text, limit=10)
     
     def extract_from_text(self, text: str) -> Dict[str, Any]:
         """Extract job information from plain text with enhanced parsing."""
@@ -422,45 +819,19 @@ class JobDescriptionExtractor:
                     potential_company = lines[1]
                     if (len(potential_company) < 50 and 
                         not potential_company.lower().startswith(('location', 'we are', 'job', 'about')) and
-                        not re.match(r'^[A-Z]{2,}$', potential_company)):  # Not all caps abbreviation
+                        not is_abbreviation(potential_company)):  # Not all caps abbreviation
                         job_data["company"] = potential_company
             
             # Look for company name patterns (only if we don't have a good one already)
             if job_data["company"] == "Unknown Company":
-                company_patterns = [
-                    r'([A-Z][a-zA-Z\s&.,-]+?(?:\s+Inc\.?|\s+LLC|\s+Corp\.?|\s+Ltd\.?|\s+Co\.?))',  # Company with suffix
-                    r'(?:at|@)\s+([A-Z][a-zA-Z\s&.,-]{2,40})(?:\s|$)',  # "at Company Name"
-                    r'Company:\s*([^\n]+)',                    # "Company: Name"
-                    r'([A-Z][a-zA-Z\s&.,-]+)\s+is\s+(?:looking|seeking|hiring)',  # "Company Name is looking"
-                    r'Join\s+([A-Z][a-zA-Z\s&.,-]+?)(?:\s|$)',  # "Join Company Name"
-                ]
-                
-                for pattern in company_patterns:
-                    match = re.search(pattern, text, re.MULTILINE)
-                    if match:
-                        company_candidate = match.group(1).strip()
-                        # Filter out common false positives
-                        if (len(company_candidate) < 50 and 
-                            not any(skip in company_candidate.lower() for skip in 
-                                   ['linkedin', 'apply', 'position', 'role', 'job', 'experience', 'years'])):
-                            job_data["company"] = company_candidate
-                            break
+                company = find_company(text)
+                if company:
+                    job_data["company"] = company
             
             # Look for location patterns
-            location_patterns = [
-                r'Location:\s*([^\n]+)',
-                r'(?:Based in|Located in)\s+([^\n,]+)',
-                r'([A-Z][a-zA-Z\s]+,\s*[A-Z]{2,})',  # City, State/Country
-                r'(Remote|Hybrid|On-site)',
-            ]
-            
-            for pattern in location_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    location_candidate = match.group(1).strip()
-                    if len(location_candidate) < 50:
-                        job_data["location"] = location_candidate
-                        break
+            location = find_location(text)
+            if location:
+                job_data["location"] = location
             
             # Extract requirements with better patterns
             job_data["requirements"] = self._extract_requirements_from_text(text)
@@ -478,29 +849,7 @@ class JobDescriptionExtractor:
     
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """Extract technical skills from job description text."""
-        # Common technical skills to look for
-        skill_keywords = [
-            "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Go", "Rust", "Ruby", "PHP",
-            "React", "Angular", "Vue.js", "Node.js", "Express", "Django", "Flask", "Spring",
-            "SQL", "PostgreSQL", "MySQL", "MongoDB", "Redis", "Elasticsearch",
-            "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Jenkins", "Git", "GitHub",
-            "Machine Learning", "TensorFlow", "PyTorch", "Pandas", "NumPy", "Scikit-learn",
-            "HTML", "CSS", "Sass", "Bootstrap", "Tailwind", "REST", "GraphQL", "API",
-            "Linux", "Unix", "Windows", "macOS", "Bash", "PowerShell",
-            "Agile", "Scrum", "DevOps", "CI/CD", "Microservices", "API Design"
-        ]
-        
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in skill_keywords:
-            # Look for exact matches or common variations
-            if (skill.lower() in text_lower or 
-                skill.lower().replace('.', '') in text_lower or
-                skill.lower().replace('-', '') in text_lower):
-                found_skills.append(skill)
-        
-        return found_skills[:15]  # Return top 15 skills
+        return get_skill_matcher().find(text, limit=15)  # Return top 15 skills
 
 
 # Global instances
@@ -525,12 +874,40 @@ def process_cv_file(file_path: str) -> UserProfile:
 
 
 def extract_job_description(source: str) -> JobDescription:
-    """Extract job description from URL or text."""
+    """Extract job description from URL or text.
+    
+    Blocks while fetching a URL; for many URLs, or from async code, use
+    ``extract_job_descriptions_async``.
+    """
     if source.startswith(('http://', 'https://')):
         job_data = job_extractor.extract_from_url(source)
     else:
         job_data = job_extractor.extract_from_text(source)
     
+    return job_description_from_data(job_data)
+
+
+async def extract_job_descriptions_async(urls: Sequence[str]) -> List[Dict[str, Any]]:
+    """Fetch and parse many job posting URLs concurrently.
+    
+    Returns the extracted job data per URL, in order; build each
+    ``JobDescription`` with ``job_description_from_data`` after checking
+    for an ``error``.
+    """
+    return await job_extractor.extract_from_urls_async(urls)
+
+
+def job_description_extractions(urls: Sequence[str]) -> List[Coroutine[Any, Any, Dict[str, Any]]]:
+    """Build one extraction per job posting URL, to await separately.
+    
+    Like ``extract_job_descriptions_async``, but each page can be used as
+    soon as it has been fetched and parsed.
+    """
+    return job_extractor.extractions(urls)
+
+
+def job_description_from_data(job_data: Dict[str, Any]) -> JobDescription:
+    """Build a JobDescription from extracted job data."""
     return JobDescription(
         title=job_data.get("title", ""),
         company=job_data.get("company", ""),
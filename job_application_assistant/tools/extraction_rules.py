@@ -0,0 +1,131 @@
+"""Precompiled regex rules for extracting job and CV fields from text.
+
+Every pattern is compiled once at import. Repetitions that can run over
+long stretches of text are bounded, so no pattern backtracks more than a
+fixed number of characters from any starting position and each scan stays
+linear in the input size, even for very large pasted postings.
+"""
+
+import re
+from typing import Dict, List, Optional, Pattern, Tuple
+
+# Candidates longer than this are rejected, so patterns need not look further
+MAX_FIELD_LENGTH = 50
+
+# Longest requirement phrase captured before a sentence break
+MAX_REQUIREMENT_LENGTH = 200
+
+# Words that mark a company candidate as a false positive
+COMPANY_STOPWORDS = ("linkedin", "apply", "position", "role", "job", "experience", "years")
+
+# Contact details
+EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Za-z]{2,24}\b")
+PHONE_PATTERN = re.compile(r"[\+]?[1-9]?[0-9]{7,15}")
+
+# An all-caps abbreviation line, which is rarely a company name
+ABBREVIATION_PATTERN = re.compile(r"^[A-Z]{2,}$")
+
+# Company name patterns, most specific first
+_NAME = rf"[A-Z][a-zA-Z\s&.,-]{{1,{MAX_FIELD_LENGTH}}}"
+COMPANY_PATTERNS: Tuple[Pattern[str], ...] = (
+    re.compile(rf"({_NAME}?(?:\s+Inc\.?|\s+LLC|\s+Corp\.?|\s+Ltd\.?|\s+Co\.?))"),  # Company with suffix
+    re.compile(r"(?:at|@)\s+([A-Z][a-zA-Z\s&.,-]{2,40})(?:\s|$)", re.MULTILINE),  # "at Company Name"
+    re.compile(r"Company:\s*([^\n]{1,200})"),  # "Company: Name"
+    re.compile(rf"({_NAME})\s+is\s+(?:looking|seeking|hiring)"),  # "Company Name is looking"
+    re.compile(rf"Join\s+({_NAME}?)(?:\s|$)", re.MULTILINE),  # "Join Company Name"
+)
+
+# Location patterns, most specific first
+LOCATION_PATTERNS: Tuple[Pattern[str], ...] = (
+    re.compile(r"Location:\s*([^\n]{1,200})", re.IGNORECASE),
+    re.compile(r"(?:Based in|Located in)\s+([^\n,]{1,200})", re.IGNORECASE),
+    re.compile(rf"([A-Z][a-zA-Z\s]{{1,{MAX_FIELD_LENGTH}}},\s*[A-Z]{{2,}})", re.IGNORECASE),  # City, State/Country
+    re.compile(r"(Remote|Hybrid|On-site)", re.IGNORECASE),
+)
+
+# Requirement phrases; a capture that reaches the bound had no sentence break
+_PHRASE = rf"([^.!?]{{1,{MAX_REQUIREMENT_LENGTH}}})"
+REQUIREMENT_PATTERNS: Tuple[Pattern[str], ...] = tuple(
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in (
+        rf"(?:require[sd]?|must have|need|looking for)[:\s-]*{_PHRASE}",
+        rf"(?:experience with|knowledge of|proficient in|familiar with)[:\s-]*{_PHRASE}",
+        rf"(?:skills?)[:\s-]*{_PHRASE}",
+        rf"(?:\d+\+?\s*years?)[^.]{{0,80}}?(?:experience|exp)[^.]{{0,80}}?(?:in|with)\s+{_PHRASE}",
+    )
+)
+REQUIREMENT_NOISE = re.compile(r"[^\w\s,+#/-]")
+REQUIREMENT_SEPARATOR = re.compile(r"[,;]")
+
+# LinkedIn page chrome around the public job view
+LINKEDIN_CHROME = re.compile(r"LinkedIn.{0,2000}?Sign in.{0,2000}?Join now", re.DOTALL)
+OG_DESCRIPTION_COMPANY = re.compile(r"at\s+([^.]{1,200})")
+
+
+def extract_contact_info(text: str) -> Dict[str, str]:
+    """Find the first email address and phone number in text."""
+    contact_info = {}
+    email = EMAIL_PATTERN.search(text)
+    if email:
+        contact_info["email"] = email.group(0)
+    phone = PHONE_PATTERN.search(text)
+    if phone:
+        contact_info["phone"] = phone.group(0)
+    return contact_info
+
+
+def is_abbreviation(line: str) -> bool:
+    """Check whether a line is an all-caps abbreviation."""
+    return ABBREVIATION_PATTERN.match(line) is not None
+
+
+def find_company(text: str) -> Optional[str]:
+    """Find a company name using the company patterns in priority order."""
+    for pattern in COMPANY_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            candidate = match.group(1).strip()
+            if len(candidate) < MAX_FIELD_LENGTH and not any(
+                skip in candidate.lower() for skip in COMPANY_STOPWORDS
+            ):
+                return candidate
+    return None
+
+
+def find_location(text: str) -> Optional[str]:
+    """Find a location using the location patterns in priority order."""
+    for pattern in LOCATION_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            candidate = match.group(1).strip()
+            if len(candidate) < MAX_FIELD_LENGTH:
+                return candidate
+    return None
+
+
+def extract_requirements(text: str, limit: int = 10) -> List[str]:
+    """Extract requirement phrases, deduplicated case-insensitively."""
+    requirements = []
+    for pattern in REQUIREMENT_PATTERNS:
+        for match in pattern.findall(text):
+            if len(match) >= MAX_REQUIREMENT_LENGTH:
+                continue
+            cleaned = REQUIREMENT_NOISE.sub("", match).strip()
+            if 3 < len(cleaned) < 100:
+                requirements.extend(
+                    req.strip() for req in REQUIREMENT_SEPARATOR.split(cleaned) if req.strip()
+                )
+
+    seen = set()
+    unique_requirements = []
+    for req in requirements:
+        req_lower = req.lower()
+        if req_lower not in seen and len(req) > 2:
+            seen.add(req_lower)
+            unique_requirements.append(req)
+    return unique_requirements[:limit]
+
+
+def strip_linkedin_chrome(text: str) -> str:
+    """Remove LinkedIn sign-in chrome from page text."""
+    return LINKEDIN_CHROME.sub("", text)
@@ -0,0 +1,103 @@
+"""HTML parser backends, partial parsing and precompiled selectors for job pages."""
+
+import logging
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+try:
+    import soupsieve
+    from bs4.builder import builder_registry
+    from bs4.filter import ElementFilter
+except ImportError:
+    soupsieve = builder_registry = None
+    ElementFilter = object
+
+logger = logging.getLogger(__name__)
+
+# BeautifulSoup tree builders in order of preference, fastest first
+PARSER_PREFERENCE = ("lxml", "html.parser")
+
+# Elements whose content never reaches the extracted text
+NON_CONTENT_ELEMENTS = frozenset({
+    "script", "style", "noscript", "template", "svg", "iframe", "link", "meta",
+})
+DOCUMENT_ELEMENTS = frozenset({"html", "head", "body"})
+
+
+def available_parsers() -> List[str]:
+    """Installed parsers from ``PARSER_PREFERENCE``, fastest first."""
+    if builder_registry is None:
+        return []
+    return [name for name in PARSER_PREFERENCE if builder_registry.lookup(name)]
+
+
+@lru_cache(maxsize=None)
+def resolve_parser(name: Optional[str] = None) -> str:
+    """The parser to use: ``name`` if it is installed, else the fastest available."""
+    if name and builder_registry is not None and builder_registry.lookup(name):
+        return name
+    if name:
+        logger.warning(f"HTML parser {name!r} is not installed, falling back to the fastest available")
+    available = available_parsers()
+    return available[0] if available else "html.parser"
+
+
+def _classes(attrs: Mapping[str, Any]) -> List[str]:
+    classes = attrs.get("class") or []
+    return classes.split() if isinstance(classes, str) else list(classes)
+
+
+class RegionFilter(ElementFilter):
+    """Build only the regions of a page that a parser reads.
+
+    Passed to BeautifulSoup as ``parse_only``. Each element is offered to
+    ``keep(name, attrs)`` until one is accepted: an accepted element is
+    kept with everything inside it, a rejected one is left out of the tree
+    but its children are still offered. Text outside any kept element is
+    dropped.
+    """
+
+    def __init__(self, keep: Callable[[str, Mapping[str, Any]], bool]):
+        super().__init__()
+        self.keep = keep
+
+    def allow_tag_creation(self, nsprefix: Optional[str], name: str, attrs: Optional[Mapping[str, Any]]) -> bool:
+        return self.keep(name, attrs or {})
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+
+def page_text_region() -> RegionFilter:
+    """Every element of the page body except scripts, styles and embeds."""
+    return RegionFilter(
+        lambda name, attrs: name not in DOCUMENT_ELEMENTS and name not in NON_CONTENT_ELEMENTS
+    )
+
+
+def class_region(
+    class_prefixes: Sequence[str],
+    names: Sequence[str] = (),
+    attributes: Sequence[str] = (),
+    meta_properties: Sequence[str] = (),
+) -> RegionFilter:
+    """Elements with a class starting with one of ``class_prefixes``.
+
+    Also keeps elements named in ``names``, elements carrying one of
+    ``attributes``, and ``<meta>`` tags with one of ``meta_properties``.
+    """
+    prefixes = tuple(class_prefixes)
+
+    def keep(name: str, attrs: Mapping[str, Any]) -> bool:
+        if name == "meta":
+            return attrs.get("property") in meta_properties
+        if name in names or any(attribute in attrs for attribute in attributes):
+            return True
+        return any(cls.startswith(prefixes) for cls in _classes(attrs))
+
+    return RegionFilter(keep)
+
+
+def compile_selectors(selectors: Mapping[str, Sequence[str]]) -> Dict[str, List[Any]]:
+    """Compile each field's CSS selector list once, keeping their priority order."""
+    return {field: [soupsieve.compile(selector) for selector in patterns] for field, patterns in selectors.items()}
@@ -0,0 +1,187 @@
+"""Main-content extraction for job pages, in the style of Readability.
+
+The whole-page text of a job page is mostly navigation, cookie banners,
+footers and "similar jobs" lists, and every agent prompt re-sends the
+description. This finds the block holding the posting instead:
+
+1. Elements that are page chrome by tag (``nav``, ``footer``, ...) or by
+   class/id hints (``related``, ``cookie``, ...) are skipped.
+2. Each paragraph-like element scores its ancestors by its text length
+   and comma count, so the container of most prose scores highest.
+3. Scores are scaled down by link density, the best container is taken,
+   along with siblings that score nearly as well.
+"""
+
+import math
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from bs4 import CData, NavigableString, Tag
+except ImportError:
+    CData = NavigableString = Tag = None
+
+# Rough prompt tokens per character for English text
+CHARS_PER_TOKEN = 4
+
+# Shortest main content accepted; shorter results fall back to the page text
+MIN_CONTENT_CHARS = 200
+MIN_PARAGRAPH_CHARS = 25
+
+SKIPPED_ELEMENTS = frozenset({
+    "nav", "header", "footer", "aside", "form", "button", "select", "dialog",
+    "script", "style", "noscript", "template", "svg", "iframe",
+})
+SKIPPED_ROLES = frozenset({"navigation", "banner", "contentinfo", "complementary", "dialog", "alertdialog"})
+PARAGRAPH_ELEMENTS = frozenset({"p", "li", "pre", "td", "dd", "blockquote"})
+BLOCK_ELEMENTS = frozenset({
+    "address", "article", "blockquote", "dd", "div", "dl", "dt", "h1", "h2", "h3", "h4", "h5", "h6",
+    "li", "main", "ol", "p", "pre", "section", "table", "td", "th", "tr", "ul", "br",
+})
+TAG_SCORES = {
+    "div": 5, "article": 5, "main": 5, "section": 3, "pre": 3, "td": 3, "blockquote": 3,
+    "ol": -3, "ul": -3, "dl": -3, "dd": -3, "dt": -3, "li": -3, "form": -3,
+    "h1": -5, "h2": -5, "h3": -5, "h4": -5, "h5": -5, "h6": -5, "th": -5,
+}
+
+UNLIKELY_HINTS = re.compile(
+    r"nav|menu|footer|header|sidebar|related|similar|recommend|cookie|consent|gdpr|banner|"
+    r"breadcrumb|share|social|promo|advert|sponsor|comment|login|signup|sign-up|subscribe|"
+    r"newsletter|modal|popup",
+    re.IGNORECASE,
+)
+LIKELY_HINTS = re.compile(
+    r"description|posting|vacancy|article|content|entry|main|body|details|text|story",
+    re.IGNORECASE,
+)
+NEGATIVE_HINTS = re.compile(r"meta|widget|tool|tags|contact|media|card", re.IGNORECASE)
+
+_SPACES = re.compile(r"\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate prompt tokens of a text."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _hints(tag: Any) -> str:
+    classes = tag.get("class") or []
+    if isinstance(classes, str):
+        classes = [classes]
+    return " ".join([*classes, tag.get("id") or ""])
+
+
+def _is_chrome(tag: Any) -> bool:
+    """Whether an element is page chrome, skipped with everything inside it."""
+    if tag.name in SKIPPED_ELEMENTS or tag.get("role") in SKIPPED_ROLES or tag.has_attr("hidden"):
+        return True
+    hints = _hints(tag)
+    return bool(UNLIKELY_HINTS.search(hints)) and not LIKELY_HINTS.search(hints)
+
+
+def _strings(node: Any) -> Iterator[Tuple[str, bool]]:
+    """Visible text under ``node`` as ``(text, in_link)``, block breaks as newlines."""
+    for child in node.children:
+        if isinstance(child, Tag):
+            if _is_chrome(child):
+                continue
+            block = child.name in BLOCK_ELEMENTS
+            if block:
+                yield "\n", False
+            for text, in_link in _strings(child):
+                yield text, in_link or child.name == "a"
+            if block:
+                yield "\n", False
+        elif type(child) in (NavigableString, CData):
+            yield str(child), False
+
+
+def _text(node: Any) -> Tuple[str, float]:
+    """Text of a node, one line per block, and the share of it inside links."""
+    parts: List[str] = []
+    link_chars = 0
+    for text, in_link in _strings(node):
+        parts.append(text)
+        if in_link:
+            link_chars += len(text.strip())
+    lines = (_SPACES.sub(" ", line).strip() for line in "".join(parts).split("\n"))
+    text = "\n".join(line for line in lines if line)
+    return text, (link_chars / len(text) if text else 0.0)
+
+
+def _paragraphs(node: Any) -> Iterator[Any]:
+    """Paragraph-like elements outside page chrome, outermost only."""
+    for child in node.children:
+        if not isinstance(child, Tag) or _is_chrome(child):
+            continue
+        if child.name in PARAGRAPH_ELEMENTS or (
+            child.name == "div" and not any(
+                isinstance(c, Tag) and c.name in BLOCK_ELEMENTS for c in child.children
+            )
+        ):
+            yield child
+        else:
+            yield from _paragraphs(child)
+
+
+def _initial_score(tag: Any) -> float:
+    score = float(TAG_SCORES.get(tag.name, 0))
+    hints = _hints(tag)
+    if hints:
+        if LIKELY_HINTS.search(hints):
+            score += 25
+        if NEGATIVE_HINTS.search(hints):
+            score -= 25
+    return score
+
+
+def _score_candidates(root: Any) -> Dict[int, List[Any]]:
+    """Score the ancestors of every paragraph; returns ``{id: [tag, score]}``."""
+    candidates: Dict[int, List[Any]] = {}
+    for paragraph in _paragraphs(root):
+        text, _ = _text(paragraph)
+        if len(text) < MIN_PARAGRAPH_CHARS:
+            continue
+        score = 1 + text.count(",") + min(len(text) / 100, 3)
+        ancestor, level = paragraph.parent, 0
+        while ancestor is not None and ancestor.name not in ("body", "html", "[document]") and level < 3:
+            entry = candidates.get(id(ancestor))
+            if entry is None:
+                entry = candidates[id(ancestor)] = [ancestor, _initial_score(ancestor)]
+            entry[1] += score / (1 if level == 0 else 2 if level == 1 else level * 3)
+            ancestor, level = ancestor.parent, level + 1
+    return candidates
+
+
+def extract_main_content(root: Any, min_chars: int = MIN_CONTENT_CHARS) -> Optional[str]:
+    """Text of the main content of a parsed page, one line per block.
+
+    Returns None when no block of at least ``min_chars`` stands out, so the
+    caller can fall back to the page text.
+    """
+    try:
+        candidates = _score_candidates(root)
+        if not candidates:
+            return None
+        scored = []
+        for tag, score in candidates.values():
+            text, link_density = _text(tag)
+            scored.append((score * (1 - link_density), tag, text))
+        top_score, top, top_text = max(scored, key=lambda entry: entry[0])
+
+        # Siblings scoring close to the best block are part of the content
+        final = {id(tag): (score, text) for score, tag, text in scored}
+        threshold = max(10.0, top_score * 0.2)
+        blocks = []
+        for sibling in top.parent.children if top.parent is not None else [top]:
+            if sibling is top:
+                blocks.append(top_text)
+            elif isinstance(sibling, Tag) and not _is_chrome(sibling):
+                score, text = final.get(id(sibling), (0.0, ""))
+                if score >= threshold and text:
+                    blocks.append(text)
+    except RecursionError:
+        return None
+
+    content = "\n".join(blocks)
+    return content if len(content) >= min_chars else None
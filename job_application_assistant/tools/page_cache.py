@@ -0,0 +1,144 @@
+"""On-disk HTTP cache for job pages.
+
+Pages are stored under a hash of their normalized URL, so links that only
+differ in tracking parameters share an entry. Each entry holds the raw
+body, its validators (``ETag`` / ``Last-Modified``) and the job data
+parsed from it. Cached pages are revalidated with a conditional GET; on
+``304 Not Modified`` the stored job data is used without downloading or
+parsing the page again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = frozenset({
+    "gclid", "dclid", "fbclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid", "_ga", "_gl",
+    "ref", "refid", "trk", "trkinfo", "trackingid", "lipi", "ebp",
+})
+TRACKING_PREFIXES = ("utm_",)
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a page URL, for cache keys.
+
+    Lowercases the scheme and host, drops default ports, the fragment and
+    tracking parameters, and sorts the remaining query parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    if port is not None and (scheme, port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{port}"
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+@dataclass
+class CachedPage:
+    """A cached job page and the job data parsed from it, if still current."""
+
+    directory: Path
+    etag: Optional[str]
+    last_modified: Optional[str]
+    job_data: Optional[Dict[str, Any]]
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers asking the server to answer 304 if the page is unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def body(self) -> bytes:
+        """The raw page as last downloaded."""
+        return (self.directory / "body.html").read_bytes()
+
+
+class PageCache:
+    """Job pages on disk, keyed by normalized URL.
+
+    ``parse_version`` is stored with the job data; cached job data from
+    another version is ignored and the page is re-parsed from its body.
+    """
+
+    def __init__(self, directory: Path, parse_version: str):
+        self.directory = Path(directory)
+        self.parse_version = parse_version
+
+    def _entry_dir(self, url: str) -> Path:
+        return self.directory / hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """The cached entry for a URL, or None if there is none."""
+        directory = self._entry_dir(url)
+        try:
+            meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not (directory / "body.html").exists():
+            return None
+        job_data = None
+        try:
+            parsed = json.loads((directory / "job.json").read_text(encoding="utf-8"))
+            if parsed.get("version") == self.parse_version:
+                job_data = parsed["job"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return CachedPage(directory, meta.get("etag"), meta.get("last_modified"), job_data)
+
+    def store(self, url: str, headers: Mapping[str, str], content: bytes, job_data: Dict[str, Any]) -> None:
+        """Cache a downloaded page and its job data.
+
+        Pages without validators can never be revalidated, and pages marked
+        ``no-store`` must not be kept, so neither is stored.
+        """
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        if not (etag or last_modified) or "no-store" in headers.get("Cache-Control", "").lower():
+            return
+        directory = self._entry_dir(url)
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            _write_atomic(directory / "body.html", content)
+            self.store_job(CachedPage(directory, etag, last_modified, job_data), job_data)
+            meta = {
+                "url": normalize_url(url),
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": time.time(),
+            }
+            _write_atomic(directory / "meta.json", json.dumps(meta).encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"Could not cache job page {url}: {e}")
+
+    def store_job(self, page: CachedPage, job_data: Dict[str, Any]) -> None:
+        """Store the job data parsed from a cached page."""
+        page.job_data = job_data
+        try:
+            _write_atomic(
+                page.directory / "job.json",
+                json.dumps({"version": self.parse_version, "job": job_data}).encode("utf-8"),
+            )
+        except OSError as e:
+            logger.warning(f"Could not cache job data in {page.directory}: {e}")
@@ -0,0 +1,147 @@
+"""Skill taxonomy and single-pass skill matching."""
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+from job_application_assistant.core.exceptions import ConfigurationError
+from job_application_assistant.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Taxonomy shipped with the package
+DEFAULT_TAXONOMY_PATH = Path(__file__).parent / "data" / "skills.json"
+
+# Characters that continue a term, e.g. "C" in "C++" or "Java" in "JavaScript"
+_TERM_CHARS = r"\w+#"
+
+
+@dataclass
+class Skill:
+    """A canonical skill name with the spellings that refer to it."""
+
+    name: str
+    aliases: List[str] = field(default_factory=list)
+    # Match the name only with its exact casing, for names that are also
+    # common words ("Go", "Rust"); aliases always match case-insensitively
+    case_sensitive: bool = False
+
+    def spellings(self, include_name: bool = True) -> List[str]:
+        """The canonical name, its aliases and their punctuation-free variants."""
+        spellings: List[str] = []
+        terms = [self.name, *self.aliases] if include_name else list(self.aliases)
+        for term in terms:
+            for variant in (
+                term,
+                term.replace(".", ""),
+                term.replace("-", ""),
+                term.replace("-", " "),
+            ):
+                variant = variant.strip()
+                if variant and variant not in spellings:
+                    spellings.append(variant)
+        return spellings
+
+
+def load_taxonomy(path: Union[str, Path]) -> List[Skill]:
+    """Load skills from a JSON list of ``{"name", "aliases", "case_sensitive"}``."""
+    try:
+        entries = json.loads(Path(path).read_text(encoding="utf-8"))
+        return [
+            Skill(
+                name=entry["name"],
+                aliases=list(entry.get("aliases", [])),
+                case_sensitive=bool(entry.get("case_sensitive", False)),
+            )
+            for entry in entries
+        ]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise ConfigurationError(f"Invalid skill taxonomy file: {path}", details=str(e)) from e
+
+
+def merge_taxonomies(*taxonomies: Iterable[Skill]) -> List[Skill]:
+    """Merge taxonomies; later entries extend or override earlier ones by name."""
+    merged: Dict[str, Skill] = {}
+    for taxonomy in taxonomies:
+        for skill in taxonomy:
+            existing = merged.get(skill.name.lower())
+            if existing is None:
+                merged[skill.name.lower()] = Skill(
+                    skill.name, list(skill.aliases), skill.case_sensitive
+                )
+            else:
+                existing.aliases.extend(a for a in skill.aliases if a not in existing.aliases)
+                existing.case_sensitive = skill.case_sensitive
+    return list(merged.values())
+
+
+class SkillMatcher:
+    """Find taxonomy skills in text with one precompiled regex.
+
+    Every spelling of every skill goes into a single alternation, longest
+    first, so all skills are found in one pass with one compiled pattern.
+    Matches must not be embedded in a longer term, so "Java" does not match
+    inside "JavaScript" and "Go" does not match inside "Google".
+    """
+
+    def __init__(self, skills: Sequence[Skill]):
+        self.skills = list(skills)
+        self._canonical: Dict[str, str] = {}
+        self._canonical_exact: Dict[str, str] = {}
+
+        alternatives = []
+        for skill in self.skills:
+            if skill.case_sensitive:
+                for spelling in Skill(skill.name).spellings():
+                    self._canonical_exact[spelling] = skill.name
+                    alternatives.append((spelling, f"(?-i:{re.escape(spelling)})"))
+            for spelling in skill.spellings(include_name=not skill.case_sensitive):
+                self._canonical.setdefault(spelling.lower(), skill.name)
+                alternatives.append((spelling, re.escape(spelling)))
+
+        alternatives.sort(key=lambda item: len(item[0]), reverse=True)
+        pattern = "|".join(regex for _, regex in alternatives) or r"(?!)"
+        self._regex = re.compile(
+            rf"(?<![{_TERM_CHARS}])(?:{pattern})(?![{_TERM_CHARS}])", re.IGNORECASE
+        )
+
+    def canonicalize(self, term: str) -> Optional[str]:
+        """Map a spelling such as "nodejs" to its canonical skill name."""
+        return self._canonical_exact.get(term) or self._canonical.get(term.lower())
+
+    def find(self, text: str, limit: Optional[int] = None) -> List[str]:
+        """Return canonical skills found in text, in order of first mention."""
+        found: List[str] = []
+        seen = set()
+        for match in self._regex.finditer(text):
+            name = self.canonicalize(match.group(0))
+            if name and name not in seen:
+                seen.add(name)
+                found.append(name)
+                if limit is not None and len(found) >= limit:
+                    break
+        return found
+
+
+_matchers: Dict[Optional[Path], SkillMatcher] = {}
+
+
+def get_skill_matcher(extra_taxonomy: Optional[Union[str, Path]] = None) -> SkillMatcher:
+    """Get the shared matcher for the default taxonomy plus an optional user file.
+
+    Without an explicit file, ``Settings.skills_taxonomy_file`` is used.
+    """
+    if extra_taxonomy is None:
+        from job_application_assistant.core.config import get_settings
+        extra_taxonomy = get_settings().skills_taxonomy_file
+
+    key = Path(extra_taxonomy) if extra_taxonomy else None
+    if key not in _matchers:
+        taxonomies = [load_taxonomy(DEFAULT_TAXONOMY_PATH)]
+        if key is not None:
+            taxonomies.append(load_taxonomy(key))
+            logger.info(f"Loaded user skill taxonomy from {key}")
+        _matchers[key] = SkillMatcher(merge_taxonomies(*taxonomies))
+    return _matchers[key]
@@ -0,0 +1,249 @@
+"""Job data from schema.org JobPosting markup (JSON-LD and microdata).
+
+Most job boards embed the posting as structured data for search engines,
+with a clean description and no page chrome. Reading it needs no DOM:
+JSON-LD blocks are found with a regex over the raw bytes, and microdata
+with a streaming ``html.parser`` pass that is only made when the page
+declares a JobPosting item and stops at the end of that item.
+"""
+
+import html
+import json
+import re
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_JSON_LD = re.compile(
+    rb"<script[^>]*type\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_MICRODATA_JOB = re.compile(rb"itemtype\s*=\s*[\"']?https?://schema\.org/JobPosting", re.IGNORECASE)
+
+_BLOCK_TAG = re.compile(r"</?(?:p|div|br|li|ul|ol|h[1-6]|section|tr|table)\b[^>]*>", re.IGNORECASE)
+_TAG = re.compile(r"<[^>]+>")
+_SPACES = re.compile(r"[ \t\r\f\v\xa0]+")
+
+_BLOCK_ELEMENTS = frozenset({
+    "p", "div", "br", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6", "section", "tr", "table",
+})
+_VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr",
+})
+
+EMPLOYMENT_TYPES = {
+    "FULL_TIME": "Full-time",
+    "PART_TIME": "Part-time",
+    "CONTRACTOR": "Contract",
+    "TEMPORARY": "Temporary",
+    "INTERN": "Internship",
+}
+
+
+def _clean_lines(text: str) -> str:
+    lines = (_SPACES.sub(" ", line).strip() for line in text.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def html_to_text(fragment: str) -> str:
+    """Plain text of an HTML fragment, one line per block element.
+
+    Descriptions are often HTML escaped inside the JSON, so escaped markup
+    is unescaped before the tags are removed.
+    """
+    if "&lt;" in fragment:
+        fragment = html.unescape(fragment)
+    text = _TAG.sub("", _BLOCK_TAG.sub("\n", fragment))
+    return _clean_lines(html.unescape(text))
+
+
+def _iter_items(data: Any) -> Iterator[Dict[str, Any]]:
+    """Every JSON-LD node, including those nested in lists and ``@graph``."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_items(item)
+    elif isinstance(data, dict):
+        yield data
+        if "@graph" in data:
+            yield from _iter_items(data["@graph"])
+
+
+def _is_job_posting(item: Dict[str, Any]) -> bool:
+    types = item.get("@type")
+    types = types if isinstance(types, list) else [types]
+    return any(isinstance(t, str) and t.rsplit("/", 1)[-1].rsplit(":", 1)[-1] == "JobPosting" for t in types)
+
+
+def _first(value: Any) -> Any:
+    return value[0] if isinstance(value, list) and value else value
+
+
+def _name(value: Any) -> Optional[str]:
+    """The name of a schema.org Thing given inline or as a bare string."""
+    value = _first(value)
+    if isinstance(value, dict):
+        value = value.get("name")
+    return value.strip() if isinstance(value, str) and value.strip() else None
+
+
+def _location(posting: Dict[str, Any]) -> Optional[str]:
+    parts: List[str] = []
+    place = _first(posting.get("jobLocation"))
+    address = place.get("address") if isinstance(place, dict) else place
+    if isinstance(address, dict):
+        for key in ("addressLocality", "addressRegion", "addressCountry"):
+            part = _name(address.get(key))
+            if part and part not in parts:
+                parts.append(part)
+    elif isinstance(address, str) and address.strip():
+        parts.append(address.strip())
+    if str(posting.get("jobLocationType", "")).upper() == "TELECOMMUTE":
+        parts.append("Remote")
+    return ", ".join(parts) or None
+
+
+def _employment_type(value: Any) -> Optional[str]:
+    value = _first(value)
+    if not isinstance(value, str) or not value.strip():
+        return None
+    key = value.strip().upper().replace("-", "_").replace(" ", "_")
+    return EMPLOYMENT_TYPES.get(key, value.strip())
+
+
+def _skills(value: Any) -> List[str]:
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, list):
+        return []
+    skills = (_name(item) for item in value)
+    return [skill for skill in skills if skill]
+
+
+def _job_fields(posting: Dict[str, Any], description: str, source: str) -> Optional[Dict[str, Any]]:
+    title = _name(posting.get("title")) or _name(posting.get("name"))
+    if not title:
+        return None
+    fields = {
+        "title": html.unescape(title),
+        "company": _name(posting.get("hiringOrganization")),
+        "location": _location(posting),
+        "description": description,
+        "employment_type": _employment_type(posting.get("employmentType")),
+        "skills": _skills(posting.get("skills")),
+        "source": source,
+    }
+    return {key: value for key, value in fields.items() if value}
+
+
+def _json_ld_posting(content: bytes) -> Optional[Dict[str, Any]]:
+    for match in _JSON_LD.finditer(content):
+        try:
+            data = json.loads(match.group(1).decode("utf-8", errors="replace"), strict=False)
+        except ValueError:
+            continue
+        for item in _iter_items(data):
+            if _is_job_posting(item):
+                description = item.get("description")
+                fields = _job_fields(
+                    item, html_to_text(description) if isinstance(description, str) else "", "json-ld"
+                )
+                if fields:
+                    return fields
+    return None
+
+
+class _MicrodataEnd(Exception):
+    """Raised to stop parsing once the JobPosting item is closed."""
+
+
+class _MicrodataParser(HTMLParser):
+    """Collect the properties of the first JobPosting microdata item."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.posting: Optional[Dict[str, Any]] = None
+        # Open elements: (tag, item opened by it, text capture opened by it)
+        self._open: List[Tuple[str, Optional[Dict[str, Any]], Optional[List[Any]]]] = []
+        self._items: List[Dict[str, Any]] = []
+        self._captures: List[List[Any]] = []  # [item, property, text parts]
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        attributes = dict(attrs)
+        prop = attributes.get("itemprop")
+        item = capture = None
+
+        if tag in _BLOCK_ELEMENTS:
+            for open_capture in self._captures:
+                open_capture[2].append("\n")
+
+        if "itemscope" in attributes:
+            item_type = (attributes.get("itemtype") or "").rsplit("/", 1)[-1]
+            if self._items and prop:
+                item = {"@type": item_type}
+                self._items[-1].setdefault(prop, item)
+            elif self.posting is None and item_type == "JobPosting":
+                item = self.posting = {"@type": item_type}
+            if item is not None:
+                self._items.append(item)
+        elif prop and self._items:
+            value = attributes.get("content") or attributes.get("datetime")
+            if value is None and tag in ("a", "link"):
+                value = attributes.get("href")
+            if value is not None:
+                self._items[-1].setdefault(prop, value)
+            elif tag not in _VOID_ELEMENTS:
+                capture = [self._items[-1], prop, []]
+                self._captures.append(capture)
+
+        if tag not in _VOID_ELEMENTS and (self._items or item is not None):
+            self._open.append((tag, item, capture))
+
+    def handle_data(self, data: str) -> None:
+        for capture in self._captures:
+            capture[2].append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if not any(open_tag == tag for open_tag, _, _ in self._open):
+            return
+        while self._open:
+            open_tag, item, capture = self._open.pop()
+            if capture is not None:
+                self._captures.remove(capture)
+                owner, prop, parts = capture
+                owner.setdefault(prop, "".join(parts))
+            if item is not None:
+                self._items.pop()
+                if item is self.posting:
+                    raise _MicrodataEnd
+            if open_tag == tag:
+                return
+
+
+def _microdata_posting(content: bytes) -> Optional[Dict[str, Any]]:
+    start = _MICRODATA_JOB.search(content)
+    if start is None:
+        return None
+    # Parse from the start of the element declaring the item
+    element_start = content.rfind(b"<", 0, start.start())
+    parser = _MicrodataParser()
+    try:
+        parser.feed(content[element_start:].decode("utf-8", errors="replace"))
+        parser.close()
+    except _MicrodataEnd:
+        pass
+    if parser.posting is None:
+        return None
+    description = parser.posting.get("description")
+    return _job_fields(
+        parser.posting, _clean_lines(description) if isinstance(description, str) else "", "microdata"
+    )
+
+
+def find_job_posting(content: bytes) -> Optional[Dict[str, Any]]:
+    """Read the first schema.org JobPosting on a page, without building a DOM.
+
+    JSON-LD is preferred over microdata. Returns the job data fields found
+    (``title``, ``company``, ``location``, ``description`` as plain text,
+    ``employment_type``, ``skills``) plus ``source``, or None when the page
+    has no JobPosting with a title.
+    """
+    return _json_ld_posting(content) or _microdata_posting(content)
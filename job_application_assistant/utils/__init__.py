@@ -4,10 +4,12 @@ from .streamlit_helpers import (
     StreamlitJobApplicationAgent,
     StreamlitInterviewPreparationAgent,
     run_async_in_streamlit,
+    iterate_async_in_streamlit,
 )
 
 __all__ = [
     "StreamlitJobApplicationAgent",
     "StreamlitInterviewPreparationAgent", 
     "run_async_in_streamlit",
+    "iterate_async_in_streamlit",
 ]
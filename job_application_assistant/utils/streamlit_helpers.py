@@ -1,10 +1,54 @@
 """Streamlit helper utilities for async operations."""
 
 import asyncio
-from typing import Any, Callable, Dict
+import queue
+import threading
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional
 from concurrent.futures import ThreadPoolExecutor
 import functools
 
+from job_application_assistant.core.admission import INTERACTIVE, request_context
+from job_application_assistant.core.config import get_settings
+
+
+def _session_caller() -> str:
+    """Identify the browser session, so LLM calls are queued fairly per user."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        if ctx is not None:
+            return f"web:{ctx.session_id}"
+    except Exception:
+        pass
+    return "web"
+
+
+def _interactive(async_func: Callable) -> Callable:
+    """Run a coroutine function's LLM calls at interactive priority for this session.
+
+    Calls queue at most ``Settings.request_timeout`` seconds, so a busy
+    server answers the page with an error instead of hanging it.
+    """
+    caller = _session_caller()
+    
+    @functools.wraps(async_func)
+    async def wrapper(*args, **kwargs):
+        with request_context(INTERACTIVE, caller, queue_timeout=get_settings().request_timeout):
+            return await async_func(*args, **kwargs)
+    return wrapper
+
+
+def _interactive_gen(async_gen_func: Callable[..., AsyncIterator[Any]]) -> Callable[..., AsyncIterator[Any]]:
+    """Async generator version of ``_interactive``."""
+    caller = _session_caller()
+    
+    @functools.wraps(async_gen_func)
+    async def wrapper(*args, **kwargs):
+        with request_context(INTERACTIVE, caller, queue_timeout=get_settings().request_timeout):
+            async for item in async_gen_func(*args, **kwargs):
+                yield item
+    return wrapper
+
 
 def run_async_in_streamlit(async_func: Callable, *args, **kwargs) -> Any:
     """
@@ -27,6 +71,42 @@ def run_async_in_streamlit(async_func: Callable, *args, **kwargs) -> Any:
         return asyncio.run(async_func(*args, **kwargs))
 
 
+def iterate_async_in_streamlit(
+    async_gen_func: Callable[..., AsyncIterator[Any]], *args, **kwargs
+) -> Iterator[Any]:
+    """
+    Consume an async generator from Streamlit's synchronous script thread.
+    The generator runs on its own event loop in a background thread and
+    items are handed over through a queue as soon as they are produced.
+    """
+    items: "queue.Queue[Any]" = queue.Queue()
+    done = object()
+    
+    async def pump():
+        async for item in async_gen_func(*args, **kwargs):
+            items.put(item)
+    
+    def run():
+        try:
+            asyncio.run(pump())
+        except BaseException as e:
+            items.put(e)
+        finally:
+            items.put(done)
+    
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    
+    while True:
+        item = items.get()
+        if item is done:
+            break
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+    thread.join()
+
+
 class StreamlitJobApplicationAgent:
     """Synchronous wrapper for JobApplicationAgent for Streamlit."""
     
@@ -34,14 +114,36 @@ class StreamlitJobApplicationAgent:
         from job_application_assistant.agents.job_application_agent import JobApplicationAgent
         self.agent = JobApplicationAgent()
     
-    def process_application(self, job_description, user_profile, user_preferences) -> Dict[str, Any]:
+    def process_application(
+        self, job_description, user_profile, user_preferences, use_analysis: bool = False
+    ) -> Dict[str, Any]:
         """Process application synchronously for Streamlit."""
         return run_async_in_streamlit(
-            self.agent.process_application,
+            _interactive(self.agent.process_application),
             job_description,
             user_profile,
-            user_preferences
+            user_preferences,
+            use_analysis
         )
+    
+    def stream_application(
+        self, job_description, user_profile, user_preferences, use_analysis: bool = False,
+        previous: Optional[Dict[str, Any]] = None, result: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Any]:
+        """Stream ``(document_type, token_chunk)`` pairs synchronously for Streamlit."""
+        return iterate_async_in_streamlit(
+            _interactive_gen(self.agent.stream_application),
+            job_description,
+            user_profile,
+            user_preferences,
+            use_analysis,
+            previous,
+            result
+        )
+    
+    def make_document(self, document_type, job_description, content, fingerprint=None):
+        """Build the final document from streamed content."""
+        return self.agent.make_document(document_type, job_description, content, fingerprint)
 
 
 class StreamlitInterviewPreparationAgent:
@@ -51,12 +153,13 @@ class StreamlitInterviewPreparationAgent:
         from job_application_assistant.agents.interview_prep_agent import InterviewPreparationAgent
         self.agent = InterviewPreparationAgent()
     
-    def prepare_for_interview(self, job_description, user_profile) -> Dict[str, Any]:
+    def prepare_for_interview(self, job_description, user_profile, structured=None) -> Dict[str, Any]:
         """Prepare for interview synchronously for Streamlit."""
         return run_async_in_streamlit(
-            self.agent.prepare_for_interview,
+            _interactive(self.agent.prepare_for_interview),
             job_description,
-            user_profile
+            user_profile,
+            structured=structured
         )
 
 
@@ -2,7 +2,9 @@
 
 import asyncio
 import streamlit as st
-from typing import Optional
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Dict, Optional
 import tempfile
 import os
 import sys
@@ -14,7 +16,7 @@ sys.path.insert(0, str(project_root))
 
 # Try to import required packages
 try:
-    from job_application_assistant.core.config import Settings
+    from job_application_assistant.core.config import Settings, get_settings
     from job_application_assistant.models.data_models import JobDescription, UserProfile, UserPreferences
     from job_application_assistant.agents.job_application_agent import JobApplicationAgent
     from job_application_assistant.agents.interview_prep_agent import InterviewPreparationAgent
@@ -44,6 +46,8 @@ if 'job_description' not in st.session_state:
     st.session_state.job_description = None
 if 'user_preferences' not in st.session_state:
     st.session_state.user_preferences = None
+if 'application' not in st.session_state:
+    st.session_state.application = None
 
 
 def main():
@@ -317,6 +321,11 @@ def job_application_tab():
                 height=80
             )
         
+        use_analysis = st.checkbox(
+            "Tailor letters using a job analysis (slower)",
+            value=False
+        )
+        
         if st.button("🚀 Generate Application Materials", type="primary"):
             if not all([motivation, relevant_experience, career_goals, company_knowledge]):
                 st.error("Please fill in all required fields.")
@@ -331,43 +340,41 @@ def job_application_tab():
                 concerns=concerns if concerns else None
             )
             
-            # Generate application materials
-            with st.spinner("🤖 Generating your personalized application materials..."):
-                try:
-                    agent = StreamlitJobApplicationAgent()
-                    result = agent.process_application(
-                        job_description=job_desc,
-                        user_profile=st.session_state.user_profile,
-                        user_preferences=user_prefs
-                    )
-                    
-                    if result.get("error"):
-                        st.error(f"Error: {result['error']}")
-                        return
-                    
-                    # Display generated documents
-                    for doc in result.get("generated_documents", []):
-                        st.subheader(f"📄 {doc.title}")
-                        st.text_area(
-                            f"{doc.document_type.replace('_', ' ').title()}",
-                            value=doc.content,
-                            height=300,
-                            key=f"doc_{doc.document_type}"
-                        )
-                        
-                        # Download button
-                        st.download_button(
-                            label=f"💾 Download {doc.document_type.replace('_', ' ').title()}",
-                            data=doc.content,
-                            file_name=f"{doc.document_type}_{job_desc.company}_{job_desc.title}.txt",
-                            mime="text/plain"
-                        )
-                    
-                    st.success("🎉 Application materials generated successfully!")
-                    st.balloons()
+            # Stream application materials as they are generated, reusing
+            # letters from the last run whose inputs did not change
+            result: Dict[str, Any] = {}
+            try:
+                agent = StreamlitJobApplicationAgent()
+                stream = agent.stream_application(
+                    job_description=job_desc,
+                    user_profile=st.session_state.user_profile,
+                    user_preferences=user_prefs,
+                    use_analysis=use_analysis,
+                    previous=st.session_state.application,
+                    result=result
+                )
+                
+                for document_type, chunks in groupby(stream, key=itemgetter(0)):
+                    title = agent.make_document(document_type, job_desc, "").title
+                    st.subheader(f"📄 {title}")
+                    content = st.write_stream(chunk for _, chunk in chunks)
+                    doc = agent.make_document(document_type, job_desc, content)
                     
-                except Exception as e:
-                    st.error(f"Error generating application materials: {e}")
+                    # Download button
+                    st.download_button(
+                        label=f"💾 Download {doc.document_type.replace('_', ' ').title()}",
+                        data=doc.content,
+                        file_name=f"{doc.document_type}_{job_desc.company}_{job_desc.title}.txt",
+                        mime="text/plain"
+                    )
+                
+                # Keep the analysis too, so editing a letter's inputs reuses it
+                st.session_state.application = result
+                st.success("🎉 Application materials generated successfully!")
+                st.balloons()
+                
+            except Exception as e:
+                st.error(f"Error generating application materials: {result.get('error') or e}")
 
 
 def interview_prep_tab():
@@ -382,13 +389,20 @@ def interview_prep_tab():
         st.warning("⚠️ Please add job description first in the Job Application tab.")
         return
     
+    structured = st.checkbox(
+        "Generate all sections in one response",
+        value=get_settings().interview_prep_structured,
+        help="Faster; sections the model gets wrong are regenerated on their own"
+    )
+    
     if st.button("🎯 Generate Interview Preparation Materials", type="primary"):
         with st.spinner("🤖 Preparing your interview materials..."):
             try:
                 agent = StreamlitInterviewPreparationAgent()
                 result = agent.prepare_for_interview(
                     job_description=st.session_state.job_description,
-                    user_profile=st.session_state.user_profile
+                    user_profile=st.session_state.user_profile,
+                    structured=structured
                 )
                 
                 if result.get("error"):
@@ -400,6 +414,9 @@ def interview_prep_tab():
                     st.error("No interview preparation materials generated.")
                     return
                 
+                for section, error in result.get("errors", {}).items():
+                    st.warning(f"⚠️ Could not generate {section.replace('_', ' ')}: {error}")
+                
                 # Display preparation materials
                 col1, col2 = st.columns(2)
                 
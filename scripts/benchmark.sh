@@ -0,0 +1,55 @@
+#!/bin/bash
+
+# Job Application Assistant Benchmark Script
+# Runs the benchmark suite and fails on regressions against a saved baseline
+#
+# Usage:
+#   ./scripts/benchmark.sh baseline   # record a baseline on the current commit
+#   ./scripts/benchmark.sh            # compare against the latest baseline
+#
+# BENCHMARK_THRESHOLD sets the allowed median slowdown (default 25%).
+
+set -e  # Exit on error
+
+THRESHOLD=${BENCHMARK_THRESHOLD:-25%}
+RESULTS=${BENCHMARK_RESULTS:-benchmark-results.json}
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+BLUE='\033[0;34m'
+NC='\033[0m' # No Color
+
+info() {
+    echo -e "${BLUE}ℹ️  $1${NC}"
+}
+
+success() {
+    echo -e "${GREEN}✅ $1${NC}"
+}
+
+error() {
+    echo -e "${RED}❌ $1${NC}"
+    exit 1
+}
+
+python -c "import pytest_benchmark" 2>/dev/null || error "pytest-benchmark is required: pip install -e '.[dev]'"
+
+if [ "$1" == "baseline" ]; then
+    info "Recording benchmark baseline"
+    python -m pytest benchmarks --benchmark-save=baseline --benchmark-json="$RESULTS"
+    success "Baseline saved under .benchmarks/, results in $RESULTS"
+    exit 0
+fi
+
+if ! ls .benchmarks/*/*_baseline.json > /dev/null 2>&1; then
+    error "No baseline found. Run: ./scripts/benchmark.sh baseline"
+fi
+
+info "Comparing against the latest baseline (threshold: median +$THRESHOLD)"
+python -m pytest benchmarks \
+    --benchmark-compare \
+    --benchmark-compare-fail="median:$THRESHOLD" \
+    --benchmark-json="$RESULTS" \
+    || error "Benchmarks regressed or failed; see $RESULTS"
+success "No benchmark regressions"
@@ -0,0 +1,142 @@
+"""Test admission control of LLM calls."""
+
+import asyncio
+import time
+
+import pytest
+
+from job_application_assistant.core.admission import (
+    BATCH,
+    INTERACTIVE,
+    AdmissionController,
+    TokenBucket,
+    request_context,
+)
+from job_application_assistant.core.exceptions import LLMError
+
+
+def _controller(**kwargs):
+    options = dict(requests_per_minute=60000, max_in_flight=1, burst=100)
+    options.update(kwargs)
+    return AdmissionController(**options)
+
+
+async def _admission_order(controller, requests):
+    """Queue ``(priority, caller, label)`` requests behind a held slot; return admission order."""
+    order = []
+
+    async def request(priority, caller, label):
+        async with controller.admit(priority, caller):
+            order.append(label)
+            await asyncio.sleep(0)
+
+    await controller.acquire()
+    tasks = []
+    for priority, caller, label in requests:
+        tasks.append(asyncio.create_task(request(priority, caller, label)))
+        await asyncio.sleep(0)  # enqueue in order
+    controller.release()
+    await asyncio.gather(*tasks)
+    return order
+
+
+class TestTokenBucket:
+    """Test the token bucket."""
+
+    def test_burst_then_wait(self):
+        """Test the burst is available at once, then tokens refill at the rate."""
+        bucket = TokenBucket(rate=10, capacity=2)
+        assert bucket.try_take() == 0
+        assert bucket.try_take() == 0
+        assert 0 < bucket.try_take() <= 0.1
+
+
+class TestAdmissionController:
+    """Test queueing, priorities and limits."""
+
+    def test_interactive_jumps_ahead_of_batch(self):
+        """Test queued interactive calls are admitted before earlier batch calls."""
+        order = asyncio.run(_admission_order(_controller(), [
+            (BATCH, "batch", "batch-1"),
+            (BATCH, "batch", "batch-2"),
+            (INTERACTIVE, "web", "web-1"),
+        ]))
+        assert order == ["web-1", "batch-1", "batch-2"]
+
+    def test_callers_served_round_robin(self):
+        """Test one caller's burst does not starve another caller."""
+        order = asyncio.run(_admission_order(_controller(), [
+            (BATCH, "a", "a-1"),
+            (BATCH, "a", "a-2"),
+            (BATCH, "a", "a-3"),
+            (BATCH, "b", "b-1"),
+        ]))
+        assert order == ["a-1", "b-1", "a-2", "a-3"]
+
+    def test_rate_limited(self):
+        """Test calls beyond the burst wait for the token bucket."""
+        controller = _controller(requests_per_minute=1200, max_in_flight=10, burst=1)
+
+        async def run():
+            started = time.perf_counter()
+            for _ in range(3):
+                async with controller.admit():
+                    pass
+            return time.perf_counter() - started
+
+        assert asyncio.run(run()) >= 0.09  # two refills at 20/s
+
+    def test_queue_timeout(self):
+        """Test calls with a queue timeout give up waiting, and the queue recovers."""
+        controller = _controller()
+
+        async def run():
+            await controller.acquire()
+            with request_context(INTERACTIVE, "web", queue_timeout=0.05):
+                with pytest.raises(LLMError):
+                    await controller.acquire()
+            assert controller.metrics()["queue_depth"] == {"interactive": 0, "batch": 0}
+            controller.release()
+            await asyncio.wait_for(controller.acquire(BATCH, "batch"), 1)
+            controller.release()
+
+        asyncio.run(run())
+        metrics = controller.metrics()
+        assert metrics["timed_out"] == {"interactive": 1, "batch": 0}
+        assert metrics["in_flight"] == 0
+
+    def test_priority_from_context(self):
+        """Test the request context sets the priority and caller."""
+        controller = _controller()
+
+        async def run():
+            await controller.acquire()
+            with request_context(BATCH, caller="job"):
+                waiting = asyncio.create_task(controller.acquire())
+                await asyncio.sleep(0)
+            depth = controller.metrics()["queue_depth"]
+            controller.release()
+            await waiting
+            controller.release()
+            return depth
+
+        assert asyncio.run(run()) == {"interactive": 0, "batch": 1}
+
+    def test_closed_loop_waiter_takes_no_token(self):
+        """Test a waiter whose event loop closed is dropped without spending rate budget."""
+        controller = _controller(requests_per_minute=1, burst=2)
+        asyncio.run(controller.acquire())
+
+        dead_loop = asyncio.new_event_loop()
+        abandoned = dead_loop.create_task(controller.acquire())
+        dead_loop.run_until_complete(asyncio.sleep(0))
+        dead_loop.close()
+        controller.release()
+
+        async def run():
+            await asyncio.wait_for(controller.acquire(), 1)
+            controller.release()
+
+        asyncio.run(run())
+        assert not abandoned.done()
+        assert controller.metrics()["queue_depth"] == {"interactive": 0, "batch": 0}
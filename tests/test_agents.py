@@ -0,0 +1,583 @@
+"""Test agent orchestration."""
+
+import asyncio
+import json
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from job_application_assistant.agents import base
+from job_application_assistant.agents.interview_prep_agent import (
+    InterviewPreparationAgent,
+    validate_sections,
+)
+from job_application_assistant.agents.job_application_agent import JobApplicationAgent
+from job_application_assistant.agents.pipeline import Step, StepSkipped, run_steps
+from job_application_assistant.models.data_models import ApplicationDocument
+
+
+@pytest.fixture
+def llm_manager(make_llm_manager):
+    """Initialized LLM manager backed by a fake chat model, two calls at a time."""
+    return make_llm_manager(FakeListChatModel(responses=["OK"]), llm_max_concurrency=2)
+
+
+def _patch_sections(agent, delay, failing=()):
+    """Replace the section generators with instrumented stubs."""
+    state = {"active": 0, "peak": 0}
+    
+    def make_stub(name):
+        async def stub(*args, **kwargs):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            try:
+                await asyncio.sleep(delay)
+                if name in failing:
+                    raise RuntimeError(f"{name} failed")
+                return [f"{name} item"]
+            finally:
+                state["active"] -= 1
+        return stub
+    
+    for name in [
+        "create_confidence_checklist",
+        "generate_technical_questions",
+        "generate_behavioral_questions",
+        "generate_questions_to_ask",
+    ]:
+        setattr(agent, name, make_stub(name))
+    return state
+
+
+class TestInterviewPreparationAgent:
+    """Test InterviewPreparationAgent orchestration."""
+    
+    def test_concurrent_sections_respect_limit(
+        self, llm_manager, sample_job_description, sample_user_profile
+    ):
+        """Test sections run concurrently but within the backend limit."""
+        agent = InterviewPreparationAgent()
+        state = _patch_sections(agent, delay=0.05)
+        
+        result = asyncio.run(
+            agent.prepare_for_interview(sample_job_description, sample_user_profile)
+        )
+        
+        assert result["error"] is None
+        assert state["peak"] == llm_manager.settings.llm_max_concurrency
+        assert result["interview_prep"].questions_to_ask == ["generate_questions_to_ask item"]
+    
+    def test_sequential_mode(self, llm_manager, sample_job_description, sample_user_profile):
+        """Test sequential mode runs one section at a time."""
+        agent = InterviewPreparationAgent()
+        state = _patch_sections(agent, delay=0.01)
+        
+        result = asyncio.run(
+            agent.prepare_for_interview(
+                sample_job_description, sample_user_profile, concurrent=False
+            )
+        )
+        
+        assert result["error"] is None
+        assert state["peak"] == 1
+    
+    def test_partial_results_on_failure(
+        self, llm_manager, sample_job_description, sample_user_profile
+    ):
+        """Test a failing section does not discard the others."""
+        agent = InterviewPreparationAgent()
+        _patch_sections(agent, delay=0.01, failing={"generate_technical_questions"})
+        
+        result = asyncio.run(
+            agent.prepare_for_interview(sample_job_description, sample_user_profile)
+        )
+        
+        prep = result["interview_prep"]
+        assert result["error"] is None
+        assert prep.technical_questions == []
+        assert prep.behavioral_questions == ["generate_behavioral_questions item"]
+        assert "technical_questions" in result["errors"]
+    
+    def test_all_sections_failing(
+        self, llm_manager, sample_job_description, sample_user_profile
+    ):
+        """Test the call fails when every section fails."""
+        agent = InterviewPreparationAgent()
+        _patch_sections(
+            agent,
+            delay=0,
+            failing={
+                "create_confidence_checklist",
+                "generate_technical_questions",
+                "generate_behavioral_questions",
+                "generate_questions_to_ask",
+            },
+        )
+        
+        result = asyncio.run(
+            agent.prepare_for_interview(sample_job_description, sample_user_profile)
+        )
+        
+        assert result["interview_prep"] is None
+        assert result["error"].startswith("Error preparing for interview")
+
+
+class TestStructuredInterviewPrep:
+    """Test interview preparation from a single JSON generation."""
+    
+    SECTIONS = {
+        "confidence_checklist": ["- Python", "AWS", "System design"],
+        "technical_questions": [f"Question {i}?" for i in range(5)],
+        "behavioral_questions": ["Tell me about a time...", "Describe a conflict", "Why?"],
+        "questions_to_ask": ["How is success measured?", "What is the roadmap?", "Who is on the team?"],
+    }
+    
+    def test_validate_sections_repairs_and_reports(self):
+        """Test sections are repaired where possible and validated one by one."""
+        text = "```json\n" + json.dumps({
+            **self.SECTIONS,
+            "technical_questions": "What is a GIL?\nNot a question",
+            "questions_to_ask": "\n".join(f"Q{i}?" for i in range(12)),
+        }) + "\n```"
+        valid, invalid = validate_sections(text, list(self.SECTIONS))
+        
+        assert valid["confidence_checklist"] == ["Python", "AWS", "System design"]
+        assert len(valid["questions_to_ask"]) == 8
+        assert set(invalid) == {"technical_questions"}
+        
+        valid, invalid = validate_sections("not json", ["questions_to_ask"])
+        assert valid == {} and set(invalid) == {"questions_to_ask"}
+    
+    def test_retries_only_invalid_sections(
+        self, llm_manager, sample_job_description, sample_user_profile
+    ):
+        """Test one call serves every section, and a retry asks for the invalid one only."""
+        first = {**self.SECTIONS, "technical_questions": ["Too few?"]}
+        retry = {"technical_questions": self.SECTIONS["technical_questions"]}
+        llm_manager._primary_llm = FakeListChatModel(
+            responses=[json.dumps(first), json.dumps(retry)]
+        )
+        agent = InterviewPreparationAgent(use_cache=False)
+        prompts = []
+        generate = agent._generate
+        
+        async def spy(prompt, inputs, step="generate", output_format=None, validate=None):
+            prompts.append((step, inputs.get("sections"), output_format))
+            return await generate(prompt, inputs, step, output_format, validate)
+        
+        agent._generate = spy
+        result = asyncio.run(agent.prepare_for_interview(
+            sample_job_description, sample_user_profile, structured=True
+        ))
+        
+        prep = result["interview_prep"]
+        assert result["error"] is None and result["errors"] == {}
+        assert prep.technical_questions == self.SECTIONS["technical_questions"]
+        assert prep.confidence_checklist == ["Python", "AWS", "System design"]
+        assert [step for step, _, _ in prompts] == ["structured_sections", "structured_retry"]
+        _, sections, schema = prompts[1]
+        assert sections.startswith("- technical_questions:") and "\n" not in sections
+        assert schema["required"] == ["technical_questions"]
+    
+    def test_falls_back_to_section_generator(
+        self, llm_manager, sample_job_description, sample_user_profile
+    ):
+        """Test a section still invalid after the retries gets its own generation."""
+        llm_manager.settings.interview_prep_structured_retries = 0
+        llm_manager._primary_llm = FakeListChatModel(
+            responses=[json.dumps({**self.SECTIONS, "behavioral_questions": []})]
+        )
+        agent = InterviewPreparationAgent(use_cache=False)
+        
+        async def behavioral(*args, **kwargs):
+            return ["Tell me about a launch."]
+        
+        agent.generate_behavioral_questions = behavioral
+        result = asyncio.run(agent.prepare_for_interview(
+            sample_job_description, sample_user_profile, structured=True
+        ))
+        
+        prep = result["interview_prep"]
+        assert prep.behavioral_questions == ["Tell me about a launch."]
+        assert prep.questions_to_ask == self.SECTIONS["questions_to_ask"]
+    
+    def test_invalid_reply_not_cached(
+        self, llm_manager, sample_job_description, sample_user_profile
+    ):
+        """Test a malformed structured reply is not replayed from the response cache."""
+        llm_manager.settings.interview_prep_structured_retries = 0
+        llm_manager._primary_llm = FakeListChatModel(
+            responses=["{not json", json.dumps(self.SECTIONS)]
+        )
+        agent = InterviewPreparationAgent()
+        _patch_sections(agent, delay=0)
+        
+        def run():
+            return asyncio.run(agent.prepare_for_interview(
+                sample_job_description, sample_user_profile, structured=True
+            ))["interview_prep"]
+        
+        assert run().technical_questions == ["generate_technical_questions item"]
+        assert run().technical_questions == self.SECTIONS["technical_questions"]
+        assert run().technical_questions == self.SECTIONS["technical_questions"]
+    
+    def test_structured_failure_falls_back_to_every_section(
+        self, llm_manager, sample_job_description, sample_user_profile
+    ):
+        """Test a failing structured call leaves each section to its own generator."""
+        agent = InterviewPreparationAgent(use_cache=False)
+        _patch_sections(agent, delay=0)
+        
+        async def unsupported(*args, **kwargs):
+            raise ValueError("model does not support format")
+        
+        agent.generate_structured_sections = unsupported
+        result = asyncio.run(agent.prepare_for_interview(
+            sample_job_description, sample_user_profile, structured=True
+        ))
+        
+        assert result["error"] is None and result["errors"] == {}
+        assert result["interview_prep"].technical_questions == ["generate_technical_questions item"]
+        assert result["interview_prep"].questions_to_ask == ["generate_questions_to_ask item"]
+
+
+class TestPipeline:
+    """Test the step graph executor."""
+    
+    def test_independent_steps_run_concurrently(self):
+        """Test steps without shared inputs overlap."""
+        async def slow(value):
+            await asyncio.sleep(0.05)
+            return value
+        
+        steps = [
+            Step("a", lambda: slow(1)),
+            Step("b", lambda: slow(2)),
+            Step("c", lambda a, b: slow(a + b), inputs=("a", "b")),
+        ]
+        outcome = asyncio.run(run_steps(steps))
+        
+        assert outcome.ok
+        assert outcome.results == {"a": 1, "b": 2, "c": 3}
+        assert outcome.total_seconds < 0.14
+        assert set(outcome.timings) == {"a", "b", "c"}
+        assert outcome.critical_path(steps)[-1] == "c"
+    
+    def test_failed_input_skips_dependents(self):
+        """Test dependents of a failed step are skipped, not run."""
+        async def boom():
+            raise RuntimeError("boom")
+        
+        async def never(a):
+            raise AssertionError("should not run")
+        
+        steps = [Step("a", boom), Step("b", never, inputs=("a",))]
+        outcome = asyncio.run(run_steps(steps))
+        
+        assert isinstance(outcome.errors["a"], RuntimeError)
+        assert isinstance(outcome.errors["b"], StepSkipped)
+    
+    def test_cycle_rejected(self):
+        """Test dependency cycles are rejected up front."""
+        async def noop(**kwargs):
+            return None
+        
+        steps = [Step("a", noop, inputs=("b",)), Step("b", noop, inputs=("a",))]
+        with pytest.raises(ValueError):
+            asyncio.run(run_steps(steps))
+
+
+class TestJobApplicationAgent:
+    """Test JobApplicationAgent orchestration."""
+    
+    def test_letters_run_alongside_analysis(
+        self, llm_manager, sample_job_description,
+        sample_user_profile, sample_user_preferences
+    ):
+        """Test the letters do not wait for the analysis unless asked to."""
+        agent = JobApplicationAgent()
+        seen = {}
+        
+        async def analyze(job, profile=None):
+            await asyncio.sleep(0.05)
+            return "analysis"
+        
+        def make_letter(kind):
+            async def letter(job, profile, prefs, analysis=None):
+                seen[kind] = analysis
+                return ApplicationDocument(document_type=kind, title=kind, content=kind)
+            return letter
+        
+        agent.analyze_job = analyze
+        agent.generate_cover_letter = make_letter("cover_letter")
+        agent.generate_motivation_letter = make_letter("motivation_letter")
+        
+        result = asyncio.run(agent.process_application(
+            sample_job_description, sample_user_profile, sample_user_preferences
+        ))
+        assert result["error"] is None
+        assert seen == {"cover_letter": None, "motivation_letter": None}
+        assert set(result["timings"]) == {"analysis", "cover_letter", "motivation_letter"}
+        
+        result = asyncio.run(agent.process_application(
+            sample_job_description, sample_user_profile, sample_user_preferences,
+            use_analysis=True
+        ))
+        assert result["analysis"] == "analysis"
+        assert seen == {"cover_letter": "analysis", "motivation_letter": "analysis"}
+        assert [d.document_type for d in result["generated_documents"]] == [
+            "cover_letter", "motivation_letter"
+        ]
+
+    def test_only_changed_documents_regenerated(
+        self, llm_manager, sample_job_description, sample_user_profile,
+        sample_user_preferences
+    ):
+        """Test a rerun with a previous result only redoes steps whose inputs changed."""
+        agent = JobApplicationAgent(use_cache=False)
+        calls = []
+        generate = agent._generate
+        
+        async def spy(prompt, inputs, step="generate", output_format=None):
+            calls.append(step)
+            return await generate(prompt, inputs, step, output_format)
+        
+        agent._generate = spy
+        
+        def run(preferences, previous=None):
+            calls.clear()
+            return asyncio.run(agent.process_application(
+                sample_job_description, sample_user_profile, preferences,
+                use_analysis=True, previous=previous
+            ))
+        
+        first = run(sample_user_preferences)
+        assert sorted(calls) == ["analysis", "cover_letter", "motivation_letter"]
+        assert all(d.metadata["input_fingerprint"] for d in first["generated_documents"])
+        
+        # No prompt reads the concerns
+        concerned = sample_user_preferences.model_copy(update={"concerns": "Long commute"})
+        second = run(concerned, previous=first)
+        assert calls == []
+        assert second["reused"] == ["analysis", "cover_letter", "motivation_letter"]
+        assert second["generated_documents"] == first["generated_documents"]
+        
+        # Only the cover letter reads the company knowledge
+        knowing = sample_user_preferences.model_copy(update={"company_knowledge": "Series B"})
+        third = run(knowing, previous=second)
+        assert calls == ["cover_letter"]
+        assert third["analysis"] == first["analysis"]
+        
+        # Both letters read the motivation, the analysis does not
+        run(sample_user_preferences.model_copy(update={"motivation": "Scale"}), previous=third)
+        assert sorted(calls) == ["cover_letter", "motivation_letter"]
+    
+    def test_stream_reuses_unchanged_letters(
+        self, llm_manager, sample_job_description, sample_user_profile,
+        sample_user_preferences
+    ):
+        """Test streaming yields unchanged letters whole instead of regenerating them."""
+        llm_manager._primary_llm = FakeListChatModel(responses=["Fresh"])
+        agent = JobApplicationAgent(use_cache=False)
+        fingerprints = agent.input_fingerprints(
+            sample_job_description, sample_user_profile, sample_user_preferences
+        )
+        previous = {"generated_documents": [
+            agent.make_document("cover_letter", sample_job_description, "Kept",
+                                fingerprints["cover_letter"]),
+            agent.make_document("motivation_letter", sample_job_description, "Stale", "old"),
+        ]}
+        
+        async def collect():
+            return [
+                item async for item in agent.stream_application(
+                    sample_job_description, sample_user_profile, sample_user_preferences,
+                    previous=previous
+                )
+            ]
+        
+        chunks = asyncio.run(collect())
+        assert chunks[0] == ("cover_letter", "Kept")
+        assert "".join(c for t, c in chunks if t == "motivation_letter") == "Fresh"
+    
+    def test_stream_reuses_unchanged_analysis(
+        self, llm_manager, sample_job_description, sample_user_profile,
+        sample_user_preferences
+    ):
+        """Test a streamed run's analysis is reused when only a letter's inputs change."""
+        llm_manager._primary_llm = FakeListChatModel(responses=["Text"])
+        agent = JobApplicationAgent(use_cache=False)
+        steps = []
+        generate, stream = agent._generate, agent._stream
+        
+        async def spy_generate(prompt, inputs, step="generate", output_format=None):
+            steps.append(step)
+            return await generate(prompt, inputs, step, output_format)
+        
+        def spy_stream(prompt, inputs, step="generate"):
+            steps.append(step)
+            return stream(prompt, inputs, step)
+        
+        agent._generate, agent._stream = spy_generate, spy_stream
+        
+        def run(preferences, previous=None):
+            steps.clear()
+            result = {}
+            
+            async def collect():
+                async for _ in agent.stream_application(
+                    sample_job_description, sample_user_profile, preferences,
+                    use_analysis=True, previous=previous, result=result
+                ):
+                    pass
+            
+            asyncio.run(collect())
+            return result
+        
+        first = run(sample_user_preferences)
+        assert sorted(steps) == ["analysis", "cover_letter", "motivation_letter"]
+        assert first["analysis"] == "Text"
+        
+        # Only the cover letter reads the company knowledge
+        knowing = sample_user_preferences.model_copy(update={"company_knowledge": "Series B"})
+        second = run(knowing, previous=first)
+        assert steps == ["cover_letter"]
+        assert second["analysis"] == first["analysis"]
+        assert second["reused"] == ["analysis", "motivation_letter"]
+    
+    def test_stream_generates_letters_concurrently(
+        self, llm_manager, sample_job_description, sample_user_profile,
+        sample_user_preferences
+    ):
+        """Test the second letter is generated while the first one streams."""
+        agent = JobApplicationAgent(use_cache=False)
+        started = []
+        
+        async def stream(prompt, inputs, step="generate"):
+            started.append(step)
+            await asyncio.sleep(0.05)
+            yield f"{step} text"
+        
+        agent._stream = stream
+        result = {}
+        
+        async def collect():
+            items = []
+            async for item in agent.stream_application(
+                sample_job_description, sample_user_profile, sample_user_preferences,
+                result=result
+            ):
+                items.append((item, list(started)))
+            return items
+        
+        items = asyncio.run(collect())
+        assert [item for item, _ in items] == [
+            ("cover_letter", "cover_letter text"), ("motivation_letter", "motivation_letter text")
+        ]
+        assert items[0][1] == ["cover_letter", "motivation_letter"]
+        assert result["error"] is None
+        assert set(result["timings"]) == {"cover_letter", "motivation_letter"}
+        assert [d.content for d in result["generated_documents"]] == [
+            "cover_letter text", "motivation_letter text"
+        ]
+    
+    def test_stream_reports_failed_step(
+        self, llm_manager, sample_job_description, sample_user_profile,
+        sample_user_preferences
+    ):
+        """Test a letter failing mid-stream is raised and named in the result."""
+        agent = JobApplicationAgent(use_cache=False)
+        
+        async def stream(prompt, inputs, step="generate"):
+            if step == "motivation_letter":
+                raise ConnectionError("connection refused")
+            yield "Dear team"
+        
+        agent._stream = stream
+        result = {}
+        chunks = []
+        
+        async def collect():
+            async for item in agent.stream_application(
+                sample_job_description, sample_user_profile, sample_user_preferences,
+                result=result
+            ):
+                chunks.append(item)
+        
+        with pytest.raises(ConnectionError):
+            asyncio.run(collect())
+        assert chunks == [("cover_letter", "Dear team")]
+        assert result["error"] == "Error processing application: motivation_letter: connection refused"
+        assert set(result["timings"]) == {"cover_letter", "motivation_letter"}
+    
+    def test_responses_are_cached(
+        self, llm_manager, sample_job_description, sample_user_profile,
+        sample_user_preferences
+    ):
+        """Test identical prompts are served from the response cache."""
+        llm_manager._primary_llm = FakeListChatModel(responses=["first", "second"])
+        
+        agent = JobApplicationAgent()
+        first = asyncio.run(agent.analyze_job(sample_job_description))
+        second = asyncio.run(agent.analyze_job(sample_job_description))
+        assert first == second == "first"
+        
+        uncached = JobApplicationAgent(use_cache=False)
+        assert asyncio.run(uncached.analyze_job(sample_job_description)) == "second"
+    
+    def test_stream_application(
+        self, llm_manager, sample_job_description, sample_user_profile,
+        sample_user_preferences
+    ):
+        """Test letters stream in order and are cached once complete."""
+        llm_manager._primary_llm = FakeListChatModel(responses=["Dear team", "Motivated"])
+        agent = JobApplicationAgent()
+        
+        async def collect():
+            return [
+                item async for item in agent.stream_application(
+                    sample_job_description, sample_user_profile, sample_user_preferences
+                )
+            ]
+        
+        chunks = asyncio.run(collect())
+        assert len(chunks) > 2
+        assert "".join(c for t, c in chunks if t == "cover_letter") == "Dear team"
+        assert "".join(c for t, c in chunks if t == "motivation_letter") == "Motivated"
+        assert chunks[0][0] == "cover_letter" and chunks[-1][0] == "motivation_letter"
+        
+        # A second run is served from the cache in one chunk per document
+        assert asyncio.run(collect()) == [
+            ("cover_letter", "Dear team"), ("motivation_letter", "Motivated")
+        ]
+
+
+class TestPromptPrefix:
+    """Test the prompts share a context prefix Ollama can cache."""
+    
+    def test_steps_share_system_context(
+        self, monkeypatch, llm_manager, sample_job_description, sample_user_profile,
+        sample_user_preferences
+    ):
+        """Test every step renders the same system message before its task."""
+        rendered = {}
+        
+        async def capture(self, prompt, inputs, step="generate"):
+            rendered[step] = prompt.format_messages(**inputs)
+            return "- item"
+        
+        monkeypatch.setattr(base.BaseAgent, "_generate", capture)
+        asyncio.run(JobApplicationAgent().process_application(
+            sample_job_description, sample_user_profile, sample_user_preferences,
+            use_analysis=True
+        ))
+        asyncio.run(InterviewPreparationAgent().prepare_for_interview(
+            sample_job_description, sample_user_profile
+        ))
+        
+        assert len(rendered) == 7
+        systems = {messages[0].content for messages in rendered.values()}
+        assert len(systems) == 1
+        assert sample_job_description.company in systems.pop()
+        tasks = {messages[-1].content for messages in rendered.values()}
+        assert len(tasks) == 7
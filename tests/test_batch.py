@@ -0,0 +1,150 @@
+"""Test batch application processing."""
+
+import asyncio
+import json
+
+import pytest
+
+from job_application_assistant.cli import batch
+from job_application_assistant.cli.batch import BatchJob, is_finished, load_manifest, run_batch
+from job_application_assistant.core.exceptions import ValidationError
+from job_application_assistant.models.data_models import ApplicationDocument
+
+
+JOB_TEXT = """Senior Python Developer
+Acme Corp
+Location: Remote
+We need experience with Python and Django.
+"""
+
+
+class StubAgent:
+    """Application agent returning canned documents."""
+    
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+    
+    async def process_application(self, job, profile, prefs, use_analysis=False):
+        self.calls.append(job.title)
+        await asyncio.sleep(0)
+        if job.title in self.failing:
+            return {"error": "model unavailable", "generated_documents": []}
+        return {
+            "generated_documents": [
+                ApplicationDocument(document_type="cover_letter", title="c", content="Dear...")
+            ],
+            "analysis": "analysis",
+            "timings": {"cover_letter": 0.1},
+            "error": None,
+        }
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    """JSONL manifest pointing at two job description files."""
+    for name, title in [("a.txt", "Python Developer"), ("b.txt", "Data Engineer")]:
+        (tmp_path / name).write_text(JOB_TEXT.replace("Senior Python Developer", title))
+    path = tmp_path / "jobs.jsonl"
+    path.write_text(
+        json.dumps({"id": "a", "file": "a.txt"}) + "\n" + json.dumps({"file": "b.txt"}) + "\n"
+    )
+    return path
+
+
+class TestManifest:
+    """Test manifest loading."""
+    
+    def test_jsonl_manifest(self, manifest, tmp_path):
+        """Test JSONL entries resolve files relative to the manifest."""
+        jobs = load_manifest(manifest)
+        
+        assert [job.job_id for job in jobs][0] == "a"
+        assert jobs[1].job_id.startswith("b-txt-")
+        assert jobs[0].source == str(tmp_path / "a.txt")
+        assert not jobs[0].is_url
+    
+    def test_csv_manifest(self, tmp_path):
+        """Test CSV manifests with URL entries."""
+        path = tmp_path / "jobs.csv"
+        path.write_text("id,url,file\nx,https://example.com/jobs/1,\n")
+        
+        jobs = load_manifest(path)
+        assert jobs[0].job_id == "x"
+        assert jobs[0].is_url
+    
+    def test_entry_needs_one_source(self, tmp_path):
+        """Test entries must name exactly one source."""
+        path = tmp_path / "jobs.jsonl"
+        path.write_text(json.dumps({"url": "https://example.com", "file": "a.txt"}) + "\n")
+        
+        with pytest.raises(ValidationError):
+            load_manifest(path)
+
+
+class TestRunBatch:
+    """Test the batch runner."""
+    
+    def test_outputs_written_and_rerun_skips(
+        self, manifest, tmp_path, sample_user_profile, sample_user_preferences
+    ):
+        """Test finished jobs are written and skipped on re-run."""
+        jobs = load_manifest(manifest)
+        output_dir = tmp_path / "out"
+        agent = StubAgent()
+        
+        results = asyncio.run(run_batch(
+            jobs, agent, sample_user_profile, sample_user_preferences, output_dir
+        ))
+        assert [r.status for r in results] == ["done", "done"]
+        assert (output_dir / "a" / "cover_letter.txt").read_text() == "Dear..."
+        assert is_finished(output_dir, jobs[0])
+        
+        results = asyncio.run(run_batch(
+            jobs, agent, sample_user_profile, sample_user_preferences, output_dir
+        ))
+        assert [r.status for r in results] == ["skipped", "skipped"]
+        assert len(agent.calls) == 2
+    
+    def test_failed_jobs_are_retried(
+        self, manifest, tmp_path, sample_user_profile, sample_user_preferences
+    ):
+        """Test a failed job is reported and retried on the next run."""
+        jobs = load_manifest(manifest)
+        output_dir = tmp_path / "out"
+        
+        results = asyncio.run(run_batch(
+            jobs, StubAgent(failing={"Data Engineer"}),
+            sample_user_profile, sample_user_preferences, output_dir
+        ))
+        assert [r.status for r in results] == ["done", "failed"]
+        assert "model unavailable" in results[1].error
+        assert not is_finished(output_dir, jobs[1])
+        
+        results = asyncio.run(run_batch(
+            jobs, StubAgent(), sample_user_profile, sample_user_preferences, output_dir
+        ))
+        assert [r.status for r in results] == ["skipped", "done"]
+    
+    def test_url_jobs_start_as_their_page_arrives(
+        self, tmp_path, sample_user_profile, sample_user_preferences, monkeypatch
+    ):
+        """Test each URL job waits only for its own page and counts its fetch time."""
+        delays = {"https://example.com/fast": 0.01, "https://example.com/slow": 0.3}
+        
+        async def fetch(url):
+            await asyncio.sleep(delays[url])
+            return {"title": url.rsplit("/", 1)[-1], "company": "Acme", "url": url}
+        
+        monkeypatch.setattr(batch, "job_description_extractions", lambda urls: [fetch(u) for u in urls])
+        agent = StubAgent()
+        jobs = [BatchJob(job_id=name, source=url, is_url=True) for name, url in
+                [("slow", "https://example.com/slow"), ("fast", "https://example.com/fast")]]
+        
+        results = asyncio.run(run_batch(
+            jobs, agent, sample_user_profile, sample_user_preferences, tmp_path / "out"
+        ))
+        assert [r.status for r in results] == ["done", "done"]
+        assert agent.calls == ["fast", "slow"]
+        assert results[0].seconds >= 0.3
+        assert results[1].seconds < 0.3
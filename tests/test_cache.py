@@ -0,0 +1,51 @@
+"""Test the LLM response cache."""
+
+import time
+
+from job_application_assistant.core.cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test ResponseCache behaviour."""
+    
+    def test_roundtrip(self, tmp_path):
+        """Test stored responses are returned for the same key."""
+        cache = ResponseCache(tmp_path / "cache.db", ttl_seconds=60, max_size_bytes=1024)
+        key = ResponseCache.make_key("llama3.1:8b", 0.7, "prompt", "1")
+        
+        assert cache.get(key) is None
+        cache.set(key, "response")
+        assert cache.get(key) == "response"
+    
+    def test_key_depends_on_all_inputs(self):
+        """Test every keyed field changes the key."""
+        base = ResponseCache.make_key("m", 0.7, "prompt", "1")
+        
+        assert base != ResponseCache.make_key("other", 0.7, "prompt", "1")
+        assert base != ResponseCache.make_key("m", 0.2, "prompt", "1")
+        assert base != ResponseCache.make_key("m", 0.7, "prompt!", "1")
+        assert base != ResponseCache.make_key("m", 0.7, "prompt", "2")
+    
+    def test_ttl_expiry(self, tmp_path):
+        """Test expired entries are not served."""
+        cache = ResponseCache(tmp_path / "cache.db", ttl_seconds=1, max_size_bytes=1024)
+        cache.set("key", "response")
+        
+        time.sleep(1.1)
+        assert cache.get("key") is None
+    
+    def test_lru_eviction(self, tmp_path):
+        """Test the least recently used entries are evicted over the size bound."""
+        cache = ResponseCache(tmp_path / "cache.db", ttl_seconds=60, max_size_bytes=20)
+        cache.set("a", "x" * 8)
+        time.sleep(0.01)
+        cache.set("b", "x" * 8)
+        time.sleep(0.01)
+        cache.get("a")  # "b" is now least recently used
+        time.sleep(0.01)
+        cache.set("c", "x" * 8)
+        
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+        assert cache.stats()["size_bytes"] <= 20
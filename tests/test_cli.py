@@ -35,6 +35,7 @@ class TestCLI:
         assert ("System Information" in result.stdout or 
                 "Model:" in result.stdout or
                 result.returncode == 0)  # Allow for different output formats
+        assert "Recent LLM Calls" in result.stdout
     
     def test_cli_commands_exist(self):
         """Test that expected CLI commands exist."""
@@ -50,3 +51,4 @@ class TestCLI:
         assert "apply" in result.stdout
         assert "interview" in result.stdout
         assert "info" in result.stdout
+        assert "metrics" in result.stdout
@@ -0,0 +1,251 @@
+"""Test document processing."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from job_application_assistant.tools import document_processor as dp
+from job_application_assistant.tools.document_processor import (
+    DocumentProcessor,
+    JobDescriptionExtractor,
+)
+from job_application_assistant.tools.html_parsing import available_parsers, resolve_parser
+from job_application_assistant.tools.page_cache import normalize_url
+
+JOB_PAGE = b"""<html><body>
+<h1>Backend Engineer</h1><div class="company">Acme</div>
+<p>We need 5+ years of experience with Python and PostgreSQL.</p>
+</body></html>"""
+
+
+class TestPDFExtraction:
+    """Test PDF text extraction."""
+    
+    @pytest.fixture(autouse=True)
+    def _require_pdfplumber(self):
+        pytest.importorskip("pdfplumber")
+    
+    def test_sequential_and_parallel_agree(self, tmp_path, write_pdf):
+        """Test page-parallel extraction matches sequential extraction."""
+        pdf = write_pdf(tmp_path / "cv.pdf", [f"Page {i} Python" for i in range(6)])
+        
+        sequential = DocumentProcessor(cache_dir=tmp_path / "a", parallel_page_threshold=100)
+        parallel = DocumentProcessor(
+            cache_dir=tmp_path / "b", parallel_page_threshold=2, max_workers=3
+        )
+        
+        text = sequential.extract_text_from_pdf(str(pdf))
+        assert text.splitlines() == [f"Page {i} Python" for i in range(6)]
+        assert parallel.extract_text_from_pdf(str(pdf)) == text
+    
+    def test_cached_by_content(self, tmp_path, monkeypatch, write_pdf):
+        """Test a re-uploaded copy of the same file is served from the cache."""
+        original = write_pdf(tmp_path / "cv.pdf", ["Experienced engineer"])
+        copy = tmp_path / "upload-123.pdf"
+        copy.write_bytes(original.read_bytes())
+        
+        processor = DocumentProcessor(cache_dir=tmp_path / "cache")
+        first = processor.extract_text_from_pdf(str(original))
+        
+        def fail_open(*args, **kwargs):
+            raise AssertionError("cached PDF should not be re-parsed")
+        
+        monkeypatch.setattr(dp.pdfplumber, "open", fail_open)
+        assert processor.extract_text_from_pdf(str(copy)) == first == "Experienced engineer"
+
+
+class TestURLExtraction:
+    """Test fetching and parsing job pages."""
+    
+    @pytest.fixture
+    def serve(self, monkeypatch):
+        """Serve job pages from a handler through the async HTTP client."""
+        def install(handler):
+            monkeypatch.setattr(
+                dp, "get_async_http_client",
+                lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+        return install
+    
+    def test_many_urls_limited_per_host(self, serve):
+        """Test URLs are fetched concurrently, but only a few at a time per host."""
+        active, peak = {}, {}
+        
+        async def handler(request):
+            host = request.url.host
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+            await asyncio.sleep(0.02)
+            active[host] -= 1
+            return httpx.Response(200, content=JOB_PAGE)
+        
+        serve(handler)
+        urls = [f"https://{host}/jobs/{i}" for i in range(6) for host in ("a.example", "b.example")]
+        results = asyncio.run(JobDescriptionExtractor().extract_from_urls_async(urls, per_host=2))
+        
+        assert [r["url"] for r in results] == urls
+        assert all(r["title"] == "Backend Engineer" and r["company"] == "Acme" for r in results)
+        assert peak == {"a.example": 2, "b.example": 2}
+    
+    def test_oversized_page_rejected(self, serve, monkeypatch):
+        """Test a page over the size cap is reported as an error, not parsed."""
+        serve(lambda request: httpx.Response(
+            200, content=JOB_PAGE if request.url.path == "/small" else JOB_PAGE * 10
+        ))
+        monkeypatch.setattr(JobDescriptionExtractor, "_max_page_bytes", lambda self: len(JOB_PAGE))
+        
+        extractor = JobDescriptionExtractor()
+        large, small = asyncio.run(extractor.extract_from_urls_async(
+            ["https://a.example/large", "https://a.example/small"]
+        ))
+        assert "larger than" in large["error"]
+        assert small["title"] == "Backend Engineer"
+
+
+LINKEDIN_PAGE = b"""<html><head><meta property="og:description" content="Acme is hiring">
+<script>var chrome = "Sign in";</script></head><body>
+<nav><a>Jobs</a><a>Messaging</a></nav>
+<div class="jobs-unified-top-card"><h1 class="t-24 t-bold inline">Backend Engineer</h1>
+<span class="jobs-unified-top-card__company-name"><a>Acme</a></span></div>
+<div class="jobs-description__content">We need 5+ years of experience with Python and PostgreSQL, full-time.</div>
+<aside><h2>Similar jobs</h2></aside>
+</body></html>"""
+
+
+class TestHTMLParsing:
+    """Test parser backends and partial parsing of job pages."""
+    
+    @pytest.mark.parametrize("parser", available_parsers())
+    def test_regions_match_whole_page(self, parser):
+        """Test building only the parsed regions gives the same job data."""
+        from bs4 import BeautifulSoup
+        
+        url = "https://www.linkedin.com/jobs/view/1"
+        extractor = JobDescriptionExtractor(parser)
+        whole = extractor._parse_linkedin_job(BeautifulSoup(LINKEDIN_PAGE, parser), url)
+        assert extractor.parse_html(LINKEDIN_PAGE, url) == whole
+        assert whole["company"] == "Acme"
+        assert whole["employment_type"] == "Full-time"
+    
+    def test_regions_exclude_page_chrome(self):
+        """Test the region tree leaves out navigation, scripts and sidebars."""
+        extractor = JobDescriptionExtractor()
+        soup = extractor.make_soup(LINKEDIN_PAGE, dp._platform_region('linkedin'))
+        text = soup.get_text(" ", strip=True)
+        assert "Backend Engineer" in text
+        assert not any(chrome in text for chrome in ("Messaging", "Sign in", "Similar jobs"))
+    
+    def test_linkedin_falls_back_to_page_text(self):
+        """Test a LinkedIn page without a description block uses the page text."""
+        page = LINKEDIN_PAGE.replace(b"jobs-description__content", b"about")
+        job = JobDescriptionExtractor().parse_html(page, "https://www.linkedin.com/jobs/view/1")
+        assert "5+ years of experience" in job["description"]
+        assert "var chrome" not in job["description"]
+    
+    def test_unavailable_parser_falls_back(self):
+        """Test an uninstalled parser falls back to the fastest available one."""
+        assert resolve_parser("no-such-parser") == available_parsers()[0]
+        assert JobDescriptionExtractor("html.parser").html_parser == "html.parser"
+
+
+class TestPageCache:
+    """Test the on-disk cache of fetched job pages."""
+    
+    @pytest.fixture
+    def server(self, monkeypatch):
+        """Serve JOB_PAGE with an ETag, answering 304 to a matching If-None-Match."""
+        state = {"etag": '"v1"', "content": JOB_PAGE, "requests": [], "statuses": []}
+        
+        def handler(request):
+            state["requests"].append(request)
+            if request.headers.get("If-None-Match") == state["etag"]:
+                response = httpx.Response(304, headers={"ETag": state["etag"]})
+            else:
+                response = httpx.Response(200, content=state["content"], headers={"ETag": state["etag"]})
+            state["statuses"].append(response.status_code)
+            return response
+        
+        transport = httpx.MockTransport(handler)
+        monkeypatch.setattr(dp, "get_http_client", lambda: httpx.Client(transport=transport))
+        monkeypatch.setattr(dp, "get_async_http_client", lambda: httpx.AsyncClient(transport=transport))
+        return state
+    
+    @pytest.fixture
+    def parses(self, monkeypatch):
+        """Count parsed pages."""
+        parsed = []
+        parse_html = JobDescriptionExtractor.parse_html
+        
+        def counting(self, content, url):
+            parsed.append(url)
+            return parse_html(self, content, url)
+        
+        monkeypatch.setattr(JobDescriptionExtractor, "parse_html", counting)
+        return parsed
+    
+    def test_normalize_url(self):
+        """Test tracking parameters, fragments and default ports are dropped."""
+        assert normalize_url(
+            "HTTPS://Jobs.Example.com:443/view?utm_source=x&b=2&trk=feed&a=1#apply"
+        ) == "https://jobs.example.com/view?a=1&b=2"
+        assert normalize_url("http://example.com") == "http://example.com/"
+    
+    def test_unchanged_page_not_downloaded_or_parsed(self, server, parses, tmp_path):
+        """Test a 304 returns the cached job data without parsing."""
+        extractor = JobDescriptionExtractor(page_cache_dir=tmp_path)
+        first = extractor.extract_from_url("https://jobs.example.com/1?utm_source=mail")
+        second = extractor.extract_from_url("https://jobs.example.com/1?trk=feed")
+        
+        assert server["requests"][1].headers["If-None-Match"] == '"v1"'
+        assert len(parses) == 1
+        assert second == {**first, "url": "https://jobs.example.com/1?trk=feed"}
+    
+    def test_changed_page_parsed_again(self, server, parses, tmp_path):
+        """Test a page with a new ETag is downloaded, parsed and re-cached."""
+        extractor = JobDescriptionExtractor(page_cache_dir=tmp_path)
+        extractor.extract_from_url("https://jobs.example.com/1")
+        server.update(etag='"v2"', content=JOB_PAGE.replace(b"Backend", b"Frontend"))
+        
+        assert extractor.extract_from_url("https://jobs.example.com/1")["title"] == "Frontend Engineer"
+        assert extractor.extract_from_url("https://jobs.example.com/1")["title"] == "Frontend Engineer"
+        assert len(parses) == 2
+    
+    def test_parse_version_change_reparses_cached_body(self, server, parses, tmp_path, monkeypatch):
+        """Test cached job data from another parser version is re-parsed from the cached page."""
+        JobDescriptionExtractor(page_cache_dir=tmp_path).extract_from_url("https://jobs.example.com/1")
+        monkeypatch.setattr(dp, "JOB_PAGE_PARSE_VERSION", "next")
+        
+        extractor = JobDescriptionExtractor(page_cache_dir=tmp_path)
+        assert extractor.extract_from_url("https://jobs.example.com/1")["title"] == "Backend Engineer"
+        extractor.extract_from_url("https://jobs.example.com/1")
+        assert len(parses) == 2
+        assert [r.headers.get("If-None-Match") for r in server["requests"]] == [None, '"v1"', '"v1"']
+    
+    def test_failed_reparse_not_cached(self, server, tmp_path, monkeypatch):
+        """Test an error from re-parsing an unchanged page is not stored as its job data."""
+        JobDescriptionExtractor(page_cache_dir=tmp_path).extract_from_url("https://jobs.example.com/1")
+        monkeypatch.setattr(dp, "JOB_PAGE_PARSE_VERSION", "next")
+        monkeypatch.setattr(
+            JobDescriptionExtractor, "parse_html", lambda self, content, url: {"error": "boom", "url": url}
+        )
+        monkeypatch.setattr(dp, "_get_parse_pool", lambda: ThreadPoolExecutor(max_workers=1))
+        
+        extractor = JobDescriptionExtractor(page_cache_dir=tmp_path)
+        assert extractor.extract_from_url("https://jobs.example.com/1")["error"] == "boom"
+        assert asyncio.run(extractor.extract_from_urls_async(["https://jobs.example.com/1"]))[0]["error"] == "boom"
+        assert extractor.page_cache.get("https://jobs.example.com/1").job_data is None
+    
+    def test_async_uses_cache(self, server, parses, tmp_path, monkeypatch):
+        """Test concurrent extraction revalidates cached pages too."""
+        monkeypatch.setattr(dp, "_get_parse_pool", lambda: ThreadPoolExecutor(max_workers=1))
+        extractor = JobDescriptionExtractor(page_cache_dir=tmp_path)
+        extractor.extract_from_url("https://jobs.example.com/1")
+        parses.clear()
+        
+        results = asyncio.run(extractor.extract_from_urls_async(["https://jobs.example.com/1"]))
+        assert results[0]["title"] == "Backend Engineer"
+        assert server["requests"][-1].headers["If-None-Match"] == '"v1"'
+        assert server["statuses"] == [200, 304]
+        assert parses == []
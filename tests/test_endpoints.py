@@ -0,0 +1,183 @@
+"""Test load balancing across Ollama nodes."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from job_application_assistant.core.config import Settings
+from job_application_assistant.core.endpoints import (
+    LEAST_OUTSTANDING,
+    Endpoint,
+    EndpointPool,
+)
+from job_application_assistant.core.llm import LLMManager
+from job_application_assistant.core.ollama_client import OllamaMetadataClient
+
+
+class StaticClient:
+    """Metadata client with fixed model listings."""
+
+    def __init__(self, base_url, models, running=()):
+        self.base_url = base_url
+        self.models = list(models)
+        self.running = list(running)
+
+    def cached_models(self):
+        return self.models
+
+    def cached_running_models(self):
+        return self.running
+
+    def listings_expired(self):
+        return False
+
+    def has_listings(self):
+        return True
+
+
+def _pool(*clients, **kwargs):
+    return EndpointPool([Endpoint(client) for client in clients], **kwargs)
+
+
+class TestEndpointPool:
+    """Test node ranking."""
+
+    def test_only_nodes_serving_the_model(self):
+        """Test nodes without the model pulled are not ranked."""
+        pool = _pool(StaticClient("http://a", ["llama"]), StaticClient("http://b", ["gemma"]))
+        assert [e.url for e in pool.rank("gemma")] == ["http://b"]
+
+    def test_loaded_model_preferred(self):
+        """Test affinity for a node that already has the model loaded."""
+        pool = _pool(
+            StaticClient("http://a", ["llama"]),
+            StaticClient("http://b", ["llama"], running=["llama"]),
+        )
+        assert pool.rank("llama")[0].url == "http://b"
+
+    def test_busy_node_loses_affinity(self):
+        """Test load spills over once the loaded node is busy enough."""
+        pool = _pool(
+            StaticClient("http://a", ["llama"]),
+            StaticClient("http://b", ["llama"], running=["llama"]),
+            model_load_seconds=2.0,
+        )
+        a, b = pool.endpoints
+        a.latency = b.latency = 1.0
+        b.outstanding = 3
+        assert pool.rank("llama")[0] is a
+
+    def test_latency_ewma(self):
+        """Test the faster node wins once latencies are known."""
+        pool = _pool(StaticClient("http://a", ["llama"]), StaticClient("http://b", ["llama"]))
+        a, b = pool.endpoints
+        a.latency, b.latency = 2.0, 0.5
+        assert pool.rank("llama")[0] is b
+
+        with pool.track(a, "llama"):
+            assert a.outstanding == 1
+        assert a.outstanding == 0
+        assert a.latency < 2.0
+        assert a.has_loaded("llama", affinity_seconds=60)
+
+    def test_least_outstanding(self):
+        """Test the least outstanding strategy ignores latency."""
+        pool = _pool(
+            StaticClient("http://a", ["llama"], running=["llama"]),
+            StaticClient("http://b", ["llama"], running=["llama"]),
+            strategy=LEAST_OUTSTANDING,
+        )
+        a, b = pool.endpoints
+        a.latency, b.latency = 0.1, 5.0
+        a.outstanding = 2
+        assert pool.rank("llama")[0] is b
+
+    def test_failure_counted(self):
+        """Test a failed request is counted and leaves the latency alone."""
+        pool = _pool(StaticClient("http://a", ["llama"]))
+        endpoint = pool.default
+        with pytest.raises(RuntimeError):
+            with pool.track(endpoint, "llama"):
+                raise RuntimeError("boom")
+        assert endpoint.failures == 1
+        assert endpoint.latency is None
+        assert endpoint.outstanding == 0
+
+    def test_listings_refreshed_off_the_loop(self):
+        """Test ranking never fetches, and listings are fetched in a worker thread."""
+        fetches = []
+
+        def handler(request):
+            fetches.append((request.url.path, threading.current_thread() is threading.main_thread()))
+            models = [{"name": "llama"}]
+            return httpx.Response(200, json={"models": models})
+
+        client = OllamaMetadataClient(
+            "http://a", ttl_seconds=60, http_client=httpx.Client(transport=httpx.MockTransport(handler))
+        )
+        pool = _pool(client)
+        assert pool.rank("llama") == []
+        assert fetches == []
+
+        asyncio.run(pool.refresh_async())
+        assert sorted(fetches) == [("/api/ps", False), ("/api/tags", False)]
+        assert pool.rank("llama") == [pool.default]
+        assert pool.default.has_loaded("llama", affinity_seconds=0)
+
+        asyncio.run(pool.refresh_async())
+        assert len(fetches) == 2
+
+
+class TestManagerRouting:
+    """Test the LLM manager spreading requests over nodes."""
+
+    def test_requests_spread_across_nodes(self, tmp_path, monkeypatch):
+        """Test concurrent requests are routed to both nodes."""
+        settings = Settings(
+            cache_dir=tmp_path / "cache",
+            trace_file=tmp_path / "traces.jsonl",
+            ollama_base_url="http://a",
+            ollama_endpoints=["http://b"],
+            max_requests_per_minute=6000,
+        )
+        manager = LLMManager(settings)
+        manager.pool = _pool(
+            StaticClient("http://a", [settings.primary_model_name]),
+            StaticClient("http://b", [settings.primary_model_name]),
+        )
+        monkeypatch.setattr(
+            manager, "_build_llm",
+            lambda config, base_url=None: FakeListChatModel(responses=[base_url or "http://a"]),
+        )
+        manager._primary_llm = manager._build_llm(settings.primary_model)
+        manager._model_health[settings.primary_model_name] = True
+        manager._initialized = True
+
+        async def call(llm):
+            await asyncio.sleep(0.01)
+            return (await llm.ainvoke("hi")).content
+
+        async def run():
+            return await asyncio.gather(*(manager.run_with_failover(call) for _ in range(4)))
+
+        served = sorted(text for text, _ in asyncio.run(run()))
+        assert served == ["http://a", "http://a", "http://b", "http://b"]
+        assert not any(manager.is_fallback(llm) for _, llm in asyncio.run(run()))
+
+    def test_concurrency_limit_scales_with_nodes(self, tmp_path):
+        """Test the pipeline limiter admits more steps with more nodes."""
+        settings = Settings(
+            cache_dir=tmp_path / "cache",
+            trace_file=tmp_path / "traces.jsonl",
+            llm_max_concurrency=3,
+            ollama_endpoints=["http://b", "http://c"],
+        )
+        manager = LLMManager(settings)
+
+        async def limit():
+            return manager.get_concurrency_limiter()._value
+
+        assert asyncio.run(limit()) == 9
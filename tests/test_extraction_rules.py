@@ -0,0 +1,88 @@
+"""Test the precompiled extraction rules."""
+
+import time
+
+import pytest
+
+from job_application_assistant.tools.document_processor import JobDescriptionExtractor
+from job_application_assistant.tools.extraction_rules import (
+    extract_contact_info,
+    extract_requirements,
+    find_company,
+    find_location,
+    strip_linkedin_chrome,
+)
+
+# ~200KB inputs that made the old unbounded patterns backtrack quadratically
+PATHOLOGICAL_INPUTS = {
+    "name_without_suffix": "Software Engineer\n" + "Abc def " * 25_000,
+    "city_without_comma": "Engineer\n" + "Ab" * 100_000,
+    "years_without_period": "5 years " + "experience " * 20_000,
+    "requirement_without_break": "required " + "x " * 100_000,
+    "at_capitals": "Engineer\nat " + "A" * 200_000,
+    "email_local_part": "a" * 200_000,
+    "email_many_ats": "a@" * 100_000,
+    "linkedin_chrome": "LinkedIn " + "Sign in " * 25_000,
+}
+
+
+class TestExtractionRules:
+    """Test individual extraction rules."""
+    
+    def test_contact_info(self):
+        """Test email and phone extraction."""
+        text = "Jane Doe\njane.doe@example.com\n+447911123456"
+        assert extract_contact_info(text) == {
+            "email": "jane.doe@example.com",
+            "phone": "+447911123456",
+        }
+        assert extract_contact_info("no contact details") == {}
+    
+    def test_company_patterns(self):
+        """Test company patterns in priority order."""
+        assert find_company("Acme Widgets Inc. builds widgets") == "Acme Widgets Inc."
+        assert find_company("Company: Globex\nMore text") == "Globex"
+        assert find_company("Initech is hiring engineers") == "Initech"
+        assert find_company("Apply for this job now") is None
+    
+    def test_location_patterns(self):
+        """Test location patterns in priority order."""
+        assert find_location("Location: London, UK\nRemote") == "London, UK"
+        assert find_location("Based in Berlin, Germany") == "Berlin"
+        assert find_location("Fully remote role") == "remote"
+        assert find_location("nowhere to be found") is None
+    
+    def test_requirements(self):
+        """Test requirement phrases are split and deduplicated."""
+        text = (
+            "Must have: Python, SQL, Docker. Experience with python and AWS. "
+            "3+ years of professional experience with Kubernetes."
+        )
+        assert extract_requirements(text) == [
+            "Python", "SQL", "Docker", "python and AWS", "Kubernetes",
+        ]
+    
+    def test_unterminated_requirement_dropped(self):
+        """Test phrases running past the length bound are ignored."""
+        assert extract_requirements("Requires " + "a " * 200) == []
+    
+    def test_strip_linkedin_chrome(self):
+        """Test LinkedIn sign-in chrome is removed."""
+        text = "LinkedIn Jobs Sign in to apply Join now Senior Engineer"
+        assert strip_linkedin_chrome(text) == " Senior Engineer"
+
+
+class TestPathologicalInputs:
+    """Test extraction runs in bounded time on adversarial input."""
+    
+    @pytest.mark.parametrize("name", sorted(PATHOLOGICAL_INPUTS))
+    def test_extract_from_text_bounded(self, name):
+        """Test full text extraction finishes quickly on ~200KB input."""
+        text = PATHOLOGICAL_INPUTS[name]
+        
+        started = time.perf_counter()
+        JobDescriptionExtractor().extract_from_text(text)
+        extract_contact_info(text)
+        strip_linkedin_chrome(text)
+        
+        assert time.perf_counter() - started < 10
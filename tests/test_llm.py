@@ -0,0 +1,188 @@
+"""Test LLM manager initialization and health tracking."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from job_application_assistant.core.config import Settings
+from job_application_assistant.core.exceptions import LLMError
+from job_application_assistant.core.http import get_async_http_client, get_http_client
+from job_application_assistant.core.llm import LLMManager
+from job_application_assistant.core.ollama_client import OllamaMetadataClient
+
+
+def _mock_client(handler):
+    """HTTP client answering requests with ``handler`` instead of the network."""
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def settings(monkeypatch, tmp_path):
+    """Settings pointing at a fake Ollama with two models pulled."""
+    monkeypatch.setattr(Settings, "is_ollama_available", property(lambda self: True))
+    monkeypatch.setattr(
+        Settings, "get_available_models", lambda self: ["llama3.1:8b", "gemma2:9b"]
+    )
+    settings = Settings(cache_dir=tmp_path / "cache", trace_file=tmp_path / "traces.jsonl")
+    settings.refresh_ollama_status()
+    return settings
+
+
+@pytest.fixture
+def probes(monkeypatch, settings):
+    """Record metadata probes; gemma2 is reported missing."""
+    calls = []
+    
+    def handler(request):
+        model = json.loads(request.content)["model"]
+        calls.append(model)
+        return httpx.Response(404 if model == "gemma2:9b" else 200, json={})
+    
+    monkeypatch.setattr(settings.ollama_client, "_http_client", _mock_client(handler))
+    return calls
+
+
+class TestLazyInitialization:
+    """Test lazy LLM manager initialization."""
+    
+    def test_initialize_does_not_generate(self, settings, probes, monkeypatch):
+        """Test lazy init neither generates nor probes models."""
+        async def fail_test_model(*args):
+            raise AssertionError("generation health check should not run")
+        
+        manager = LLMManager(settings)
+        monkeypatch.setattr(manager, "_test_model", fail_test_model)
+        
+        asyncio.run(manager.initialize())
+        assert manager._initialized
+        assert probes == []
+    
+    def test_probe_on_first_use_only(self, settings, probes):
+        """Test the primary model is probed once, on first use."""
+        manager = LLMManager(settings)
+        
+        llm = manager.get_llm()
+        manager.get_llm()
+        
+        assert llm.model == "llama3.1:8b"
+        assert probes == ["llama3.1:8b"]
+    
+    def test_health_persisted_across_managers(self, settings, probes):
+        """Test a fresh manager reuses persisted health instead of probing."""
+        LLMManager(settings).get_llm()
+        probes.clear()
+        
+        manager = LLMManager(settings)
+        manager.get_llm()
+        
+        assert probes == []
+        assert manager.get_model_status()["model_health"]["llama3.1:8b"] is True
+    
+    def test_fallback_when_primary_unhealthy(self, settings, probes, monkeypatch):
+        """Test a primary failing its probe falls back to the next healthy model."""
+        monkeypatch.setattr(settings, "primary_model_name", "gemma2:9b")
+        monkeypatch.setattr(settings, "fallback_model_names", ["llama3.1:8b"])
+        
+        llm = LLMManager(settings).get_llm()
+        
+        assert llm.model == "llama3.1:8b"
+        assert probes == ["gemma2:9b", "llama3.1:8b"]
+    
+    def test_no_model_when_primary_unhealthy_and_fallback_missing(self, settings, probes, monkeypatch):
+        """Test an unhealthy primary with a missing fallback raises LLMError."""
+        monkeypatch.setattr(settings, "fallback_model_names", ["gemma2:9b"])
+        manager = LLMManager(settings)
+        manager.initialize_lazily()
+        manager._record_health("llama3.1:8b", False)
+        
+        with pytest.raises(LLMError):
+            manager.get_llm()
+        assert probes == ["gemma2:9b"]
+    
+    def test_failed_probe_not_persisted(self, settings, probes, monkeypatch):
+        """Test a failed probe is not reused by a fresh manager."""
+        monkeypatch.setattr(settings, "primary_model_name", "gemma2:9b")
+        monkeypatch.setattr(settings, "fallback_model_names", ["llama3.1:8b"])
+        LLMManager(settings).get_llm()
+        probes.clear()
+        
+        LLMManager(settings).get_llm()
+        
+        assert probes == ["gemma2:9b"]
+    
+    def test_unhealthy_model_reprobed_after_retry_interval(self, settings, probes):
+        """Test an unhealthy model is probed again once its retry interval passes."""
+        manager = LLMManager(settings)
+        manager.initialize_lazily()
+        manager._record_health("llama3.1:8b", False)
+        assert manager._is_healthy("llama3.1:8b") is False
+        assert probes == []
+        
+        manager._unhealthy_until["llama3.1:8b"] = 0
+        
+        assert manager.get_llm().model == "llama3.1:8b"
+        assert probes == ["llama3.1:8b"]
+
+
+class TestOllamaMetadataClient:
+    """Test the cached Ollama metadata client."""
+    
+    def test_tags_fetched_once_within_ttl(self):
+        """Test availability and model listing share one cached request."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"models": [{"name": "llama3.1:8b"}]})
+        
+        client = OllamaMetadataClient(
+            "http://ollama.test:11434", ttl_seconds=60, http_client=_mock_client(handler)
+        )
+        
+        assert client.is_available()
+        assert client.list_models() == ["llama3.1:8b"]
+        assert client.is_available()
+        assert len(calls) == 1
+        
+        client.invalidate()
+        client.list_models()
+        assert len(calls) == 2
+    
+    def test_unavailable_server_is_cached(self):
+        """Test failures are cached rather than retried on every call."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.url.path)
+            raise httpx.ConnectError("refused", request=request)
+        
+        client = OllamaMetadataClient(
+            "http://ollama.test:11434", ttl_seconds=60, http_client=_mock_client(handler)
+        )
+        
+        assert not client.is_available()
+        assert client.list_models() == []
+        assert len(calls) == 1
+    
+    def test_settings_share_client(self):
+        """Test settings for the same server share one client."""
+        assert Settings().ollama_client is Settings().ollama_client
+
+
+class TestHTTPClients:
+    """Test the shared pooled HTTP clients."""
+    
+    def test_sync_client_is_shared(self):
+        """Test callers share one pooled client."""
+        assert get_http_client() is get_http_client()
+    
+    def test_async_client_per_loop(self):
+        """Test each event loop gets its own async client."""
+        async def grab():
+            client = get_async_http_client()
+            assert client is get_async_http_client()
+            return client
+        
+        assert asyncio.run(grab()) is not asyncio.run(grab())
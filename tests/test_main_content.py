@@ -0,0 +1,59 @@
+"""Test main-content extraction from job pages."""
+
+from bs4 import BeautifulSoup
+
+from job_application_assistant.tools.document_processor import JobDescriptionExtractor
+from job_application_assistant.tools.main_content import estimate_tokens, extract_main_content
+
+POSTING = """
+<p>We are hiring a Backend Engineer to build APIs, data pipelines and internal tools.</p>
+<ul>
+<li>5+ years of experience with Python, Django and PostgreSQL.</li>
+<li>Experience running services on AWS, Docker and Kubernetes.</li>
+<li>Comfortable owning features from design to production.</li>
+</ul>
+<p>This is a full-time role, with flexible hours, remote days and a learning budget.</p>
+"""
+
+RELATED = "".join(
+    f'<li><a href="/jobs/{i}">Software Engineer {i}, Company {i} Ltd, London, UK</a></li>' for i in range(30)
+)
+
+PAGE = f"""<html><body>
+<div class="cookie-banner"><p>We use cookies to improve your experience on our site, see our policy.</p></div>
+<nav><ul><li>Jobs</li><li>Companies</li><li>Salaries</li></ul></nav>
+<div class="layout">
+  <div class="job-body"><h1>Backend Engineer</h1><div class="posting-text">{POSTING}</div></div>
+  <div class="more-jobs"><ul>{RELATED}</ul></div>
+</div>
+<footer><p>Copyright 2026, Example Jobs. All rights reserved, terms and privacy apply.</p></footer>
+</body></html>"""
+
+
+def main_content(html):
+    return extract_main_content(BeautifulSoup(html, "html.parser"))
+
+
+class TestMainContent:
+    """Test picking the posting out of the page."""
+
+    def test_posting_without_chrome(self):
+        """Test the posting is kept and navigation, banners and listings are not."""
+        content = main_content(PAGE)
+        assert content.splitlines()[0].startswith("We are hiring a Backend Engineer")
+        assert "5+ years of experience with Python" in content
+        for chrome in ("cookies", "Salaries", "Software Engineer 3", "Copyright"):
+            assert chrome not in content
+
+    def test_short_pages_give_none(self):
+        """Test pages without a substantial block give None."""
+        assert main_content("<html><body><p>Backend Engineer, Acme, London.</p></body></html>") is None
+        assert main_content("<html><body><nav>" + POSTING + "</nav></body></html>") is None
+
+    def test_description_uses_main_content(self):
+        """Test generic pages store the main content as the description."""
+        job = JobDescriptionExtractor().parse_html(PAGE.encode(), "https://careers.example.com/1")
+        page_text = BeautifulSoup(PAGE, "html.parser").get_text(" ", strip=True)
+        assert "Software Engineer 3" not in job["description"]
+        assert estimate_tokens(job["description"]) < estimate_tokens(page_text) / 2
+        assert job["requirements"]
@@ -0,0 +1,191 @@
+"""Test circuit breakers and model failover."""
+
+import asyncio
+import time
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from job_application_assistant.core.admission import AdmissionController
+from job_application_assistant.core.exceptions import LLMError
+from job_application_assistant.core.resilience import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FailingChatModel(FakeListChatModel):
+    """Fake chat model raising ``error`` on every call."""
+
+    error: Exception = ConnectionError("connection refused")
+    calls: int = 0
+
+    def _call(self, *args, **kwargs):
+        self.calls += 1
+        raise self.error
+
+    def _stream(self, *args, **kwargs):
+        self._call()
+        yield  # pragma: no cover
+
+    async def _astream(self, *args, **kwargs):
+        self._call()
+        yield  # pragma: no cover
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestCircuitBreaker:
+    """Test the circuit breaker state machine."""
+
+    def test_opens_on_failure_rate(self):
+        """Test the breaker opens once enough recent calls failed."""
+        breaker = CircuitBreaker("m", failure_rate_threshold=0.5, window_size=4, min_calls=4)
+        breaker.record_success(0.1)
+        breaker.record_success(0.1)
+        breaker.record_failure(ValueError("bad"))
+        assert breaker.state == CLOSED
+
+        breaker.record_failure(ValueError("bad"))
+        assert breaker.state == OPEN
+        assert not breaker.allow_request()
+
+    def test_slow_calls_count_as_bad(self):
+        """Test calls over the latency threshold count towards opening."""
+        breaker = CircuitBreaker("m", window_size=2, min_calls=2, slow_call_seconds=1.0)
+        breaker.record_success(5.0)
+        breaker.record_success(5.0)
+        assert breaker.state == OPEN
+
+    def test_timeout_opens_immediately(self):
+        """Test a single timeout opens the breaker."""
+        breaker = CircuitBreaker("m", min_calls=10)
+        breaker.record_failure(asyncio.TimeoutError())
+        assert breaker.state == OPEN
+
+    def test_half_open_admits_one_trial(self):
+        """Test without a probe, one trial request decides the state."""
+        breaker = CircuitBreaker("m", open_seconds=0.01)
+        breaker.record_failure(TimeoutError())
+        time.sleep(0.02)
+
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_success(0.1)
+        assert breaker.state == CLOSED
+
+    def test_failed_trial_backs_off(self):
+        """Test a failed trial reopens the breaker for longer."""
+        breaker = CircuitBreaker("m", open_seconds=0.01)
+        breaker.record_failure(TimeoutError())
+        time.sleep(0.02)
+        assert breaker.allow_request()
+
+        breaker.record_failure(ValueError("still down"))
+        assert breaker.state == OPEN
+        assert breaker._current_open_seconds == pytest.approx(0.02)
+
+    def test_background_probe_closes(self):
+        """Test a successful background probe closes the breaker."""
+        probes = []
+
+        def probe():
+            probes.append(1)
+            return len(probes) > 1  # fail the first probe
+
+        breaker = CircuitBreaker("m", open_seconds=0.01, probe=probe)
+        breaker.record_failure(TimeoutError())
+        assert not breaker.allow_request()
+
+        assert _wait_for(lambda: breaker.state == CLOSED)
+        assert len(probes) == 2
+
+
+@pytest.fixture
+def manager(make_llm_manager):
+    """LLM manager with a failing primary and a healthy fallback."""
+    return make_llm_manager(
+        FailingChatModel(responses=["unused"], error=TimeoutError("timed out")),
+        [FakeListChatModel(responses=["fallback"])],
+        llm_breaker_open_seconds=60,
+    )
+
+
+class TestFailover:
+    """Test routing LLM calls around failing models."""
+
+    def test_sick_primary_costs_one_timeout(self, manager):
+        """Test requests fail over, and skip the primary once its circuit opens."""
+        async def call(llm):
+            return await llm.ainvoke("hello")
+
+        async def run():
+            return [await manager.run_with_failover(call) for _ in range(3)]
+
+        results = asyncio.run(run())
+
+        assert [message.content for message, _ in results] == ["fallback"] * 3
+        assert all(manager.is_fallback(llm) for _, llm in results)
+        assert manager._primary_llm.calls == 1
+        assert manager.get_llm() is manager._fallback_llms[0]
+
+    def test_stream_fails_over_before_first_chunk(self, manager):
+        """Test a stream failing before output is retried on the fallback."""
+        def stream(llm):
+            return llm.astream("hello")
+
+        async def run():
+            return [chunk.content async for _, chunk in manager.stream_with_failover(stream)]
+
+        assert "".join(asyncio.run(run())) == "fallback"
+        assert manager.breaker(manager.settings.primary_model_name).state == OPEN
+
+    def test_each_attempt_admitted_separately(self, manager):
+        """Test a failed attempt gives back its admission slot before the next model runs."""
+        manager.admission = AdmissionController(6000, max_in_flight=1, burst=10)
+        in_flight = []
+
+        async def call(llm):
+            in_flight.append(manager.admission.metrics()["in_flight"])
+            return await llm.ainvoke("hello")
+
+        message, _ = asyncio.run(manager.run_with_failover(call))
+
+        assert message.content == "fallback"
+        assert in_flight == [1, 1]
+        metrics = manager.admission.metrics()
+        assert metrics["admitted"]["interactive"] == 2
+        assert metrics["in_flight"] == 0
+
+    def test_caller_errors_not_failed_over(self, manager):
+        """Test an error from the calling code is raised without touching the breakers."""
+        calls = []
+
+        async def call(llm):
+            calls.append(llm)
+            raise ValueError("bad prompt inputs")
+
+        with pytest.raises(ValueError):
+            asyncio.run(manager.run_with_failover(call))
+        assert calls == [manager._primary_llm]
+        breaker = manager.breaker(manager.settings.primary_model_name)
+        assert breaker.state == CLOSED
+        assert not breaker._outcomes
+
+    def test_all_models_failing(self, manager):
+        """Test an error naming every failure when no model succeeds."""
+        manager._fallback_llms = [FailingChatModel(responses=["unused"])]
+
+        async def call(llm):
+            return await llm.ainvoke("hello")
+
+        with pytest.raises(LLMError) as exc_info:
+            asyncio.run(manager.run_with_failover(call))
+        assert "timed out" in exc_info.value.details
+        assert "connection refused" in exc_info.value.details
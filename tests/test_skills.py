@@ -0,0 +1,99 @@
+"""Test skill taxonomy matching."""
+
+import json
+
+import pytest
+
+from job_application_assistant.core.exceptions import ConfigurationError
+from job_application_assistant.tools.document_processor import (
+    DocumentProcessor,
+    JobDescriptionExtractor,
+)
+from job_application_assistant.tools.skills import (
+    DEFAULT_TAXONOMY_PATH,
+    Skill,
+    SkillMatcher,
+    get_skill_matcher,
+    load_taxonomy,
+    merge_taxonomies,
+)
+
+
+@pytest.fixture
+def matcher():
+    """Matcher over the packaged taxonomy."""
+    return SkillMatcher(load_taxonomy(DEFAULT_TAXONOMY_PATH))
+
+
+class TestSkillMatcher:
+    """Test SkillMatcher."""
+    
+    def test_aliases_normalized(self, matcher):
+        """Test alias spellings map to the canonical name."""
+        text = "Built services in nodejs and golang on k8s with Postgres."
+        assert matcher.find(text) == ["Node.js", "Go", "Kubernetes", "PostgreSQL"]
+    
+    def test_word_boundaries(self, matcher):
+        """Test skills embedded in longer words are not matched."""
+        text = "JavaScript on GitHub, a good PostgreSQL setup; let's go google it"
+        found = matcher.find(text)
+        
+        assert "JavaScript" in found and "GitHub" in found and "PostgreSQL" in found
+        assert "Java" not in found
+        assert "Git" not in found
+        assert "SQL" not in found
+        assert "Go" not in found
+    
+    def test_case_sensitive_names(self, matcher):
+        """Test common-word names need exact casing but aliases do not."""
+        assert matcher.find("REST services in Go") == ["REST", "Go"]
+        assert matcher.find("get some rest and go home") == []
+        assert matcher.find("restful services in golang") == ["REST", "Go"]
+    
+    def test_symbol_terms(self, matcher):
+        """Test skills containing symbols match exactly."""
+        assert matcher.find("C++, C# and CI/CD pipelines") == ["C++", "C#", "CI/CD"]
+        assert matcher.find("ANSI C code") == []
+    
+    def test_order_and_limit(self, matcher):
+        """Test results follow first mention, deduplicated and limited."""
+        text = "Docker, Python, docker again, AWS"
+        assert matcher.find(text) == ["Docker", "Python", "AWS"]
+        assert matcher.find(text, limit=2) == ["Docker", "Python"]
+    
+    def test_user_taxonomy_extends_default(self, tmp_path):
+        """Test a user file adds skills and aliases."""
+        path = tmp_path / "skills.json"
+        path.write_text(json.dumps([
+            {"name": "Terraform", "aliases": ["tf"]},
+            {"name": "Python", "aliases": ["cpython"]},
+        ]))
+        
+        matcher = get_skill_matcher(path)
+        assert matcher.find("Terraform and tf modules in CPython") == ["Terraform", "Python"]
+    
+    def test_invalid_taxonomy(self, tmp_path):
+        """Test malformed taxonomy files raise a configuration error."""
+        path = tmp_path / "skills.json"
+        path.write_text('[{"aliases": []}]')
+        
+        with pytest.raises(ConfigurationError):
+            load_taxonomy(path)
+    
+    def test_merge_keeps_first_name(self):
+        """Test merging by name keeps one entry per skill."""
+        merged = merge_taxonomies([Skill("Python")], [Skill("python", ["py"])])
+        assert [(s.name, s.aliases) for s in merged] == [("Python", ["py"])]
+
+
+class TestExtractorsUseTaxonomy:
+    """Test the document processors share the taxonomy."""
+    
+    def test_cv_and_job_skills_agree(self):
+        """Test CV and job description extraction find the same skills."""
+        text = "Senior engineer: Python, React, nodejs, AWS and Kubernetes."
+        
+        cv_skills = DocumentProcessor().parse_cv_content(text)["skills"]
+        job_skills = JobDescriptionExtractor()._extract_skills_from_text(text)
+        
+        assert cv_skills == job_skills == ["Python", "React", "Node.js", "AWS", "Kubernetes"]
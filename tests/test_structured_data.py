@@ -0,0 +1,113 @@
+"""Test reading schema.org JobPosting markup."""
+
+import json
+
+from job_application_assistant.tools.document_processor import JobDescriptionExtractor
+from job_application_assistant.tools.structured_data import find_job_posting, html_to_text
+
+POSTING = {
+    "@type": "JobPosting",
+    "title": "Backend Engineer",
+    "hiringOrganization": {"@type": "Organization", "name": "Acme"},
+    "jobLocation": [{"@type": "Place", "address": {
+        "addressLocality": "London", "addressRegion": "London", "addressCountry": {"name": "UK"},
+    }}],
+    "employmentType": ["FULL_TIME"],
+    "skills": "Python, PostgreSQL",
+    "description": "&lt;p&gt;We need 5+ years of experience with Python.&lt;/p&gt;&lt;ul&gt;&lt;li&gt;Own APIs&lt;/li&gt;&lt;/ul&gt;",
+}
+
+
+def json_ld_page(data, chrome="<nav>Sign in Jobs Messaging</nav>"):
+    script = f'<script type="application/ld+json">{json.dumps(data)}</script>'
+    return f"<html><head>{script}</head><body>{chrome}</body></html>".encode()
+
+
+MICRODATA_PAGE = b"""<html><body><nav>Sign in</nav>
+<div itemscope itemtype="https://schema.org/JobPosting">
+  <h1 itemprop="title">Data Engineer</h1>
+  <div itemprop="hiringOrganization" itemscope itemtype="https://schema.org/Organization">
+    <span itemprop="name">Globex</span>
+  </div>
+  <meta itemprop="employmentType" content="PART_TIME">
+  <div itemprop="description"><p>Build pipelines &amp; models.</p><ul><li>Spark</li></ul></div>
+</div>
+<footer itemprop="title">Not part of the posting</footer>
+</body></html>"""
+
+
+class TestFindJobPosting:
+    """Test the JSON-LD and microdata readers."""
+
+    def test_json_ld(self):
+        """Test the JobPosting fields are mapped and the description is plain text."""
+        posting = find_job_posting(json_ld_page(POSTING))
+        assert posting == {
+            "title": "Backend Engineer",
+            "company": "Acme",
+            "location": "London, UK",
+            "description": "We need 5+ years of experience with Python.\nOwn APIs",
+            "employment_type": "Full-time",
+            "skills": ["Python", "PostgreSQL"],
+            "source": "json-ld",
+        }
+
+    def test_json_ld_graph_and_invalid_blocks(self):
+        """Test a posting inside ``@graph`` is found past an unparseable block."""
+        graph = {"@context": "https://schema.org", "@graph": [{"@type": "WebPage"}, POSTING]}
+        page = b'<script type="application/ld+json">{not json</script>' + json_ld_page(graph)
+        assert find_job_posting(page)["title"] == "Backend Engineer"
+
+    def test_microdata(self):
+        """Test microdata is read up to the end of the JobPosting item."""
+        posting = find_job_posting(MICRODATA_PAGE)
+        assert posting["title"] == "Data Engineer"
+        assert posting["company"] == "Globex"
+        assert posting["employment_type"] == "Part-time"
+        assert posting["description"] == "Build pipelines & models.\nSpark"
+        assert posting["source"] == "microdata"
+
+    def test_no_posting(self):
+        """Test pages without a titled JobPosting give None."""
+        assert find_job_posting(json_ld_page({"@type": "Organization", "name": "Acme"})) is None
+        assert find_job_posting(json_ld_page({**POSTING, "title": " "})) is None
+        assert find_job_posting(b"<html><h1>Backend Engineer</h1></html>") is None
+
+    def test_html_to_text(self):
+        """Test block elements become lines and entities are decoded."""
+        assert html_to_text("<h3>Role</h3>Python &amp; SQL<br>Remote") == "Role\nPython & SQL\nRemote"
+
+
+class TestParseHTML:
+    """Test the extractor's use of structured data."""
+
+    def test_structured_data_preferred(self):
+        """Test the posting is used instead of the page text."""
+        job = JobDescriptionExtractor().parse_html(json_ld_page(POSTING), "https://www.indeed.com/viewjob?jk=1")
+        assert job["platform"] == "Indeed"
+        assert job["company"] == "Acme"
+        assert "Sign in" not in job["description"]
+        assert job["requirements"]
+        assert "source" not in job and "employment_type" not in job
+    
+    def test_posting_without_description(self):
+        """Test a posting without a description is completed from the DOM."""
+        posting = {key: POSTING[key] for key in ("@type", "title", "hiringOrganization")}
+        page = json_ld_page(posting, chrome=(
+            "<main><h1>Engineer</h1><p>We need 5+ years of experience with Python "
+            "and strong knowledge of distributed systems.</p></main>"
+        ))
+        job = JobDescriptionExtractor().parse_html(page, "https://careers.example.com/1")
+        assert job["title"] == "Backend Engineer"
+        assert job["company"] == "Acme"
+        assert "distributed systems" in job["description"]
+        assert job["requirements"]
+        assert "source" not in job
+
+    def test_dom_fallback(self):
+        """Test pages without structured data are parsed from the DOM."""
+        page = b'<html><body><h1>Backend Engineer</h1><div class="company">Acme</div></body></html>'
+        job = JobDescriptionExtractor().parse_html(page, "https://careers.example.com/1")
+        assert job["title"] == "Backend Engineer"
+        assert job["platform"] == "Generic"
+        assert "source" not in job
@@ -0,0 +1,178 @@
+"""Test LLM call tracing."""
+
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from job_application_assistant.agents.job_application_agent import JobApplicationAgent
+from job_application_assistant.core.config import Settings
+from job_application_assistant.core.llm import LLMManager
+from job_application_assistant.core.tracing import (
+    Span,
+    Tracer,
+    load_spans,
+    render_prometheus,
+    serve_metrics,
+    summarize,
+)
+
+
+def _span(**overrides):
+    values = dict(agent="Agent", step="step", model="m", started_at=0.0, duration=1.0)
+    values.update(overrides)
+    return Span(**values)
+
+
+class TestAgentTracing:
+    """Test spans emitted for agent steps."""
+    
+    def test_spans_per_step_with_cache_hits(
+        self, llm_manager, sample_job_description, sample_user_profile,
+        sample_user_preferences
+    ):
+        """Test each step is traced, first as a miss and then as a cache hit."""
+        agent = JobApplicationAgent()
+        for _ in range(2):
+            asyncio.run(agent.process_application(
+                sample_job_description, sample_user_profile, sample_user_preferences
+            ))
+        
+        spans = load_spans(llm_manager.settings.trace_path)
+        assert sorted((s.step, s.cache_hit) for s in spans) == [
+            ("analysis", False), ("analysis", True),
+            ("cover_letter", False), ("cover_letter", True),
+            ("motivation_letter", False), ("motivation_letter", True),
+        ]
+        assert {s.agent for s in spans} == {"JobApplicationAgent"}
+        assert {s.model for s in spans} == {"FakeListChatModel"}
+        assert not any(s.fallback for s in spans)
+        assert spans == llm_manager.tracer.spans()
+    
+    def test_streaming_records_ttft(
+        self, llm_manager, sample_job_description, sample_user_profile,
+        sample_user_preferences
+    ):
+        """Test streamed steps record time to first token."""
+        agent = JobApplicationAgent(use_cache=False)
+        
+        async def consume():
+            async for _ in agent.stream_application(
+                sample_job_description, sample_user_profile, sample_user_preferences
+            ):
+                pass
+        
+        asyncio.run(consume())
+        
+        spans = llm_manager.tracer.spans()
+        assert [s.step for s in spans] == ["cover_letter", "motivation_letter"]
+        assert all(s.ttft is not None and s.ttft <= s.duration for s in spans)
+        assert all(s.cache_hit is None for s in spans)
+    
+    def test_fallback_flagged(
+        self, llm_manager, sample_job_description, sample_user_profile,
+        sample_user_preferences
+    ):
+        """Test calls served by a fallback model are flagged."""
+        fallback = FakeListChatModel(responses=["Generated text"])
+        llm_manager._fallback_llms = [fallback]
+        llm_manager._primary_llm = None
+        llm_manager._model_health[getattr(fallback, "model", "unknown")] = True
+        
+        asyncio.run(JobApplicationAgent(use_cache=False).process_application(
+            sample_job_description, sample_user_profile, sample_user_preferences
+        ))
+        
+        assert all(s.fallback for s in llm_manager.tracer.spans())
+    
+    def test_tracing_disabled(self, tmp_path):
+        """Test no callbacks are attached when tracing is off."""
+        manager = LLMManager(Settings(cache_dir=tmp_path, tracing_enabled=False))
+        config = manager.run_config(FakeListChatModel(responses=["x"]), "Agent", "step")
+        
+        assert manager.tracer is None
+        assert "callbacks" not in config
+        assert config["metadata"]["step"] == "step"
+
+
+class TestTraceExport:
+    """Test trace persistence and export formats."""
+    
+    def test_jsonl_round_trip_skips_partial_lines(self, tmp_path):
+        """Test spans are read back and a torn final line is ignored."""
+        path = tmp_path / "traces.jsonl"
+        tracer = Tracer(path, max_file_bytes=1024 * 1024)
+        tracer.record(_span(step="a"))
+        tracer.record(_span(step="b", ttft=0.2, completion_tokens=10))
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"agent": "Agent", "st')
+        
+        assert load_spans(path) == tracer.spans()
+        assert [s.step for s in load_spans(path, limit=2)] == ["b"]
+    
+    def test_rotation(self, tmp_path):
+        """Test the trace file is rotated once it exceeds its size limit."""
+        path = tmp_path / "traces.jsonl"
+        tracer = Tracer(path, max_file_bytes=200)
+        for i in range(5):
+            tracer.record(_span(step=f"s{i}"))
+        
+        assert (tmp_path / "traces.jsonl.1").exists()
+        assert path.stat().st_size <= 400
+    
+    def test_summarize(self):
+        """Test per-step aggregation."""
+        spans = [
+            _span(duration=1.0, ttft=0.1, tokens_per_second=50.0, cache_hit=False),
+            _span(duration=3.0, ttft=0.3, tokens_per_second=30.0, cache_hit=False),
+            _span(duration=0.0, cache_hit=True),
+            _span(duration=0.5, error="boom", fallback=True),
+        ]
+        [row] = summarize(spans)
+        
+        assert row["calls"] == 4
+        assert row["errors"] == 1
+        assert row["fallbacks"] == 1
+        assert row["p95_seconds"] == 3.0
+        assert row["mean_ttft"] == pytest.approx(0.2)
+        assert row["tokens_per_second"] == pytest.approx(40.0)
+        assert row["cache_hit_rate"] == pytest.approx(1 / 3)
+    
+    def test_prometheus_format(self):
+        """Test the exposition text for counters and summaries."""
+        text = render_prometheus([
+            _span(model='we"ird', ttft=0.1, prompt_tokens=5, completion_tokens=7, cache_hit=False),
+            _span(model='we"ird', cache_hit=True),
+        ])
+        
+        assert "# TYPE job_assistant_llm_requests gauge" in text
+        assert (
+            'job_assistant_llm_requests{agent="Agent",step="step",model="we\\"ird",'
+            'cache="hit",fallback="false",status="ok"} 1'
+        ) in text
+        assert 'job_assistant_llm_duration_seconds_count{agent="Agent",step="step",model="we\\"ird"} 1' in text
+        assert 'job_assistant_llm_tokens{model="we\\"ird",kind="completion"} 7' in text
+    
+    def test_metrics_endpoint(self, tmp_path):
+        """Test the metrics server renders the trace file on each scrape."""
+        path = tmp_path / "traces.jsonl"
+        server = serve_metrics(path, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}"
+            assert "job_assistant_llm_requests{" not in httpx.get(f"{url}/metrics").text
+            
+            path.write_text(json.dumps(vars(_span())) + "\n", encoding="utf-8")
+            response = httpx.get(f"{url}/metrics")
+            
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/plain")
+            assert "job_assistant_llm_requests{" in response.text
+            assert httpx.get(f"{url}/other").status_code == 404
+        finally:
+            server.shutdown()
+            server.server_close()